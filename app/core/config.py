@@ -1,3 +1,5 @@
+from typing import List, Optional
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import computed_field
 
@@ -8,6 +10,26 @@ class ConfigSettings(BaseSettings):
     postgres_user: str
     postgres_password: str
 
+    # Connection pool, see app/db/pool.py
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 30.0
+    db_pool_recycle: int = 1800
+
+    # Session settings sent with every new connection; 0 / unset keeps the server default
+    db_statement_timeout_ms: int = 0
+    db_application_name: str = "hd-project"
+    db_work_mem: Optional[str] = None
+
+    # SQL instrumentation, see app/db/instrumentation.py
+    db_slow_query_ms: float = 500.0
+    db_slow_query_explain: bool = False
+    db_slow_query_log_size: int = 200
+
+    # Read replicas, see app/db/routing.py: comma-separated SQLAlchemy URLs
+    db_replica_urls: str = ""
+    db_replica_sticky_seconds: float = 5.0
+
     # Point to your .env file relative to this script
     model_config = SettingsConfigDict(env_file=".env", extra="ignore")
 
@@ -16,4 +38,9 @@ class ConfigSettings(BaseSettings):
     def db_url(self) -> str:
         return f"postgresql://{self.postgres_user}:{self.postgres_password}@{self.postgres_host}:{self.postgres_port}/{self.postgres_db}"
 
+    @computed_field
+    @property
+    def replica_urls(self) -> List[str]:
+        return [url.strip() for url in self.db_replica_urls.split(",") if url.strip()]
+
 settings: ConfigSettings = ConfigSettings()
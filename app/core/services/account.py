@@ -1,14 +1,36 @@
-from typing import List, Optional
+from typing import Final, List, Optional
 
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import select, func
+from sqlalchemy.orm import contains_eager, joinedload
+from sqlalchemy import Select, bindparam, select, func, or_
 
-from app.db.models import Account
-from app.db.base import get_db
+from app.db.models import Account, Customer
+from app.db.base import ScopedSession, SessionLike
+from app.db.keyset import PAGE_SIZE, Page, keyset_page
+from app.core.services.customer import contains_pattern
+
+# Hot lookups are built once with bind parameters: each call then reuses the
+# statement and its memoized cache key instead of rebuilding the select() and
+# its loader options, which costs more Python time than the query itself.
+ACCOUNT_BY_ID: Final[Select] = (
+    select(Account)
+    .options(
+        joinedload(Account.customer),
+        joinedload(Account.branch)
+    )
+    .where(Account.id == bindparam("idx"))
+)
+ACCOUNT_BY_NUMBER: Final[Select] = (
+    select(Account)
+    .options(
+        joinedload(Account.customer),
+        joinedload(Account.branch)
+    )
+    .where(Account.account_number == bindparam("account_number"))
+)
 
 class AccountService:    
-    def __init__(self, db: Session) -> None:
-        self.db: Session = db
+    def __init__(self, db: SessionLike) -> None:
+        self.db: SessionLike = db
     
     def get_all(self, pagination: int = 25, offset: int = 0) -> List[Account]:
         stmt = (
@@ -22,29 +44,24 @@ class AccountService:
         )
         result = self.db.execute(stmt)
         return list(result.scalars().all())
-    
-    def get_acc_by_id(self, idx: int) -> Optional[Account]:
+
+    def get_all_page(self, after: Optional[str] = None, page_size: int = PAGE_SIZE) -> Page:
+        """Accounts in id order, seeking past ``after`` instead of skipping an offset."""
         stmt = (
             select(Account)
             .options(
                 joinedload(Account.customer),
                 joinedload(Account.branch)
             )
-            .where(Account.id == idx)
         )
-        result = self.db.execute(stmt)
+        return keyset_page(self.db, stmt, "accounts", (Account.id,), after, page_size, descending=False)
+    
+    def get_acc_by_id(self, idx: int) -> Optional[Account]:
+        result = self.db.execute(ACCOUNT_BY_ID, {"idx": idx})
         return result.scalar_one_or_none()
     
     def get_acc_by_number(self, account_number: str) -> Optional[Account]:
-        stmt = (
-            select(Account)
-            .options(
-                joinedload(Account.customer),
-                joinedload(Account.branch)
-            )
-            .where(Account.account_number == account_number)
-        )
-        result = self.db.execute(stmt)
+        result = self.db.execute(ACCOUNT_BY_NUMBER, {"account_number": account_number})
         return result.scalar_one_or_none()
     
     def get_accounts_by_customer(self, customer_id: int) -> List[Account]:
@@ -56,6 +73,41 @@ class AccountService:
         result = self.db.execute(stmt)
         return list(result.scalars().all())
     
+    def search_accounts(
+        self, 
+        query: str, 
+        after: Optional[str] = None, 
+        page_size: int = PAGE_SIZE
+    ) -> Page:
+        """
+        Accounts of the customers whose name or email contains ``query``, in
+        id order, with customer and branch loaded. One join: the pg_trgm GIN
+        indexes find the customers, ``ix_dim_accounts_customer_id`` their
+        accounts.
+        """
+        term: str = query.strip()
+        if not term:
+            return Page([], None)
+        search_pattern: str = contains_pattern(term)
+        stmt = (
+            select(Account)
+            .join(Account.customer)
+            .options(
+                contains_eager(Account.customer),
+                joinedload(Account.branch)
+            )
+            .where(
+                or_(
+                    Customer.full_name.ilike(search_pattern, escape="\\"),
+                    Customer.email.ilike(search_pattern, escape="\\")
+                )
+            )
+        )
+        return keyset_page(
+            self.db, stmt, f"accounts/search/{term.lower()}", 
+            (Account.id,), after, page_size, descending=False
+        )
+    
     def get_accounts_by_branch(self, branch_id: int) -> List[Account]:
         stmt = (
             select(Account)
@@ -78,6 +130,17 @@ class AccountService:
         )
         result = self.db.execute(stmt)
         return list(result.scalars().all())
+
+    def get_active_accounts_page(self, after: Optional[str] = None, page_size: int = PAGE_SIZE) -> Page:
+        stmt = (
+            select(Account)
+            .options(
+                joinedload(Account.customer),
+                joinedload(Account.branch)
+            )
+            .where(Account.is_active == True)
+        )
+        return keyset_page(self.db, stmt, "accounts/active", (Account.id,), after, page_size, descending=False)
     
     def get_accounts_by_type(
         self, 
@@ -137,7 +200,7 @@ class AccountService:
         return result.scalar() or 0
 
 
-def get_account_service(db: Optional[Session] = None) -> AccountService:
+def get_account_service(db: Optional[SessionLike] = None) -> AccountService:
     if db is None:
-        db = next(get_db())
+        db = ScopedSession
     return AccountService(db)
\ No newline at end of file
@@ -1,14 +1,14 @@
 from typing import List, Optional, Dict, Any
 
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import joinedload
 from sqlalchemy import select, func
 
 from app.db.models import Branch, Account
-from app.db.base import get_db
+from app.db.base import ScopedSession, SessionLike
 
 class BranchService:    
-    def __init__(self, db: Session) -> None:
-        self.db: Session = db
+    def __init__(self, db: SessionLike) -> None:
+        self.db: SessionLike = db
     
     def get_all(self, pagination: int = 25, offset: int = 0) -> List[Branch]:
         stmt = (
@@ -76,7 +76,7 @@ class BranchService:
         return [r[0] for r in result.all() if r[0] is not None]
 
 
-def get_branch_service(db: Optional[Session] = None) -> BranchService:
+def get_branch_service(db: Optional[SessionLike] = None) -> BranchService:
     if db is None:
-        db = next(get_db())
+        db = ScopedSession
     return BranchService(db)
\ No newline at end of file
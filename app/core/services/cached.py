@@ -0,0 +1,227 @@
+"""
+Read-through cache for service queries.
+
+Tabs keep asking for the same small answers (regions, segments, counts,
+category breakdowns of a range that has not changed), each a round trip
+or an aggregate over a large table. ``CachedService`` wraps a service and
+serves the methods listed in ``CACHE_POLICIES`` from a ``TTLCache`` per
+method: entries expire after the method's TTL, the least recently used
+entry is evicted once ``maxsize`` is reached, and the key is every
+argument of the call.
+
+Each policy names the tables its method reads. The write methods in
+``WRITE_TABLES`` clear every cache that reads a table they touch once they
+return. With read replicas, the loads that follow may still be served
+from a replica that has not replayed the write yet; reads go to the
+primary for ``DB_REPLICA_STICKY_SECONDS`` after a write, and whatever is
+loaded in that window is returned but not stored, so no cache entry can
+outlive the window with a stale value. Writes made elsewhere (another
+process, a seed run) are only seen when the TTL runs out.
+
+Cached results are shared by every caller, so they must not be mutated,
+and they should come from a ``ReadOnlyService``: objects loaded through a
+long-lived session would otherwise be handed to other threads.
+"""
+
+import threading
+from collections import Counter
+from typing import Any, Callable, Dict, Final, FrozenSet, Hashable, List, NamedTuple, Optional
+
+from cachetools import TTLCache
+from cachetools.keys import hashkey
+
+from app.core.config import settings
+from app.db.base import replicas
+from app.db.models import Account, Branch, CategoryDaily, Customer, DailyBalance, Transaction
+from app.db.routing import ReplicaSet
+
+
+class CachePolicy(NamedTuple):
+    ttl: float
+    maxsize: int
+    tables: FrozenSet[str]
+
+
+class CacheStats(NamedTuple):
+    method: str
+    hits: int
+    misses: int
+    invalidations: int
+    size: int
+    maxsize: int
+    ttl: float
+
+    @property
+    def hit_rate(self) -> float:
+        lookups: int = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+def _policy(ttl: float, maxsize: int, *models: Any) -> CachePolicy:
+    return CachePolicy(ttl, maxsize, frozenset(model.__tablename__ for model in models))
+
+
+# Dimension lists change rarely; counts and aggregates get shorter TTLs since
+# writes from outside the application only show up when they expire.
+CACHE_POLICIES: Final[Dict[str, CachePolicy]] = {
+    "BranchService.get_all_regions": _policy(600, 1, Branch),
+    "BranchService.count_all": _policy(600, 1, Branch),
+    "BranchService.count_by_region": _policy(600, 32, Branch),
+    "BranchService.get_branches_by_account_count": _policy(120, 16, Branch, Account),
+    "CustomerService.get_all_segments": _policy(600, 1, Customer),
+    "CustomerService.count_all": _policy(60, 1, Customer),
+    "CustomerService.count_by_segment": _policy(120, 16, Customer),
+    "CustomerService.get_average_credit_score": _policy(120, 1, Customer),
+    "AccountService.count_all": _policy(60, 1, Account),
+    "AccountService.count_active": _policy(60, 1, Account),
+    "TransactionService.count_all": _policy(60, 1, Transaction),
+    "TransactionService.get_category_breakdown": _policy(300, 128, Transaction, CategoryDaily),
+    "DailyBalanceService.count_all": _policy(60, 1, DailyBalance),
+}
+
+# Tables each write method changes. fact_category_daily is kept up to date by a
+# trigger on fact_transactions; deleting a customer nulls its accounts' customer_id.
+WRITE_TABLES: Final[Dict[str, FrozenSet[str]]] = {
+    "TransactionService.create_transaction": frozenset({Transaction.__tablename__, CategoryDaily.__tablename__}),
+    "AccountService.create_account": frozenset({Account.__tablename__}),
+    "AccountService.update_account_status": frozenset({Account.__tablename__}),
+    "CustomerService.create_customer": frozenset({Customer.__tablename__}),
+    "CustomerService.delete_customer": frozenset({Customer.__tablename__, Account.__tablename__}),
+}
+
+
+class ServiceCache:
+    """One ``TTLCache`` per cached method, shared by every ``CachedService``."""
+
+    def __init__(
+        self,
+        policies: Dict[str, CachePolicy] = CACHE_POLICIES,
+        replicas: Optional[ReplicaSet] = None,
+        sticky_seconds: float = 0.0
+    ) -> None:
+        self.policies: Dict[str, CachePolicy] = policies
+        self.replicas: Optional[ReplicaSet] = replicas
+        self.sticky_seconds: float = sticky_seconds
+        self._caches: Dict[str, TTLCache] = {
+            method: TTLCache(maxsize=policy.maxsize, ttl=policy.ttl) for method, policy in policies.items()
+        }
+        self._lock: threading.Lock = threading.Lock()
+        self._hits: Counter = Counter()
+        self._misses: Counter = Counter()
+        self._invalidations: Counter = Counter()
+        # Bumped on every invalidation, so a load that raced with a write is not stored.
+        self._generation: Counter = Counter()
+
+    def get(self, method: str, key: Hashable, load: Callable[[], Any]) -> Any:
+        cache: TTLCache = self._caches[method]
+        with self._lock:
+            try:
+                value: Any = cache[key]
+            except KeyError:
+                self._misses[method] += 1
+                generation: int = self._generation[method]
+            else:
+                self._hits[method] += 1
+                return value
+        # Loaded outside the lock: concurrent misses for one key may both query.
+        value = load()
+        if self._replicas_may_lag():
+            return value
+        with self._lock:
+            if self._generation[method] == generation:
+                cache[key] = value
+        return value
+
+    def _replicas_may_lag(self) -> bool:
+        """Whether a replica may not have replayed a write of this process yet."""
+        return bool(self.replicas) and self.replicas.wrote_within(self.sticky_seconds)
+
+    def invalidate(self, tables: FrozenSet[str]) -> None:
+        with self._lock:
+            for method, policy in self.policies.items():
+                if policy.tables & tables:
+                    self._caches[method].clear()
+                    self._generation[method] += 1
+                    self._invalidations[method] += 1
+
+    def clear(self) -> None:
+        self.invalidate(frozenset().union(*(policy.tables for policy in self.policies.values())))
+
+    def stats(self) -> List[CacheStats]:
+        with self._lock:
+            return [
+                CacheStats(
+                    method=method,
+                    hits=self._hits[method],
+                    misses=self._misses[method],
+                    invalidations=self._invalidations[method],
+                    size=len(self._caches[method]),
+                    maxsize=policy.maxsize,
+                    ttl=policy.ttl
+                )
+                for method, policy in self.policies.items()
+            ]
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._hits.clear()
+            self._misses.clear()
+            self._invalidations.clear()
+
+
+service_cache: ServiceCache = ServiceCache(
+    replicas=replicas,
+    sticky_seconds=settings.db_replica_sticky_seconds
+)
+
+
+class CachedService:
+    """
+    Wraps a service instance or a ``ReadOnlyService``. Methods with a cache
+    policy are served through ``cache`` when ``read_through`` is set, write
+    methods invalidate it after they return, and anything else is passed
+    through. Leave ``read_through`` off for services bound to a long-lived
+    session, so that their objects are not shared.
+    """
+
+    def __init__(
+        self,
+        service: Any,
+        cache: ServiceCache = service_cache,
+        read_through: bool = True,
+        name: Optional[str] = None
+    ) -> None:
+        self.service: Any = service
+        self.cache: ServiceCache = cache
+        self.read_through: bool = read_through
+        self.name: str = name or getattr(service, "service_cls", type(service)).__name__
+
+    def __getattr__(self, attr: str) -> Any:
+        target: Any = getattr(self.service, attr)
+        method: str = f"{self.name}.{attr}"
+
+        if method in WRITE_TABLES:
+            tables: FrozenSet[str] = WRITE_TABLES[method]
+
+            def write(*args: Any, **kw: Any) -> Any:
+                try:
+                    return target(*args, **kw)
+                finally:
+                    # Also on failure: the write may have committed before raising.
+                    self.cache.invalidate(tables)
+
+            return write
+
+        if self.read_through and method in self.cache.policies:
+
+            def read(*args: Any, **kw: Any) -> Any:
+                try:
+                    key: Hashable = hashkey(*args, **kw)
+                    hash(key)
+                except TypeError:
+                    return target(*args, **kw)
+                return self.cache.get(method, key, lambda: target(*args, **kw))
+
+            return read
+
+        return target
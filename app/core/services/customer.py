@@ -1,15 +1,23 @@
-from typing import List, Optional
+from typing import Final, Iterator, List, Optional
 
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import select, func, or_
+from sqlalchemy.orm import joinedload
+from sqlalchemy import Float, Select, select, func, or_, union
 
 from app.db.models import Customer
-from app.db.base import get_db
+from app.db.base import ScopedSession, SessionLike
+from app.db.streaming import STREAM_CHUNK, stream
+
+SEARCH_LIMIT: Final[int] = 20
+
+
+def contains_pattern(term: str) -> str:
+    """An ILIKE pattern, escaped with ``\\``, matching values that contain ``term``."""
+    return "%" + term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
 
 
 class CustomerService:
-    def __init__(self, db: Session) -> None:
-        self.db: Session = db
+    def __init__(self, db: SessionLike) -> None:
+        self.db: SessionLike = db
     
     def get_all(self, pagination: int = 25, offset: int = 0) -> List[Customer]:
         stmt = (
@@ -25,6 +33,10 @@ class CustomerService:
         result = self.db.execute(stmt)
         return list(result.scalars().all())
 
+    def iter_all_customers(self, chunk_size: int = STREAM_CHUNK) -> Iterator[Customer]:
+        """Like ``get_all_customers``, in id order, but streamed from a server-side cursor."""
+        return stream(self.db, select(Customer).order_by(Customer.id), chunk_size)
+
     def get_by_id(self, idx: int) -> Optional[Customer]:
         stmt = select(Customer).where(Customer.id == idx)
         result = self.db.execute(stmt)
@@ -39,35 +51,73 @@ class CustomerService:
         result = self.db.execute(stmt)
         return result.scalar_one_or_none()
     
-    def search_customers(self, query: str) -> List[Customer]:
-        search_pattern: str = f"%{query}%"
+    def search_customers(self, query: str, limit: int = SEARCH_LIMIT) -> List[Customer]:
+        """
+        Customers whose name or email contains ``query``, best trigram match
+        first. The best ``limit`` matches by name and the best ``limit`` by
+        email together hold the best ``limit`` overall, so each is read off
+        its GiST trigram index in word-similarity order instead of ranking
+        every match; rare terms are filtered through the GIN indexes.
+        """
+        term: str = query.strip()
+        if not term:
+            return []
+        search_pattern: str = contains_pattern(term)
+        matches = or_(
+            Customer.full_name.ilike(search_pattern, escape="\\"),
+            Customer.email.ilike(search_pattern, escape="\\")
+        )
+        candidates = union(*(
+            select(Customer.id)
+            .where(matches)
+            # column <->> term is 1 - word_similarity(term, column), the order GiST serves.
+            .order_by(column.op("<->>", return_type=Float)(term))
+            .limit(limit)
+            for column in (Customer.full_name, Customer.email)
+        ))
+        rank = func.greatest(
+            func.word_similarity(term, Customer.full_name),
+            func.word_similarity(term, Customer.email)
+        )
         stmt = (
             select(Customer)
-            .where(
-                or_(
-                    Customer.full_name.ilike(search_pattern),
-                    Customer.email.ilike(search_pattern)
-                )
-            )
+            .where(Customer.id.in_(candidates))
+            .order_by(rank.desc(), Customer.id)
+            .limit(limit)
         )
         result = self.db.execute(stmt)
         return list(result.scalars().all())
     
+    def _segment_stmt(self, segment: str) -> Select:
+        return select(Customer).where(Customer.customer_segment == segment)
+
     def get_by_segment(self, segment: str) -> List[Customer]:
-        stmt = select(Customer).where(Customer.customer_segment == segment)
-        result = self.db.execute(stmt)
+        result = self.db.execute(self._segment_stmt(segment))
         return list(result.scalars().all())
+
+    def iter_by_segment(self, segment: str, chunk_size: int = STREAM_CHUNK) -> Iterator[Customer]:
+        return stream(self.db, self._segment_stmt(segment), chunk_size)
     
-    def get_by_credit_score_range(self, min_score: int, max_score: int) -> List[Customer]:
-        stmt = (
+    def _credit_score_stmt(self, min_score: int, max_score: int) -> Select:
+        return (
             select(Customer)
             .where(
                 Customer.credit_score >= min_score,
                 Customer.credit_score <= max_score
             )
         )
-        result = self.db.execute(stmt)
+
+    def get_by_credit_score_range(self, min_score: int, max_score: int) -> List[Customer]:
+        result = self.db.execute(self._credit_score_stmt(min_score, max_score))
         return list(result.scalars().all())
+
+    def iter_by_credit_score_range(
+        self, 
+        min_score: int, 
+        max_score: int, 
+        chunk_size: int = STREAM_CHUNK
+    ) -> Iterator[Customer]:
+        return stream(self.db, self._credit_score_stmt(min_score, max_score), chunk_size)
     
     def create_customer(self, full_name: str, email: str, credit_score: int) -> Customer:
         new_customer: Customer = Customer(
@@ -114,7 +164,7 @@ class CustomerService:
         return float(avg) if avg else 0.0
 
 
-def get_customer_service(db: Optional[Session] = None) -> CustomerService:
+def get_customer_service(db: Optional[SessionLike] = None) -> CustomerService:
     if db is None:
-        db = next(get_db())
+        db = ScopedSession
     return CustomerService(db)
\ No newline at end of file
@@ -1,16 +1,25 @@
-from typing import List, Optional
+from typing import Final, Iterator, List, Optional
 from datetime import date, timedelta
 
-from sqlalchemy.orm import Session
-from sqlalchemy import select, func, and_
+from sqlalchemy import Select, bindparam, select, func, and_
 
-from app.db.models import DailyBalance
-from app.db.base import get_db
+from app.db.models import DailyBalance, Money
+from app.db.base import ScopedSession, SessionLike
+from app.db.keyset import PAGE_SIZE, Page, keyset_page
+from app.db.streaming import STREAM_CHUNK, stream
+
+# get_latest_balance binds "account_id".
+LATEST_BALANCE: Final[Select] = (
+    select(DailyBalance)
+    .where(DailyBalance.account_id == bindparam("account_id"))
+    .order_by(DailyBalance.balance_date.desc())
+    .limit(1)
+)
 
 
 class DailyBalanceService:    
-    def __init__(self, db: Session) -> None:
-        self.db: Session = db
+    def __init__(self, db: SessionLike) -> None:
+        self.db: SessionLike = db
     
     def get_by_account(
         self, 
@@ -27,6 +36,18 @@ class DailyBalanceService:
         )
         result = self.db.execute(stmt)
         return list(result.scalars().all())
+
+    def get_by_account_page(
+        self, 
+        account_id: int, 
+        after: Optional[str] = None, 
+        page_size: int = PAGE_SIZE
+    ) -> Page:
+        stmt = select(DailyBalance).where(DailyBalance.account_id == account_id)
+        return keyset_page(
+            self.db, stmt, f"balances/account/{account_id}", 
+            (DailyBalance.balance_date, DailyBalance.id), after, page_size
+        )
     
     def get_by_date_range(
         self, 
@@ -49,13 +70,7 @@ class DailyBalanceService:
         return list(result.scalars().all())
     
     def get_latest_balance(self, account_id: int) -> Optional[DailyBalance]:
-        stmt = (
-            select(DailyBalance)
-            .where(DailyBalance.account_id == account_id)
-            .order_by(DailyBalance.balance_date.desc())
-            .limit(1)
-        )
-        result = self.db.execute(stmt)
+        result = self.db.execute(LATEST_BALANCE, {"account_id": account_id})
         return result.scalar_one_or_none()
     
     def get_average_balance(
@@ -65,7 +80,7 @@ class DailyBalanceService:
         end_date: date
     ) -> float:
         stmt = (
-            select(func.avg(DailyBalance.ending_balance))
+            select(func.avg(DailyBalance.ending_balance, type_=Money()))
             .where(
                 and_(
                     DailyBalance.account_id == account_id,
@@ -123,13 +138,18 @@ class DailyBalanceService:
         start_date: date = end_date - timedelta(days=days)
         return self.get_by_date_range(account_id, start_date, end_date)
     
-    def get_balances_by_date(self, balance_date: date) -> List[DailyBalance]:
-        stmt = (
+    def _balances_by_date_stmt(self, balance_date: date) -> Select:
+        return (
             select(DailyBalance)
             .where(DailyBalance.balance_date == balance_date)
         )
-        result = self.db.execute(stmt)
+
+    def get_balances_by_date(self, balance_date: date) -> List[DailyBalance]:
+        result = self.db.execute(self._balances_by_date_stmt(balance_date))
         return list(result.scalars().all())
+
+    def iter_balances_by_date(self, balance_date: date, chunk_size: int = STREAM_CHUNK) -> Iterator[DailyBalance]:
+        return stream(self.db, self._balances_by_date_stmt(balance_date), chunk_size)
     
     def count_all(self) -> int:
         stmt = select(func.count(DailyBalance.id))
@@ -137,7 +157,7 @@ class DailyBalanceService:
         return result.scalar() or 0
 
 
-def get_daily_balance_service(db: Optional[Session] = None) -> DailyBalanceService:
+def get_daily_balance_service(db: Optional[SessionLike] = None) -> DailyBalanceService:
     if db is None:
-        db = next(get_db())
+        db = ScopedSession
     return DailyBalanceService(db)
\ No newline at end of file
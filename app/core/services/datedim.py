@@ -1,15 +1,14 @@
 from typing import List, Optional
 from datetime import date, timedelta
 
-from sqlalchemy.orm import Session
 from sqlalchemy import select, and_
 
 from app.db.models import DateDim
-from app.db.base import get_db
+from app.db.base import ScopedSession, SessionLike
 
 class DateDimService:    
-    def __init__(self, db: Session) -> None:
-        self.db: Session = db
+    def __init__(self, db: SessionLike) -> None:
+        self.db: SessionLike = db
     
     def get_by_date(self, date_key: date) -> Optional[DateDim]:
         stmt = select(DateDim).where(DateDim.date_key == date_key)
@@ -110,7 +109,7 @@ class DateDimService:
         return date_dim.date_key if date_dim else None
 
 
-def get_date_dim_service(db: Optional[Session] = None) -> DateDimService:
+def get_date_dim_service(db: Optional[SessionLike] = None) -> DateDimService:
     if db is None:
-        db = next(get_db())
+        db = ScopedSession
     return DateDimService(db)
\ No newline at end of file
@@ -0,0 +1,53 @@
+from collections.abc import Iterator
+from typing import Any, Callable, Generic, Type, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.db.base import SessionLocal
+
+S = TypeVar("S")
+
+
+class ReadOnlyService(Generic[S]):
+    """
+    Runs every method of a service class in a session of its own that is
+    closed as soon as the call returns, so nothing it loads stays in an
+    identity map. Results come back detached: columns and eagerly loaded
+    relationships can be read, lazy loads raise ``DetachedInstanceError``.
+    Iterators returned by the streaming methods keep their session until
+    they are exhausted or closed. Flushing is refused, so writes must go
+    through the regular, session-bound services.
+    """
+
+    def __init__(self, service_cls: Type[S]) -> None:
+        self.service_cls: Type[S] = service_cls
+
+    def __getattr__(self, name: str) -> Callable[..., Any]:
+        method: Callable[..., Any] = getattr(self.service_cls, name)
+
+        def call(*args: Any, **kw: Any) -> Any:
+            db: Session = SessionLocal()
+            event.listen(db, "before_flush", _refuse_flush)
+            try:
+                result: Any = method(self.service_cls(db), *args, **kw)
+            except Exception:
+                db.close()
+                raise
+            if isinstance(result, Iterator):
+                return _closing(result, db)
+            db.close()
+            return result
+
+        return call
+
+
+def _refuse_flush(session: Session, flush_context: Any, instances: Any) -> None:
+    raise PermissionError("Read-only service session cannot write; use the regular service")
+
+
+def _closing(result: Iterator[Any], db: Session) -> Iterator[Any]:
+    try:
+        yield from result
+    finally:
+        db.close()
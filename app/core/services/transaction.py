@@ -1,21 +1,38 @@
-from typing import List, Optional, Dict, Any
-from datetime import datetime
+from typing import Final, List, Optional, Dict, Any, Tuple, Union
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
 
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import select, func, and_
+from sqlalchemy.orm import joinedload
+from sqlalchemy import Select, bindparam, select, func, and_, or_, union_all
 
-from app.db.models import Transaction
-from app.db.base import get_db
+from app.db.models import CategoryDaily, Transaction
+from app.db.keyset import PAGE_SIZE, Page, keyset_page
+from app.db.rollups import whole_days
+from app.db.base import ScopedSession, SessionLike
+
+# get_by_id binds "idx"; get_by_account binds "account_id", "pagination" and "offset".
+TRANSACTION_BY_ID: Final[Select] = (
+    select(Transaction)
+    .options(joinedload(Transaction.account))
+    .where(Transaction.id == bindparam("idx"))
+)
+TRANSACTIONS_BY_ACCOUNT: Final[Select] = (
+    select(Transaction)
+    .where(Transaction.account_id == bindparam("account_id"))
+    .order_by(Transaction.timestamp.desc())
+    .limit(bindparam("pagination"))
+    .offset(bindparam("offset"))
+)
 
 
 class TransactionService:    
-    def __init__(self, db: Session) -> None:
-        self.db: Session = db
+    def __init__(self, db: SessionLike) -> None:
+        self.db: SessionLike = db
 
     def create_transaction(
         self, 
         account_id: int, 
-        amount: float, 
+        amount: Union[Decimal, float], 
         category: str, 
         merchant_name: str
     ) -> Transaction:
@@ -41,13 +58,15 @@ class TransactionService:
         result = self.db.execute(stmt)
         return list(result.scalars().all())
     
-    def get_by_id(self, idx: int) -> Optional[Transaction]:
-        stmt = (
-            select(Transaction)
-            .options(joinedload(Transaction.account))
-            .where(Transaction.id == idx)
+    def get_all_page(self, after: Optional[str] = None, page_size: int = PAGE_SIZE) -> Page:
+        """Newest first, like ``get_all``, but seeking past ``after`` instead of skipping an offset."""
+        return keyset_page(
+            self.db, select(Transaction), "transactions", 
+            (Transaction.timestamp, Transaction.id), after, page_size
         )
-        result = self.db.execute(stmt)
+    
+    def get_by_id(self, idx: int) -> Optional[Transaction]:
+        result = self.db.execute(TRANSACTION_BY_ID, {"idx": idx})
         return result.scalar_one_or_none()
     
     def get_by_account(
@@ -56,15 +75,23 @@ class TransactionService:
         pagination: int = 25, 
         offset: int = 0
     ) -> List[Transaction]:
-        stmt = (
-            select(Transaction)
-            .where(Transaction.account_id == account_id)
-            .order_by(Transaction.timestamp.desc())
-            .limit(pagination)
-            .offset(offset)
+        result = self.db.execute(
+            TRANSACTIONS_BY_ACCOUNT, 
+            {"account_id": account_id, "pagination": pagination, "offset": offset}
         )
-        result = self.db.execute(stmt)
         return list(result.scalars().all())
+
+    def get_by_account_page(
+        self, 
+        account_id: int, 
+        after: Optional[str] = None, 
+        page_size: int = PAGE_SIZE
+    ) -> Page:
+        stmt = select(Transaction).where(Transaction.account_id == account_id)
+        return keyset_page(
+            self.db, stmt, f"transactions/account/{account_id}", 
+            (Transaction.timestamp, Transaction.id), after, page_size
+        )
     
     def get_category_breakdown(
         self, 
@@ -72,37 +99,88 @@ class TransactionService:
         start_date: Optional[datetime] = None, 
         end_date: Optional[datetime] = None
     ) -> List[Dict[str, Any]]:
-        stmt = (
-            select(
-                Transaction.category,
-                func.count(Transaction.id).label('count'),
-                func.sum(Transaction.amount).label('total'),
-                func.avg(Transaction.amount).label('average')
-            )
-            .group_by(Transaction.category)
-        )
-        
         if account_id:
-            stmt = stmt.where(Transaction.account_id == account_id)
-        
-        if start_date and end_date:
-            stmt = stmt.where(
-                and_(
-                    Transaction.timestamp >= start_date,
-                    Transaction.timestamp <= end_date
+            # A single account is served by the (account_id, timestamp) covering index.
+            stmt = (
+                select(
+                    Transaction.category,
+                    func.count(Transaction.id).label('count'),
+                    func.sum(Transaction.amount).label('total')
                 )
+                .where(Transaction.account_id == account_id)
+                .group_by(Transaction.category)
             )
-        
+            if start_date and end_date:
+                stmt = stmt.where(
+                    and_(
+                        Transaction.timestamp >= start_date,
+                        Transaction.timestamp <= end_date
+                    )
+                )
+        else:
+            stmt = self._category_breakdown_from_rollup(start_date, end_date)
+
         result = self.db.execute(stmt)
         return [
             {
                 'category': row[0],
-                'count': row[1],
+                'count': int(row[1]),
                 'total': float(row[2]) if row[2] else 0.0,
-                'average': float(row[3]) if row[3] else 0.0
+                'average': float(row[2]) / int(row[1]) if row[2] else 0.0
             }
             for row in result.all()
         ]
+
+    def _category_breakdown_from_rollup(
+        self,
+        start_date: Optional[datetime],
+        end_date: Optional[datetime]
+    ) -> Select:
+        """
+        Whole days come from fact_category_daily; only the partial days at
+        either edge of the range are aggregated from fact_transactions.
+        """
+        rollup = select(
+            CategoryDaily.category,
+            func.sum(CategoryDaily.tx_count).label('count'),
+            func.sum(CategoryDaily.total).label('total')
+        ).group_by(CategoryDaily.category)
+        if not (start_date and end_date):
+            return rollup
+
+        days: Optional[Tuple[date, date]] = whole_days(start_date, end_date)
+        raw = select(
+            Transaction.category,
+            func.count(Transaction.id).label('count'),
+            func.sum(Transaction.amount).label('total')
+        ).group_by(Transaction.category)
+        if days is None:
+            return raw.where(
+                and_(
+                    Transaction.timestamp >= start_date,
+                    Transaction.timestamp <= end_date
+                )
+            )
+
+        first_day: datetime = datetime.combine(days[0], time.min)
+        after_last_day: datetime = datetime.combine(days[1] + timedelta(days=1), time.min)
+        parts = union_all(
+            rollup.where(CategoryDaily.day.between(days[0], days[1])),
+            raw.where(
+                or_(
+                    and_(Transaction.timestamp >= start_date, Transaction.timestamp < first_day),
+                    and_(Transaction.timestamp >= after_last_day, Transaction.timestamp <= end_date)
+                )
+            )
+        ).subquery()
+        return (
+            select(
+                parts.c.category,
+                func.sum(parts.c.count).label('count'),
+                func.sum(parts.c.total).label('total')
+            )
+            .group_by(parts.c.category)
+        )
     
     def get_total_by_account(
         self, 
@@ -140,7 +218,7 @@ class TransactionService:
         return result.scalar() or 0
 
 
-def get_transaction_service(db: Optional[Session] = None) -> TransactionService:
+def get_transaction_service(db: Optional[SessionLike] = None) -> TransactionService:
     if db is None:
-        db = next(get_db())
+        db = ScopedSession
     return TransactionService(db)
\ No newline at end of file
@@ -1,19 +1,70 @@
-from sqlalchemy.orm import sessionmaker, declarative_base
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Union
+
+from sqlalchemy.orm import Session, declarative_base, scoped_session, sessionmaker
 from sqlalchemy import create_engine, Engine
-from app.core.config import settings
+from app.core.config import ConfigSettings, settings
+from app.db.instrumentation import SqlMonitor
+from app.db.pool import InstrumentedQueuePool
+from app.db.routing import ReplicaSet, RoutingSession
+
+def connect_args(config: ConfigSettings) -> Dict[str, Any]:
+    """libpq parameters that set up each new connection's session."""
+    options: List[str] = []
+    if config.db_statement_timeout_ms:
+        options.append(f"-c statement_timeout={config.db_statement_timeout_ms}")
+    if config.db_work_mem:
+        options.append(f"-c work_mem={config.db_work_mem}")
+    args: Dict[str, Any] = {"application_name": config.db_application_name}
+    if options:
+        args["options"] = " ".join(options)
+    return args
 
-engine: Engine = create_engine(
-    settings.db_url,
-    pool_pre_ping=True, 
-    echo=False
+sql_monitor: SqlMonitor = SqlMonitor(
+    settings.db_slow_query_ms,
+    explain=settings.db_slow_query_explain,
+    log_size=settings.db_slow_query_log_size
 )
 
+def make_engine(url: str) -> Engine:
+    new_engine: Engine = create_engine(
+        url,
+        poolclass=InstrumentedQueuePool,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_recycle=settings.db_pool_recycle,
+        pool_pre_ping=True, 
+        connect_args=connect_args(settings),
+        echo=False
+    )
+    sql_monitor.instrument(new_engine)
+    return new_engine
+
+engine: Engine = make_engine(settings.db_url)
+replicas: ReplicaSet = ReplicaSet([make_engine(url) for url in settings.replica_urls])
+
+def reset_engine_after_fork() -> None:
+    """Call first thing in a forked child: connections inherited from the parent must never be reused."""
+    for inherited in [engine, *replicas.engines]:
+        inherited.dispose(close=False)
+
 SessionLocal = sessionmaker(
+    class_=RoutingSession,
     autocommit=False, 
     autoflush=False, 
-    bind=engine
+    bind=engine,
+    replicas=replicas,
+    sticky_seconds=settings.db_replica_sticky_seconds
 )
 
+# One session per thread: the GUI thread keeps its own, and every worker
+# thread gets a fresh one that it releases with ScopedSession.remove().
+ScopedSession = scoped_session(SessionLocal)
+
+# What the services accept: a plain Session, or the thread-local registry.
+SessionLike = Union[Session, scoped_session]
+
 Base = declarative_base()
 
 def get_db():
@@ -22,3 +73,16 @@ def get_db():
         yield db
     finally:
         db.close()
+
+@contextmanager
+def session_scope() -> Iterator[Session]:
+    """A short-lived session for one unit of work, committed on success."""
+    db: Session = SessionLocal()
+    try:
+        yield db
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
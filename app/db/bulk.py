@@ -0,0 +1,494 @@
+"""
+Vectorized bulk seeder.
+
+Builds the banking dataset as NumPy arrays and streams it into PostgreSQL
+through psycopg2 ``COPY FROM STDIN`` in bounded chunks, so client memory
+stays flat regardless of how many rows are generated.
+
+Customers are split into shards. Each shard is seeded by its own worker
+process on its own connection, inside customer/account ID blocks that are
+allocated up front, so workers never coordinate while running. Sequences
+are fixed up, the category rollup rebuilt and the tables analyzed once
+every shard has finished.
+
+Shards commit after their dimensions and after every block of facts,
+recording a checkpoint in the same transaction, so an interrupted run can
+be resumed where it stopped instead of being rolled back as a whole.
+"""
+
+import io
+import time
+import multiprocessing
+from datetime import date, timedelta
+from typing import Any, Dict, Final, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+from numpy.typing import NDArray
+from faker import Faker
+
+from app.db.base import engine, reset_engine_after_fork
+from app.db.checkpoints import RUN_SHARD, run_key, save_checkpoint, load_checkpoints, clear_checkpoints
+from app.db.partitions import ensure_partitions
+from app.db.rollups import CATEGORY_DAILY, suspend_rollups, resume_rollups, abandon_rollups, rebuild_category_daily
+from app.db.models import AccountType, CENTS_PER_UNIT
+from app.db.profiles import SeedProfile, DEMO
+from app.db.identities import IdentityPools, branch_codes, ibans
+from app.db.distributions import (
+    DistributionParams, UNIFORM,
+    account_activity, calendar_factors, choose_skewed, draw_amounts, draw_categories
+)
+from app.db.seeders import REGIONS, SEGMENTS, CATEGORIES
+
+CHUNK_ROWS: Final[int] = 250_000
+
+TRANSACTION_COLUMNS: Final[Tuple[str, ...]] = (
+    "id", "account_id", "amount", "category", "merchant_name", "timestamp"
+)
+DAILY_BALANCE_COLUMNS: Final[Tuple[str, ...]] = (
+    "id", "account_id", "balance_date", "ending_balance"
+)
+ANALYZE_TABLES: Final[Tuple[str, ...]] = (
+    "dim_branches", "dim_customers", "dim_accounts",
+    "fact_transactions", "fact_daily_balances"
+)
+
+
+def _to_tsv(columns: Sequence[List[str]]) -> str:
+    return "\n".join(map("\t".join, zip(*columns))) + "\n"
+
+
+class ThroughputMeter:
+    def __init__(self) -> None:
+        self.rows: Dict[str, int] = {}
+        self.seconds: Dict[str, float] = {}
+        self.started: float = time.perf_counter()
+
+    def record(self, table: str, rows: int, seconds: float) -> None:
+        self.rows[table] = self.rows.get(table, 0) + rows
+        self.seconds[table] = self.seconds.get(table, 0.0) + seconds
+
+    def merge(self, other: "ThroughputMeter") -> None:
+        for table, rows in other.rows.items():
+            self.record(table, rows, other.seconds[table])
+
+    def rate(self, table: str) -> float:
+        seconds: float = self.seconds.get(table, 0.0)
+        return self.rows.get(table, 0) / seconds if seconds else 0.0
+
+    def report(self) -> None:
+        elapsed: float = time.perf_counter() - self.started
+        total: int = sum(self.rows.values())
+        for table, rows in self.rows.items():
+            print(f"   {table}: {rows:,} rows in {self.seconds[table]:.1f}s ({self.rate(table):,.0f} rows/sec)")
+        print(f"   TOTAL: {total:,} rows in {elapsed:.1f}s ({total / elapsed if elapsed else 0.0:,.0f} rows/sec)")
+
+
+def copy_columns(
+    cursor: Any,
+    table: str,
+    columns: Sequence[str],
+    values: Sequence[List[str]],
+    meter: ThroughputMeter
+) -> int:
+    rows: int = len(values[0]) if values else 0
+    if rows == 0:
+        return 0
+    started: float = time.perf_counter()
+    buffer: io.StringIO = io.StringIO(_to_tsv(values))
+    cursor.copy_expert(f"COPY {table} ({', '.join(columns)}) FROM STDIN", buffer)
+    meter.record(table, rows, time.perf_counter() - started)
+    return rows
+
+
+def next_id(cursor: Any, table: str) -> int:
+    cursor.execute(f"SELECT COALESCE(MAX(id), 0) + 1 FROM {table}")
+    return int(cursor.fetchone()[0])
+
+
+def reset_sequences(cursor: Any, tables: Sequence[str]) -> None:
+    for table in tables:
+        cursor.execute(
+            f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+            f"(SELECT COALESCE(MAX(id), 0) + 1 FROM {table}), false)"
+        )
+
+
+def generate_activity(
+    rng: np.random.Generator,
+    account_ids: NDArray[np.int64],
+    start_date: date,
+    days: int,
+    max_tx_per_day: int,
+    merchant_pool: NDArray[np.str_],
+    distribution: DistributionParams = UNIFORM,
+    activity: Optional[NDArray[np.float64]] = None
+) -> Tuple[List[List[str]], List[List[str]]]:
+    """Generate transactions and daily balances for a block of accounts."""
+    n_accounts: int = len(account_ids)
+    if distribution.is_skewed:
+        dates: NDArray[np.datetime64] = np.datetime64(start_date, 'D') + np.arange(days)
+        factors, month_end = calendar_factors(dates, distribution)
+        rates: NDArray[np.float64] = (
+            distribution.mean_tx_per_day * activity[:, None] * (factors / factors.mean())[None, :]
+        )
+        counts: NDArray[np.int64] = np.minimum(
+            rng.poisson(rates), distribution.hot_account_cap
+        ).ravel()
+    else:
+        counts = rng.integers(0, max_tx_per_day + 1, size=n_accounts * days)
+    total: int = int(counts.sum())
+
+    account_day: NDArray[np.int64] = np.repeat(np.arange(n_accounts * days), counts)
+    tx_accounts: NDArray[np.int64] = account_ids[account_day // days]
+    tx_days: NDArray[np.int64] = account_day % days
+
+    if distribution.is_skewed:
+        category_idx: NDArray[np.int64] = draw_categories(rng, month_end[tx_days])
+        amounts: NDArray[np.int64] = draw_amounts(rng, category_idx, distribution)
+    else:
+        amounts = np.round(rng.uniform(-1000.0, 1500.0, total) * CENTS_PER_UNIT).astype(np.int64)
+        category_idx = rng.integers(0, len(CATEGORIES), total)
+    categories: NDArray[np.str_] = np.array(CATEGORIES)[category_idx]
+    merchants: NDArray[np.str_] = merchant_pool[rng.integers(0, len(merchant_pool), total)]
+    timestamps: NDArray[np.datetime64] = (
+        np.datetime64(start_date, 's')
+        + tx_days.astype('timedelta64[D]')
+        + rng.integers(0, 86_400, total).astype('timedelta64[s]')
+    )
+
+    # Amounts are integer cents; float64 sums of them are exact well past any realistic total.
+    daily_net: NDArray[np.int64] = np.bincount(
+        account_day, weights=amounts, minlength=n_accounts * days
+    ).astype(np.int64).reshape(n_accounts, days)
+    opening: NDArray[np.int64] = np.round(rng.uniform(5000.0, 20000.0, n_accounts) * CENTS_PER_UNIT).astype(np.int64)
+    balances: NDArray[np.int64] = opening[:, None] + np.cumsum(daily_net, axis=1)
+    balance_dates: NDArray[np.datetime64] = np.datetime64(start_date, 'D') + np.arange(days)
+
+    transactions: List[List[str]] = [
+        tx_accounts.astype(str).tolist(),
+        amounts.astype(str).tolist(),
+        categories.tolist(),
+        merchants.tolist(),
+        np.datetime_as_string(timestamps).tolist()
+    ]
+    daily_balances: List[List[str]] = [
+        np.repeat(account_ids, days).astype(str).tolist(),
+        np.tile(np.datetime_as_string(balance_dates), n_accounts).tolist(),
+        balances.ravel().astype(str).tolist()
+    ]
+    return transactions, daily_balances
+
+
+def _chunks(values: List[List[str]], size: int) -> Iterator[List[List[str]]]:
+    rows: int = len(values[0])
+    for start in range(0, rows, size):
+        yield [column[start:start + size] for column in values]
+
+
+class ShardSpec(NamedTuple):
+    index: int
+    profile: SeedProfile
+    distribution: DistributionParams
+    customer_start: int
+    num_customers: int
+    account_start: int
+    transaction_start: int
+    balance_start: int
+    branch_ids: Tuple[int, ...]
+    start_date: date
+    chunk_rows: int
+    seed: int
+    pools: IdentityPools
+    run_key: str
+    checkpoint: Optional[Dict[str, Any]] = None
+
+
+def _with_ids(values: List[List[str]], start: int) -> List[List[str]]:
+    return [np.arange(start, start + len(values[0])).astype(str).tolist(), *values]
+
+
+def _progress(
+    stage: str,
+    offset: int,
+    block: int,
+    next_transaction: int,
+    next_balance: int,
+    rng: np.random.Generator
+) -> Dict[str, Any]:
+    return {
+        "stage": stage,
+        "offset": offset,
+        "block": block,
+        "next_transaction": next_transaction,
+        "next_balance": next_balance,
+        "rng": rng.bit_generator.state
+    }
+
+
+def _seed_shard(spec: ShardSpec) -> ThroughputMeter:
+    """
+    Seed one shard of customers on its own connection inside its own ID blocks.
+    A shard with a checkpoint regenerates its dimension arrays without loading
+    them again, restores the RNG and continues with the next block of facts.
+    """
+    checkpoint: Optional[Dict[str, Any]] = spec.checkpoint
+    meter: ThroughputMeter = ThroughputMeter()
+    if checkpoint is not None and checkpoint["stage"] == "done":
+        print(f"   shard {spec.index}: already complete, skipped")
+        return meter
+
+    profile: SeedProfile = spec.profile
+    distribution: DistributionParams = spec.distribution
+    pools: IdentityPools = spec.pools
+    rng: np.random.Generator = np.random.default_rng(spec.seed)
+    resumed: bool = checkpoint is not None
+    created_at: str = spec.start_date.isoformat()
+    branch_ids: NDArray[np.int64] = np.array(spec.branch_ids)
+
+    conn = engine.raw_connection()
+    try:
+        suspend_rollups(conn)
+        cursor = conn.cursor()
+
+        customer_ids: NDArray[np.int64] = np.arange(
+            spec.customer_start, spec.customer_start + spec.num_customers
+        )
+        names, emails = pools.customers(rng, customer_ids)
+        scores: NDArray[np.int64] = rng.integers(300, 851, spec.num_customers)
+        segment_idx: NDArray[np.int64] = rng.integers(0, len(SEGMENTS), spec.num_customers)
+        for chunk in [] if resumed else _chunks([
+            customer_ids.astype(str).tolist(),
+            names.tolist(),
+            emails.tolist(),
+            scores.astype(str).tolist(),
+            np.array(SEGMENTS)[segment_idx].tolist(),
+            [created_at] * spec.num_customers
+        ], spec.chunk_rows):
+            copy_columns(cursor, "dim_customers", (
+                "id", "full_name", "email", "credit_score", "customer_segment", "created_at"
+            ), chunk, meter)
+
+        accounts_per_customer: NDArray[np.int64] = rng.integers(
+            profile.min_accounts_per_customer,
+            profile.max_accounts_per_customer + 1,
+            spec.num_customers
+        )
+        owners: NDArray[np.int64] = np.repeat(customer_ids, accounts_per_customer)
+        num_accounts: int = len(owners)
+        account_ids: NDArray[np.int64] = np.arange(spec.account_start, spec.account_start + num_accounts)
+        account_types: List[str] = [t.value for t in AccountType]
+        branch_idx: NDArray[np.int64] = choose_skewed(rng, len(branch_ids), num_accounts, distribution.branch_zipf)
+        type_idx: NDArray[np.int64] = rng.integers(0, len(account_types), num_accounts)
+        for chunk in [] if resumed else _chunks([
+            account_ids.astype(str).tolist(),
+            owners.astype(str).tolist(),
+            branch_ids[branch_idx].astype(str).tolist(),
+            ibans(account_ids).tolist(),
+            np.array(account_types)[type_idx].tolist(),
+            ["t"] * num_accounts
+        ], spec.chunk_rows):
+            copy_columns(cursor, "dim_accounts", (
+                "id", "customer_id", "branch_id", "account_number", "account_type", "is_active"
+            ), chunk, meter)
+
+        activity: Optional[NDArray[np.float64]] = None
+        if distribution.is_skewed:
+            is_corporate: NDArray[np.bool_] = np.repeat(
+                segment_idx == SEGMENTS.index("Corporate"), accounts_per_customer
+            )
+            activity = account_activity(rng, is_corporate, distribution)
+        expected_per_account: int = max(1, int(profile.days_of_history * _mean_tx_per_day(profile, distribution)))
+        block: int = max(1, spec.chunk_rows // expected_per_account)
+        next_transaction: int = spec.transaction_start
+        next_balance: int = spec.balance_start
+        first_offset: int = 0
+
+        if resumed:
+            # Block boundaries must match the interrupted run for the RNG stream to line up.
+            block = checkpoint["block"]
+            first_offset = checkpoint["offset"]
+            next_transaction = checkpoint["next_transaction"]
+            next_balance = checkpoint["next_balance"]
+            rng.bit_generator.state = checkpoint["rng"]
+        else:
+            save_checkpoint(cursor, spec.run_key, spec.index, _progress(
+                "facts", 0, block, next_transaction, next_balance, rng
+            ))
+            conn.commit()
+
+        for offset in range(first_offset, num_accounts, block):
+            transactions, balances = generate_activity(
+                rng, account_ids[offset:offset + block], spec.start_date,
+                profile.days_of_history, profile.max_tx_per_day, pools.companies,
+                distribution, activity[offset:offset + block] if activity is not None else None
+            )
+            transactions = _with_ids(transactions, next_transaction)
+            balances = _with_ids(balances, next_balance)
+            next_transaction += len(transactions[0])
+            next_balance += len(balances[0])
+            for chunk in _chunks(transactions, spec.chunk_rows):
+                copy_columns(cursor, "fact_transactions", TRANSACTION_COLUMNS, chunk, meter)
+            for chunk in _chunks(balances, spec.chunk_rows):
+                copy_columns(cursor, "fact_daily_balances", DAILY_BALANCE_COLUMNS, chunk, meter)
+            save_checkpoint(cursor, spec.run_key, spec.index, _progress(
+                "facts", offset + block, block, next_transaction, next_balance, rng
+            ))
+            conn.commit()
+
+        save_checkpoint(cursor, spec.run_key, spec.index, _progress(
+            "done", num_accounts, block, next_transaction, next_balance, rng
+        ))
+        conn.commit()
+        resume_rollups(conn)
+    except Exception:
+        abandon_rollups(conn)
+        raise
+    finally:
+        conn.close()
+
+    print(f"   shard {spec.index}: {spec.num_customers:,} customers, {num_accounts:,} accounts done")
+    return meter
+
+
+def _mean_tx_per_day(profile: SeedProfile, distribution: DistributionParams) -> float:
+    return distribution.mean_tx_per_day if distribution.is_skewed else profile.max_tx_per_day / 2
+
+
+def _max_tx_per_day(profile: SeedProfile, distribution: DistributionParams) -> int:
+    return distribution.hot_account_cap if distribution.is_skewed else profile.max_tx_per_day
+
+
+def _init_worker() -> None:
+    reset_engine_after_fork()
+
+
+def seed_banking_system_copy(
+    profile: SeedProfile = DEMO,
+    distribution: DistributionParams = UNIFORM,
+    seed: int = 0,
+    end_date: Optional[date] = None,
+    chunk_rows: int = CHUNK_ROWS,
+    workers: int = 1,
+    resume: bool = False
+) -> ThroughputMeter:
+    """
+    Seed ``profile`` through COPY. The generated rows depend only on the
+    profile, ``distribution``, ``seed`` and ``end_date`` (and on starting from empty tables),
+    never on the number of workers or on whether the run was resumed.
+
+    With ``resume`` the run continues from the checkpoints of an earlier,
+    interrupted run with the same profile, distribution, seed and end date.
+    """
+    end_date = end_date or date.today()
+    num_shards: int = max(1, min(profile.shards, profile.num_customers))
+    coordinator_seq, *shard_seqs = np.random.SeedSequence(seed).spawn(num_shards + 1)
+    coordinator_seed: int = int(coordinator_seq.generate_state(1)[0])
+
+    fake: Faker = Faker()
+    fake.seed_instance(coordinator_seed)
+    rng: np.random.Generator = np.random.default_rng(coordinator_seed)
+    pools: IdentityPools = IdentityPools(fake)
+    meter: ThroughputMeter = ThroughputMeter()
+    key: str = run_key(profile, distribution, seed, end_date)
+    start_date: date = end_date - timedelta(days=profile.days_of_history - 1)
+
+    conn = engine.raw_connection()
+    try:
+        cursor = conn.cursor()
+        checkpoints: Dict[int, Dict[str, Any]] = load_checkpoints(cursor, key)
+
+        if resume:
+            if RUN_SHARD not in checkpoints:
+                raise ValueError(f"No checkpoint found for run '{key}', nothing to resume")
+            bases: Dict[str, int] = checkpoints[RUN_SHARD]
+            print(f"   resuming run {key}")
+        else:
+            clear_checkpoints(cursor, key)
+            checkpoints = {}
+            bases = {table: next_id(cursor, table) for table in ANALYZE_TABLES}
+
+        branch_ids: NDArray[np.int64] = np.arange(
+            bases["dim_branches"], bases["dim_branches"] + profile.num_branches
+        )
+        if not resume:
+            copy_columns(cursor, "dim_branches", ("id", "branch_name", "branch_code", "region"), [
+                branch_ids.astype(str).tolist(),
+                pools.branch_names(rng, profile.num_branches).tolist(),
+                branch_codes(branch_ids).tolist(),
+                np.array(REGIONS)[
+                    choose_skewed(rng, len(REGIONS), profile.num_branches, distribution.region_zipf)
+                ].tolist()
+            ], meter)
+            save_checkpoint(cursor, key, RUN_SHARD, bases)
+        ensure_partitions(cursor, start_date, end_date)
+        conn.commit()
+    finally:
+        conn.close()
+
+    customer_base: int = bases["dim_customers"]
+    account_base: int = bases["dim_accounts"]
+    transaction_base: int = bases["fact_transactions"]
+    balance_base: int = bases["fact_daily_balances"]
+
+    # Every shard gets ID blocks sized for its worst case, so blocks never overlap.
+    customers_per_shard: int = -(-profile.num_customers // num_shards)
+    accounts_per_shard: int = customers_per_shard * profile.max_accounts_per_customer
+    balances_per_shard: int = accounts_per_shard * profile.days_of_history
+    transactions_per_shard: int = balances_per_shard * _max_tx_per_day(profile, distribution)
+    specs: List[ShardSpec] = [
+        ShardSpec(
+            index=i,
+            profile=profile,
+            distribution=distribution,
+            customer_start=customer_base + i * customers_per_shard,
+            num_customers=min(customers_per_shard, profile.num_customers - i * customers_per_shard),
+            account_start=account_base + i * accounts_per_shard,
+            transaction_start=transaction_base + i * transactions_per_shard,
+            balance_start=balance_base + i * balances_per_shard,
+            branch_ids=tuple(int(b) for b in branch_ids),
+            start_date=start_date,
+            chunk_rows=chunk_rows,
+            seed=int(shard_seqs[i].generate_state(1)[0]),
+            pools=pools,
+            run_key=key,
+            checkpoint=checkpoints.get(i)
+        )
+        for i in range(num_shards)
+        if profile.num_customers - i * customers_per_shard > 0
+    ]
+
+    if workers <= 1:
+        for spec in specs:
+            meter.merge(_seed_shard(spec))
+    else:
+        with multiprocessing.Pool(min(workers, len(specs)), initializer=_init_worker) as pool:
+            for shard_meter in pool.imap_unordered(_seed_shard, specs):
+                meter.merge(shard_meter)
+
+    finalize_load()
+    return meter
+
+
+def finalize_load(rebuild_rollups: bool = True) -> None:
+    """
+    Reset the id sequences, rebuild the category rollup unless the load
+    brought its own (``rebuild_rollups=False``), and vacuum the tables.
+    """
+    conn = engine.raw_connection()
+    try:
+        cursor = conn.cursor()
+        reset_sequences(cursor, ANALYZE_TABLES)
+        if rebuild_rollups:
+            rebuild_category_daily(cursor)
+        conn.commit()
+        # VACUUM sets the visibility map, which index-only scans on the covering indexes need.
+        # It cannot run in a transaction block; autocommit is switched back before the
+        # connection returns to the pool.
+        conn.dbapi_connection.autocommit = True
+        try:
+            for table in ANALYZE_TABLES + (CATEGORY_DAILY,):
+                cursor.execute(f"VACUUM (ANALYZE) {table}")
+        finally:
+            conn.dbapi_connection.autocommit = False
+    finally:
+        conn.close()
@@ -0,0 +1,45 @@
+"""
+Resumable seeding checkpoints.
+
+Each bulk-seeding run is identified by its profile, distribution, seed and
+end date. The run's ID bases are stored under shard ``-1``. Every shard
+records its progress in ``seed_checkpoints`` inside the same transaction
+as the rows it just loaded, so a checkpoint never points past committed
+data. Progress includes the NumPy bit-generator state, which lets a
+resumed shard produce exactly the rows an uninterrupted run would have.
+"""
+
+import json
+from datetime import date
+from typing import Any, Dict, Final
+
+from app.db.distributions import DistributionParams
+from app.db.profiles import SeedProfile
+
+RUN_SHARD: Final[int] = -1
+
+UPSERT_SQL: Final[str] = """
+INSERT INTO seed_checkpoints (run_key, shard, state, updated_at)
+VALUES (%s, %s, %s, now())
+ON CONFLICT (run_key, shard) DO UPDATE SET state = EXCLUDED.state, updated_at = EXCLUDED.updated_at
+"""
+
+
+def run_key(profile: SeedProfile, distribution: DistributionParams, seed: int, end_date: date) -> str:
+    return f"{profile.name}:{distribution.name}:{seed}:{end_date.isoformat()}"
+
+
+def save_checkpoint(cursor: Any, key: str, shard: int, state: Dict[str, Any]) -> None:
+    cursor.execute(UPSERT_SQL, (key, shard, json.dumps(state)))
+
+
+def load_checkpoints(cursor: Any, key: str) -> Dict[int, Dict[str, Any]]:
+    cursor.execute("SELECT shard, state FROM seed_checkpoints WHERE run_key = %s", (key,))
+    return {
+        int(shard): state if isinstance(state, dict) else json.loads(state)
+        for shard, state in cursor.fetchall()
+    }
+
+
+def clear_checkpoints(cursor: Any, key: str) -> None:
+    cursor.execute("DELETE FROM seed_checkpoints WHERE run_key = %s", (key,))
@@ -0,0 +1,85 @@
+"""
+Time-order clustering for the append-only fact tables.
+
+BRIN indexes keep only the min/max of each block range, so they prune
+well only while the physical row order follows time. Live inserts arrive
+roughly in time order, but the bulk seeders write account by account, so
+a freshly seeded table has almost no correlation between block and date.
+``cluster_by_time`` rewrites every table, or every monthly partition of
+``fact_transactions``, whose planner correlation for the time column is
+below a threshold. It uses CLUSTER on the time B-tree, which also rebuilds
+the BRIN indexes.
+
+CLUSTER takes an exclusive lock on the table it rewrites, so each
+partition is committed on its own and the job is meant for quiet hours.
+"""
+
+from typing import Any, Final, List, Optional, Tuple
+
+from app.db.partitions import is_partitioned
+
+CORRELATION_THRESHOLD: Final[float] = 0.9
+
+# Table, time column and the B-tree that defines the clustered order.
+TIME_ORDERED: Final[Tuple[Tuple[str, str, str], ...]] = (
+    ("fact_transactions", "timestamp", "ix_fact_transactions_timestamp"),
+    ("fact_daily_balances", "balance_date", "ix_fact_daily_balances_balance_date"),
+)
+
+CORRELATION_SQL: Final[str] = """
+SELECT correlation FROM pg_stats
+WHERE schemaname = current_schema() AND tablename = %s AND attname = %s
+"""
+
+# The partitions of a partitioned index, with the partition each one is on.
+CHILD_INDEXES_SQL: Final[str] = """
+SELECT t.relname, ci.relname
+FROM pg_inherits AS i
+JOIN pg_class AS ci ON ci.oid = i.inhrelid
+JOIN pg_index AS x ON x.indexrelid = ci.oid
+JOIN pg_class AS t ON t.oid = x.indrelid
+WHERE i.inhparent = %s::regclass
+ORDER BY t.relname
+"""
+
+
+def correlation(cursor: Any, table: str, column: str) -> Optional[float]:
+    cursor.execute(CORRELATION_SQL, (table, column))
+    row = cursor.fetchone()
+    if row is None:
+        cursor.execute(f"ANALYZE {table}")
+        cursor.execute(CORRELATION_SQL, (table, column))
+        row = cursor.fetchone()
+    return float(row[0]) if row and row[0] is not None else None
+
+
+def _leaf_tables(cursor: Any, table: str, index: str) -> List[Tuple[str, str]]:
+    if table == "fact_transactions" and is_partitioned(cursor):
+        cursor.execute(CHILD_INDEXES_SQL, (index,))
+        return [(row[0], row[1]) for row in cursor.fetchall()]
+    return [(table, index)]
+
+
+def cluster_by_time(
+    conn: Any,
+    threshold: float = CORRELATION_THRESHOLD,
+    dry_run: bool = False
+) -> List[Tuple[str, float]]:
+    """
+    CLUSTER each fact table or partition whose time correlation is below
+    ``threshold`` and return ``(table, correlation before)`` for each of them.
+    """
+    cursor = conn.cursor()
+    clustered: List[Tuple[str, float]] = []
+    for table, column, index in TIME_ORDERED:
+        for leaf, leaf_index in _leaf_tables(cursor, table, index):
+            before: Optional[float] = correlation(cursor, leaf, column)
+            # No statistics even after ANALYZE means the table is empty.
+            if before is None or abs(before) >= threshold:
+                continue
+            clustered.append((leaf, before))
+            if not dry_run:
+                cursor.execute(f"CLUSTER {leaf} USING {leaf_index}")
+                cursor.execute(f"ANALYZE {leaf}")
+            conn.commit()
+    return clustered
@@ -0,0 +1,161 @@
+"""
+Production-like data distributions for the bulk seeder.
+
+``UNIFORM`` reproduces the original seeder: every account draws 0..N
+transactions per day with uniform amounts. ``SKEWED`` models what real
+ledgers look like: Zipfian account activity with a few hot (corporate)
+accounts and a dormant tail, month-end salary spikes and quieter weekends,
+branches and regions of very different size, and heavy-tailed amounts.
+"""
+
+from typing import Dict, Final, NamedTuple, Tuple
+
+import numpy as np
+from numpy.typing import NDArray
+
+from app.db.models import CENTS_PER_UNIT
+from app.db.seeders import CATEGORIES
+
+
+class DistributionParams(NamedTuple):
+    name: str
+    activity_zipf: float = 0.0
+    mean_tx_per_day: float = 2.0
+    hot_account_cap: int = 0
+    dormant_share: float = 0.0
+    month_end_days: int = 0
+    month_end_boost: float = 0.0
+    weekend_factor: float = 1.0
+    branch_zipf: float = 0.0
+    region_zipf: float = 0.0
+    amount_sigma: float = 0.0
+
+    @property
+    def is_skewed(self) -> bool:
+        return self.activity_zipf > 0.0
+
+
+UNIFORM: Final[DistributionParams] = DistributionParams(name="uniform")
+
+SKEWED: Final[DistributionParams] = DistributionParams(
+    name="skewed",
+    activity_zipf=1.1,
+    mean_tx_per_day=2.0,
+    hot_account_cap=5_000,
+    dormant_share=0.25,
+    month_end_days=2,
+    month_end_boost=2.5,
+    weekend_factor=0.6,
+    branch_zipf=1.0,
+    region_zipf=0.8,
+    amount_sigma=1.0
+)
+
+DISTRIBUTIONS: Final[Dict[str, DistributionParams]] = {
+    d.name: d for d in (UNIFORM, SKEWED)
+}
+
+# Category mix on ordinary days and on month-end (payroll) days.
+CATEGORY_WEIGHTS: Final[Dict[str, Tuple[float, float]]] = {
+    "Groceries": (0.32, 0.20),
+    "Salary": (0.03, 0.35),
+    "Rent": (0.04, 0.12),
+    "Dining": (0.30, 0.15),
+    "Investment": (0.06, 0.06),
+    "Transfer": (0.25, 0.12),
+}
+
+# Median absolute amount and direction of money flow for each category.
+CATEGORY_AMOUNTS: Final[Dict[str, Tuple[float, int]]] = {
+    "Groceries": (45.0, -1),
+    "Salary": (3_200.0, 1),
+    "Rent": (1_200.0, -1),
+    "Dining": (30.0, -1),
+    "Investment": (500.0, -1),
+    "Transfer": (250.0, 0),
+}
+
+
+def get_distribution(name: str) -> DistributionParams:
+    try:
+        return DISTRIBUTIONS[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown distribution '{name}'. Available: {', '.join(DISTRIBUTIONS)}"
+        ) from None
+
+
+def zipf_weights(n: int, s: float) -> NDArray[np.float64]:
+    """Weights proportional to 1/rank**s, normalized to a mean of 1."""
+    weights: NDArray[np.float64] = 1.0 / np.arange(1, n + 1, dtype=np.float64) ** s
+    return weights * (n / weights.sum())
+
+
+def choose_skewed(rng: np.random.Generator, n_choices: int, size: int, s: float) -> NDArray[np.int64]:
+    if s <= 0.0:
+        return rng.integers(0, n_choices, size)
+    p: NDArray[np.float64] = zipf_weights(n_choices, s)
+    return rng.choice(n_choices, size=size, p=p / p.sum())
+
+
+def account_activity(
+    rng: np.random.Generator,
+    is_corporate: NDArray[np.bool_],
+    params: DistributionParams
+) -> NDArray[np.float64]:
+    """
+    Relative activity of each account (mean 1). Corporate accounts take the
+    top Zipf ranks and the lowest ``dormant_share`` of ranks never transact.
+    """
+    n: int = len(is_corporate)
+    weights: NDArray[np.float64] = zipf_weights(n, params.activity_zipf)
+    dormant: int = int(n * params.dormant_share)
+    if dormant:
+        weights[n - dormant:] = 0.0
+        weights *= n / weights.sum()
+    order: NDArray[np.int64] = np.argsort(-(rng.random(n) + is_corporate), kind="stable")
+    activity: NDArray[np.float64] = np.empty(n)
+    activity[order] = weights
+    return activity
+
+
+def calendar_factors(
+    dates: NDArray[np.datetime64],
+    params: DistributionParams
+) -> Tuple[NDArray[np.float64], NDArray[np.bool_]]:
+    """Per-day activity multiplier and month-end (payroll) flag."""
+    months: NDArray[np.datetime64] = dates.astype("datetime64[M]")
+    days_to_month_end: NDArray[np.int64] = (
+        (months + 1).astype("datetime64[D]") - dates
+    ).astype(np.int64)
+    month_end: NDArray[np.bool_] = days_to_month_end <= params.month_end_days
+    weekday: NDArray[np.int64] = (dates.astype(np.int64) + 3) % 7
+    factors: NDArray[np.float64] = np.where(month_end, 1.0 + params.month_end_boost, 1.0)
+    factors *= np.where(weekday >= 5, params.weekend_factor, 1.0)
+    return factors, month_end
+
+
+def draw_categories(rng: np.random.Generator, month_end: NDArray[np.bool_]) -> NDArray[np.int64]:
+    weights: NDArray[np.float64] = np.array([CATEGORY_WEIGHTS[c] for c in CATEGORIES])
+    cumulative: NDArray[np.float64] = np.cumsum(weights / weights.sum(axis=0), axis=0)
+    u: NDArray[np.float64] = rng.random(len(month_end))
+    ordinary: NDArray[np.int64] = np.searchsorted(cumulative[:, 0], u, side="right")
+    payroll: NDArray[np.int64] = np.searchsorted(cumulative[:, 1], u, side="right")
+    return np.minimum(np.where(month_end, payroll, ordinary), len(CATEGORIES) - 1)
+
+
+def draw_amounts(
+    rng: np.random.Generator,
+    category_idx: NDArray[np.int64],
+    params: DistributionParams
+) -> NDArray[np.int64]:
+    """Lognormal (heavy-tailed) magnitudes in cents, signed by the category's money flow."""
+    medians: NDArray[np.float64] = np.array([CATEGORY_AMOUNTS[c][0] for c in CATEGORIES])
+    flows: NDArray[np.int64] = np.array([CATEGORY_AMOUNTS[c][1] for c in CATEGORIES])
+    magnitude: NDArray[np.float64] = medians[category_idx] * rng.lognormal(
+        0.0, params.amount_sigma, len(category_idx)
+    )
+    direction: NDArray[np.int64] = flows[category_idx]
+    random_sign: NDArray[np.int64] = np.where(rng.random(len(category_idx)) < 0.5, -1, 1)
+    return np.round(magnitude * np.where(direction == 0, random_sign, direction) * CENTS_PER_UNIT).astype(np.int64)
+
@@ -0,0 +1,94 @@
+"""
+High-throughput identity columns for the bulk seeder.
+
+Faker's ``unique`` proxy remembers every value it has produced and retries
+on collisions, which gets slower with every row. Here uniqueness comes from
+construction instead: emails, IBANs and branch codes encode the row's
+pre-allocated id, and names, merchants and cities are drawn by vectorized
+index from pools that are filled from Faker once up front.
+"""
+
+from typing import Final, List, Set, Tuple
+
+import numpy as np
+from numpy.typing import NDArray
+from faker import Faker
+
+POOL_SIZE: Final[int] = 2_000
+BANK_CODE: Final[str] = "MRDR"
+IBAN_COUNTRY: Final[str] = "GB"
+IBAN_DIGITS: Final[int] = 14
+
+
+def _letters_to_digits(text: str) -> str:
+    return "".join(str(int(ch, 36)) for ch in text)
+
+
+def _unique_pool(values: List[str]) -> NDArray[np.str_]:
+    # Pool entries end up in COPY text streams, so control characters are dropped up front.
+    cleaned: Set[str] = {" ".join(v.replace("\\", " ").split()) for v in values}
+    return np.array(sorted(cleaned))
+
+
+class IdentityPools:
+    def __init__(self, fake: Faker, size: int = POOL_SIZE) -> None:
+        self.first_names: NDArray[np.str_] = _unique_pool([fake.first_name() for _ in range(size)])
+        self.last_names: NDArray[np.str_] = _unique_pool([fake.last_name() for _ in range(size)])
+        self.companies: NDArray[np.str_] = _unique_pool([fake.company() for _ in range(size)])
+        self.cities: NDArray[np.str_] = _unique_pool([fake.city() for _ in range(size)])
+        self.email_domains: NDArray[np.str_] = _unique_pool(
+            [fake.free_email_domain() for _ in range(size // 10 or 1)]
+        )
+
+    def customers(
+        self,
+        rng: np.random.Generator,
+        customer_ids: NDArray[np.int64]
+    ) -> Tuple[NDArray[np.str_], NDArray[np.str_]]:
+        """Full names and matching emails; emails are unique through the customer id."""
+        n: int = len(customer_ids)
+        first: NDArray[np.str_] = self.first_names[rng.integers(0, len(self.first_names), n)]
+        last: NDArray[np.str_] = self.last_names[rng.integers(0, len(self.last_names), n)]
+        domains: NDArray[np.str_] = self.email_domains[rng.integers(0, len(self.email_domains), n)]
+        names: NDArray[np.str_] = np.char.add(np.char.add(first, " "), last)
+        local: NDArray[np.str_] = np.char.lower(np.char.add(np.char.add(first, "."), last))
+        local = np.char.replace(np.char.replace(local, " ", ""), "'", "")
+        emails: NDArray[np.str_] = np.char.add(
+            np.char.add(np.char.add(local, customer_ids.astype(str)), "@"), domains
+        )
+        return names, emails
+
+    def branch_names(self, rng: np.random.Generator, n: int) -> NDArray[np.str_]:
+        return np.char.add(self.cities[rng.integers(0, len(self.cities), n)], " Center")
+
+
+def branch_codes(branch_ids: NDArray[np.int64]) -> NDArray[np.str_]:
+    return np.char.add("BR-", np.char.zfill(branch_ids.astype(str), 4))
+
+
+def iban_checksum_terms() -> Tuple[int, int, int]:
+    """
+    Terms of ``(BBAN + country + "00") mod 97`` for the fixed bank code and
+    country: ``bank_term + (account_id mod 97) * id_factor + country_term``.
+    Shared with the server-side generator so both produce the same IBANs.
+    """
+    country_digits: str = _letters_to_digits(IBAN_COUNTRY) + "00"
+    bank_term: int = int(_letters_to_digits(BANK_CODE)) % 97 * pow(10, IBAN_DIGITS + len(country_digits), 97)
+    id_factor: int = pow(10, len(country_digits), 97)
+    country_term: int = int(country_digits) % 97
+    return bank_term, id_factor, country_term
+
+
+def ibans(account_ids: NDArray[np.int64]) -> NDArray[np.str_]:
+    """
+    Valid ISO 13616 IBANs whose account part is the zero-padded account id,
+    so they are unique by construction. The mod-97 check digits are computed
+    arithmetically on the int64 ids instead of on big decimal strings.
+    """
+    bank_term, id_factor, country_term = iban_checksum_terms()
+    remainder: NDArray[np.int64] = (bank_term + account_ids % 97 * id_factor + country_term) % 97
+    check: NDArray[np.str_] = np.char.zfill((98 - remainder).astype(str), 2)
+    account_part: NDArray[np.str_] = np.char.zfill(account_ids.astype(str), IBAN_DIGITS)
+    return np.char.add(
+        np.char.add(np.char.add(IBAN_COUNTRY, check), BANK_CODE), account_part
+    )
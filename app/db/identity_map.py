@@ -0,0 +1,34 @@
+"""
+Identity-map diagnostics.
+
+A session's identity map holds unmodified objects only weakly, so it
+shrinks again once nothing else references them. What keeps it growing
+are objects that are referenced elsewhere (by widgets, or through a loaded
+collection of another object) and objects with unflushed changes, which
+the session holds strongly until they are flushed or expunged.
+``identity_map_stats`` reports both, so a long UI session can be checked
+for growth.
+"""
+
+from collections import Counter
+from typing import Dict, NamedTuple
+
+from sqlalchemy.orm import Session
+
+
+class IdentityMapStats(NamedTuple):
+    objects: int
+    modified: int
+    by_class: Dict[str, int]
+
+    def __str__(self) -> str:
+        return f"Session {self.objects:,} objects ({self.modified:,} modified)"
+
+
+def identity_map_stats(session: Session) -> IdentityMapStats:
+    objects = list(session.identity_map.values())
+    return IdentityMapStats(
+        objects=len(objects),
+        modified=len(session.dirty) + len(session.new) + len(session.deleted),
+        by_class=dict(Counter(type(obj).__name__ for obj in objects).most_common())
+    )
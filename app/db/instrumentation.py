@@ -0,0 +1,203 @@
+"""
+Per-statement SQL instrumentation.
+
+``SqlMonitor.instrument(engine)`` hooks the engine's cursor events and
+times every statement executed through SQLAlchemy (raw DBAPI connections,
+as the bulk loaders use, are not seen). Each statement is attributed to
+the service method that issued it (``CustomerService.search_customers``),
+or failing that to the first caller in the app outside ``app.db``, and
+its latency and row count go into a per-caller histogram.
+
+Statements slower than ``DB_SLOW_QUERY_MS`` are also kept in a bounded
+slow-query log, with their bound parameters and, when
+``DB_SLOW_QUERY_EXPLAIN`` is on, an ``EXPLAIN (ANALYZE, BUFFERS)`` of the
+statement. The EXPLAIN runs the query a second time, so it is only taken
+for SELECTs, inside a savepoint that is rolled back, and is off by
+default. The UI shows all
+of it in the SQL diagnostics dialog.
+"""
+
+import logging
+import sys
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from types import FrameType
+from typing import Any, Deque, Dict, Final, List, NamedTuple, Optional, Tuple
+
+from sqlalchemy import Engine, event
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+SERVICE_MODULES: Final[str] = "app.core.services."
+OTHER_CALLER: Final[str] = "<other>"
+PARAMS_CHARS: Final[int] = 2_000
+
+# Upper bounds of the histogram buckets; slower statements land in a last, open bucket.
+BUCKETS_MS: Final[Tuple[float, ...]] = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1_000, 2_000, 5_000, 10_000)
+
+STARTED_KEY: Final[str] = "hd_statement_started"
+
+
+class LatencyHistogram:
+    def __init__(self) -> None:
+        self.counts: List[int] = [0] * (len(BUCKETS_MS) + 1)
+        self.calls: int = 0
+        self.rows: int = 0
+        self.total_ms: float = 0.0
+        self.max_ms: float = 0.0
+
+    def observe(self, ms: float, rows: int) -> None:
+        bucket: int = next((i for i, bound in enumerate(BUCKETS_MS) if ms <= bound), len(BUCKETS_MS))
+        self.counts[bucket] += 1
+        self.calls += 1
+        self.rows += max(rows, 0)
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the ``q`` quantile, capped at the slowest call."""
+        rank: float = q * self.calls
+        seen: int = 0
+        for i, count in enumerate(self.counts):
+            seen += count
+            if count and seen >= rank:
+                return min(BUCKETS_MS[i], self.max_ms) if i < len(BUCKETS_MS) else self.max_ms
+        return self.max_ms
+
+
+class CallerStats(NamedTuple):
+    caller: str
+    calls: int
+    rows: int
+    total_ms: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+
+
+class SlowQuery(NamedTuple):
+    at: datetime
+    caller: str
+    duration_ms: float
+    rows: int
+    statement: str
+    parameters: str
+    plan: Optional[str]
+
+
+def _frame_name(frame: FrameType) -> str:
+    owner: Any = frame.f_locals.get("self")
+    return f"{type(owner).__name__}.{frame.f_code.co_name}" if owner is not None else frame.f_code.co_name
+
+
+def _caller() -> str:
+    frame: Optional[FrameType] = sys._getframe(2)
+    fallback: Optional[str] = None
+    while frame is not None:
+        module: str = frame.f_globals.get("__name__", "")
+        if module.startswith(SERVICE_MODULES):
+            return _frame_name(frame)
+        # Streamed results are fetched after the service method has returned.
+        if fallback is None and module.startswith("app.") and not module.startswith("app.db."):
+            fallback = _frame_name(frame)
+        frame = frame.f_back
+    return fallback or OTHER_CALLER
+
+
+def _is_query(statement: str) -> bool:
+    return statement.lstrip()[:6].upper().startswith(("SELECT", "WITH"))
+
+
+def _explain(cursor: Any, statement: str, parameters: Any) -> str:
+    explain = cursor.connection.cursor()
+    try:
+        # Rolled back either way, so a data-modifying CTE is not applied twice.
+        explain.execute("SAVEPOINT hd_explain")
+        try:
+            explain.execute(f"EXPLAIN (ANALYZE, BUFFERS) {statement}", parameters)
+            return "\n".join(row[0] for row in explain.fetchall())
+        finally:
+            explain.execute("ROLLBACK TO SAVEPOINT hd_explain")
+            explain.execute("RELEASE SAVEPOINT hd_explain")
+    except Exception as e:
+        return f"EXPLAIN failed: {e}"
+    finally:
+        explain.close()
+
+
+class SqlMonitor:
+    def __init__(self, slow_ms: float, explain: bool = False, log_size: int = 200) -> None:
+        self.slow_ms: float = slow_ms
+        self.explain: bool = explain
+        self._lock: threading.Lock = threading.Lock()
+        self._histograms: Dict[str, LatencyHistogram] = {}
+        self._slow: Deque[SlowQuery] = deque(maxlen=log_size)
+
+    def instrument(self, engine: Engine) -> None:
+        event.listen(engine, "before_cursor_execute", self._before)
+        event.listen(engine, "after_cursor_execute", self._after)
+        event.listen(engine, "handle_error", self._failed)
+
+    def _before(self, conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+        conn.info.setdefault(STARTED_KEY, []).append(time.perf_counter())
+
+    def _failed(self, context: Any) -> None:
+        started: List[float] = context.connection.info.get(STARTED_KEY, []) if context.connection else []
+        if started:
+            started.pop()
+
+    def _after(self, conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+        ms: float = (time.perf_counter() - conn.info[STARTED_KEY].pop()) * 1000
+        rows: int = cursor.rowcount
+        caller: str = _caller()
+        with self._lock:
+            self._histograms.setdefault(caller, LatencyHistogram()).observe(ms, rows)
+        if ms < self.slow_ms:
+            return
+
+        plan: Optional[str] = None
+        if self.explain and not executemany and _is_query(statement):
+            plan = _explain(cursor, statement, parameters)
+        entry: SlowQuery = SlowQuery(
+            at=datetime.now(),
+            caller=caller,
+            duration_ms=ms,
+            rows=rows,
+            statement=statement,
+            parameters=repr(parameters)[:PARAMS_CHARS],
+            plan=plan
+        )
+        with self._lock:
+            self._slow.append(entry)
+        logger.warning("slow query (%.0f ms, %s): %s", ms, caller, " ".join(statement.split()))
+
+    def stats(self) -> List[CallerStats]:
+        """Latency per caller, slowest total first."""
+        with self._lock:
+            snapshot: List[CallerStats] = [
+                CallerStats(
+                    caller=caller,
+                    calls=h.calls,
+                    rows=h.rows,
+                    total_ms=h.total_ms,
+                    p50_ms=h.quantile(0.5),
+                    p95_ms=h.quantile(0.95),
+                    p99_ms=h.quantile(0.99),
+                    max_ms=h.max_ms
+                )
+                for caller, h in self._histograms.items()
+            ]
+        return sorted(snapshot, key=lambda s: s.total_ms, reverse=True)
+
+    def slow_queries(self) -> List[SlowQuery]:
+        """The slow-query log, newest first."""
+        with self._lock:
+            return list(reversed(self._slow))
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+            self._slow.clear()
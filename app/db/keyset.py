@@ -0,0 +1,89 @@
+"""
+Keyset (seek) pagination.
+
+LIMIT/OFFSET reads and throws away every row before the requested page,
+so page N costs O(N). ``keyset_page`` instead orders by a unique key such
+as ``(timestamp, id)`` and asks for the rows after the last key of the
+previous page, ``WHERE (timestamp, id) < (:ts, :id)``, which the B-tree on
+the leading column answers in one descent whatever the depth.
+
+The key of the last row goes back to the caller as an opaque token; pass
+it as ``after`` to get the next page. Tokens are tagged with the listing
+they came from and are not meant to be stored: rows inserted above the
+cursor are simply not seen, which is what an endless scroll wants.
+"""
+
+import base64
+import json
+from datetime import date, datetime
+from typing import Any, Final, List, NamedTuple, Optional, Sequence, Tuple
+
+from sqlalchemy import Select, tuple_
+from sqlalchemy.orm import InstrumentedAttribute
+
+from app.db.base import SessionLike
+
+PAGE_SIZE: Final[int] = 25
+
+
+class Page(NamedTuple):
+    items: List[Any]
+    next_token: Optional[str]
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"d": value.isoformat()}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict) and "dt" in value:
+        return datetime.fromisoformat(value["dt"])
+    if isinstance(value, dict) and "d" in value:
+        return date.fromisoformat(value["d"])
+    return value
+
+
+def encode_token(listing: str, key: Sequence[Any]) -> str:
+    payload: str = json.dumps([listing, [_encode_value(v) for v in key]], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_token(listing: str, token: str) -> Tuple[Any, ...]:
+    try:
+        tag, key = json.loads(base64.urlsafe_b64decode(token.encode()))
+    except (ValueError, TypeError) as e:
+        raise ValueError("Invalid page token") from e
+    if tag != listing:
+        raise ValueError(f"Page token is for '{tag}', not '{listing}'")
+    return tuple(_decode_value(v) for v in key)
+
+
+def keyset_page(
+    db: SessionLike,
+    stmt: Select,
+    listing: str,
+    key: Sequence[InstrumentedAttribute],
+    after: Optional[str] = None,
+    page_size: int = PAGE_SIZE,
+    descending: bool = True
+) -> Page:
+    """
+    One page of ``stmt`` ordered by ``key``, which must be unique, starting
+    after the row ``after`` points at. ``listing`` names the query the
+    token belongs to.
+    """
+    if after is not None:
+        last: Tuple[Any, ...] = decode_token(listing, after)
+        seek = tuple_(*key) < tuple_(*last) if descending else tuple_(*key) > tuple_(*last)
+        stmt = stmt.where(seek)
+    stmt = stmt.order_by(*(column.desc() if descending else column.asc() for column in key))
+    # One row more than the page tells whether there is a next page.
+    items: List[Any] = list(db.execute(stmt.limit(page_size + 1)).scalars().all())
+    if len(items) <= page_size:
+        return Page(items, None)
+    items = items[:page_size]
+    return Page(items, encode_token(listing, [getattr(items[-1], column.key) for column in key]))
@@ -0,0 +1,257 @@
+"""
+Continuous transaction load generator.
+
+Each writer is its own process with its own connection and posts
+transactions open-loop at ``rate / writers`` per second: a batch is sent
+when it is due, whether or not earlier commits were slow, so commit
+latency under load is measured honestly instead of throttling the
+offered rate. Accounts, categories and amounts are drawn with the
+seeder's distributions.
+
+Writers post either through ``TransactionService.create_transaction``
+(the application's write path, one commit per transaction) or as
+multi-row INSERTs of ``batch_size`` transactions per commit, which is
+what it takes to reach tens of thousands of transactions per second.
+"""
+
+import time
+import multiprocessing
+from queue import Empty
+from datetime import date, datetime
+from typing import Any, Final, List, NamedTuple, Optional, Set, Tuple
+
+import numpy as np
+from numpy.typing import NDArray
+from faker import Faker
+from psycopg2.extras import execute_values
+
+from app.db.base import engine, reset_engine_after_fork, SessionLocal
+from app.db.distributions import (
+    DistributionParams, UNIFORM, calendar_factors, draw_amounts, draw_categories, zipf_weights
+)
+from app.db.identities import IdentityPools
+from app.db.models import CENTS_PER_UNIT, from_cents
+from app.db.seeders import CATEGORIES
+from app.core.services.transaction import TransactionService
+
+VIA_SERVICE: Final[str] = "service"
+VIA_BATCH: Final[str] = "batch"
+QUEUE_POLL: Final[float] = 1.0
+
+INSERT_SQL: Final[str] = (
+    "INSERT INTO fact_transactions (account_id, amount, category, merchant_name, timestamp) VALUES %s"
+)
+
+
+class WriterSpec(NamedTuple):
+    index: int
+    rate: float
+    duration: float
+    batch_size: int
+    via: str
+    distribution: DistributionParams
+    seed: int
+    account_ids: NDArray[np.int64]
+    merchants: NDArray[np.str_]
+    report_every: float
+
+
+class LatencyStats:
+    def __init__(self) -> None:
+        self.transactions: int = 0
+        self.latencies: List[float] = []
+
+    def add(self, transactions: int, latencies: List[float]) -> None:
+        self.transactions += transactions
+        self.latencies.extend(latencies)
+
+    def percentile(self, q: float) -> float:
+        return float(np.percentile(self.latencies, q)) * 1000 if self.latencies else 0.0
+
+    def summary(self, seconds: float) -> str:
+        rate: float = self.transactions / seconds if seconds else 0.0
+        return (
+            f"{self.transactions:,} tx ({rate:,.0f} tx/sec), {len(self.latencies):,} commits, "
+            f"p50 {self.percentile(50):.2f} ms, p99 {self.percentile(99):.2f} ms"
+        )
+
+
+class TransactionSampler:
+    """Draws batches of transactions; account choice follows the distribution's Zipf activity."""
+
+    def __init__(
+        self,
+        rng: np.random.Generator,
+        account_ids: NDArray[np.int64],
+        merchants: NDArray[np.str_],
+        distribution: DistributionParams
+    ) -> None:
+        self.rng: np.random.Generator = rng
+        self.account_ids: NDArray[np.int64] = rng.permutation(account_ids)
+        self.merchants: NDArray[np.str_] = merchants
+        self.distribution: DistributionParams = distribution
+        self.cdf: Optional[NDArray[np.float64]] = None
+        if distribution.is_skewed:
+            self.cdf = np.cumsum(zipf_weights(len(account_ids), distribution.activity_zipf))
+            self.cdf /= self.cdf[-1]
+
+    def sample(self, size: int) -> List[Tuple[int, int, str, str, datetime]]:
+        """Rows of (account, amount in cents, category, merchant, timestamp)."""
+        rng: np.random.Generator = self.rng
+        if self.cdf is not None:
+            picks: NDArray[np.int64] = np.searchsorted(self.cdf, rng.random(size))
+            _, month_end = calendar_factors(np.full(size, np.datetime64(date.today(), 'D')), self.distribution)
+            category_idx: NDArray[np.int64] = draw_categories(rng, month_end)
+            amounts: NDArray[np.int64] = draw_amounts(rng, category_idx, self.distribution)
+        else:
+            picks = rng.integers(0, len(self.account_ids), size)
+            amounts = np.round(rng.uniform(-1000.0, 1500.0, size) * CENTS_PER_UNIT).astype(np.int64)
+            category_idx = rng.integers(0, len(CATEGORIES), size)
+        merchants: NDArray[np.str_] = self.merchants[rng.integers(0, len(self.merchants), size)]
+        now: datetime = datetime.utcnow()
+        return [
+            (int(account), int(amount), CATEGORIES[category], str(merchant), now)
+            for account, amount, category, merchant in zip(
+                self.account_ids[picks], amounts, category_idx, merchants
+            )
+        ]
+
+
+def _run_writer(spec: WriterSpec, queue: Any) -> None:
+    """Posts transactions until the deadline; the last report, sent whatever happens, has ``done`` set."""
+    db = None
+    conn = None
+    transactions: int = 0
+    latencies: List[float] = []
+    error: Optional[str] = None
+    try:
+        reset_engine_after_fork()
+        sampler: TransactionSampler = TransactionSampler(
+            np.random.default_rng(spec.seed), spec.account_ids, spec.merchants, spec.distribution
+        )
+        batch_size: int = 1 if spec.via == VIA_SERVICE else spec.batch_size
+        interval: float = batch_size / spec.rate
+        db = SessionLocal() if spec.via == VIA_SERVICE else None
+        conn = engine.raw_connection() if spec.via == VIA_BATCH else None
+        service: Optional[TransactionService] = TransactionService(db) if db is not None else None
+        cursor = conn.cursor() if conn is not None else None
+
+        started: float = time.perf_counter()
+        deadline: float = started + spec.duration
+        next_due: float = started
+        last_report: float = started
+        while (now := time.perf_counter()) < deadline:
+            if next_due > now:
+                time.sleep(next_due - now)
+            rows: List[Tuple[int, int, str, str, datetime]] = sampler.sample(batch_size)
+            sent: float = time.perf_counter()
+            if service is not None:
+                account_id, amount, category, merchant, _ = rows[0]
+                service.create_transaction(account_id, from_cents(amount), category, merchant)
+                db.expunge_all()
+            else:
+                execute_values(cursor, INSERT_SQL, rows, page_size=batch_size)
+                conn.commit()
+            latencies.append(time.perf_counter() - sent)
+            transactions += batch_size
+            next_due += interval
+            if time.perf_counter() - last_report >= spec.report_every:
+                queue.put((spec.index, transactions, latencies, False, None))
+                transactions, latencies = 0, []
+                last_report = time.perf_counter()
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+    finally:
+        queue.put((spec.index, transactions, latencies, True, error))
+        if db is not None:
+            db.close()
+        if conn is not None:
+            conn.close()
+
+
+def _load_targets(merchant_seed: int) -> Tuple[NDArray[np.int64], NDArray[np.str_]]:
+    conn = engine.raw_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute("SELECT id FROM dim_accounts WHERE is_active ORDER BY id")
+        account_ids: NDArray[np.int64] = np.array([row[0] for row in cursor.fetchall()], dtype=np.int64)
+    finally:
+        conn.close()
+    if len(account_ids) == 0:
+        raise ValueError("No active accounts to post transactions to; seed the database first")
+    fake: Faker = Faker()
+    fake.seed_instance(merchant_seed)
+    return account_ids, IdentityPools(fake).companies
+
+
+def run_load(
+    rate: float,
+    writers: int = 4,
+    duration: float = 60.0,
+    batch_size: int = 1,
+    via: str = VIA_BATCH,
+    distribution: DistributionParams = UNIFORM,
+    seed: int = 0,
+    report_every: float = 5.0
+) -> LatencyStats:
+    """Post ``rate`` transactions/sec across ``writers`` connections for ``duration`` seconds."""
+    account_ids, merchants = _load_targets(seed)
+    writer_seeds: List[np.random.SeedSequence] = np.random.SeedSequence(seed).spawn(writers)
+    queue: Any = multiprocessing.Queue()
+    processes: List[multiprocessing.Process] = [
+        multiprocessing.Process(target=_run_writer, args=(WriterSpec(
+            index=i,
+            rate=rate / writers,
+            duration=duration,
+            batch_size=batch_size,
+            via=via,
+            distribution=distribution,
+            seed=int(writer_seeds[i].generate_state(1)[0]),
+            account_ids=account_ids,
+            merchants=merchants,
+            report_every=report_every
+        ), queue))
+        for i in range(writers)
+    ]
+    for process in processes:
+        process.start()
+
+    total: LatencyStats = LatencyStats()
+    interval: LatencyStats = LatencyStats()
+    started: float = time.perf_counter()
+    last_report: float = started
+    running: Set[int] = set(range(writers))
+    reported: Set[int] = set()
+    while running:
+        try:
+            index, transactions, latencies, done, error = queue.get(timeout=QUEUE_POLL)
+        except Empty:
+            # A writer killed before its final report would otherwise be waited for forever.
+            # A process only exits once its queued reports are in the pipe, so an empty
+            # queue means a dead writer has nothing left to send.
+            dead: Set[int] = {i for i in running if processes[i].exitcode is not None}
+            if dead and queue.empty():
+                for i in sorted(dead):
+                    print(f"   writer {i} exited with code {processes[i].exitcode} without reporting")
+                running -= dead
+                reported -= dead
+            continue
+        total.add(transactions, latencies)
+        interval.add(transactions, latencies)
+        reported.add(index)
+        if error is not None:
+            print(f"   writer {index} stopped: {error}")
+        if done:
+            running.discard(index)
+        # An interval is printed once every writer still running has reported it.
+        if running and running <= reported:
+            now: float = time.perf_counter()
+            print(f"   t={now - started:5.0f}s  {interval.summary(now - last_report)}")
+            interval, reported = LatencyStats(), set()
+            last_report = now
+
+    for process in processes:
+        process.join()
+    elapsed: float = time.perf_counter() - started
+    print(f"   TOTAL after {elapsed:.1f}s (target {rate:,.0f} tx/sec): {total.summary(elapsed)}")
+    return total
@@ -1,16 +1,54 @@
 from datetime import datetime, date
-from typing import List, Optional
-from sqlalchemy import String, ForeignKey, BigInteger
+from decimal import Decimal, ROUND_HALF_EVEN
+from typing import Any, Dict, Final, List, Optional, Union
+from sqlalchemy import String, ForeignKey, BigInteger, JSON, Index, PrimaryKeyConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.types import TypeDecorator
 from app.db.base import Base
 import enum
 
+CENTS_PER_UNIT: Final[int] = 100
+
+def to_cents(value: Union[Decimal, float, int, str]) -> int:
+    return int((Decimal(str(value)) * CENTS_PER_UNIT).to_integral_value(ROUND_HALF_EVEN))
+
+def from_cents(cents: Union[int, Decimal]) -> Decimal:
+    return Decimal(cents).scaleb(-2)
+
+class Money(TypeDecorator):
+    """
+    Money stored as BIGINT minor units (cents) and handled in Python as a
+    Decimal in major units. Binds, comparisons and sum/min/max results are
+    converted automatically; give ``func.avg`` ``type_=Money()`` explicitly.
+    """
+    impl = BigInteger
+    cache_ok = True
+
+    def process_bind_param(self, value: Any, dialect: Any) -> Optional[int]:
+        return None if value is None else to_cents(value)
+
+    def process_result_value(self, value: Any, dialect: Any) -> Optional[Decimal]:
+        return None if value is None else from_cents(value)
+
 class AccountType(enum.Enum):
     SAVINGS = "SAVINGS"
     CHECKING = "CHECKING"
 
 class Customer(Base):
     __tablename__ = "dim_customers"
+    __table_args__ = (
+        Index("ix_dim_customers_credit_score", "credit_score"),
+        # Trigram indexes (pg_trgm) serve ILIKE '%q%' and similarity search.
+        Index("ix_dim_customers_full_name_trgm", "full_name",
+              postgresql_using="gin", postgresql_ops={"full_name": "gin_trgm_ops"}),
+        Index("ix_dim_customers_email_trgm", "email",
+              postgresql_using="gin", postgresql_ops={"email": "gin_trgm_ops"}),
+        # GiST trigram indexes return rows in word-similarity order for ranked search.
+        Index("ix_dim_customers_full_name_trgm_gist", "full_name",
+              postgresql_using="gist", postgresql_ops={"full_name": "gist_trgm_ops"}),
+        Index("ix_dim_customers_email_trgm_gist", "email",
+              postgresql_using="gist", postgresql_ops={"email": "gist_trgm_ops"}),
+    )
     
     id: Mapped[int] = mapped_column(primary_key=True)
     full_name: Mapped[str] = mapped_column(String(255))
@@ -33,6 +71,10 @@ class Branch(Base):
 
 class Account(Base):
     __tablename__ = "dim_accounts"
+    __table_args__ = (
+        Index("ix_dim_accounts_customer_id", "customer_id"),
+        Index("ix_dim_accounts_branch_id", "branch_id"),
+    )
     
     id: Mapped[int] = mapped_column(primary_key=True)
     customer_id: Mapped[int] = mapped_column(ForeignKey("dim_customers.id"))
@@ -47,23 +89,54 @@ class Account(Base):
 
 class Transaction(Base):
     __tablename__ = "fact_transactions"
+    # Range-partitioned by month on timestamp (see app/db/partitions.py), so the
+    # partition key has to be part of the primary key; identity stays on id alone.
+    __table_args__ = (
+        PrimaryKeyConstraint("id", "timestamp", name="fact_transactions_pkey"),
+        Index("ix_fact_transactions_account_id_timestamp", "account_id", "timestamp",
+              postgresql_include=["amount", "category"]),
+        Index("ix_fact_transactions_timestamp", "timestamp",
+              postgresql_include=["category", "amount"]),
+        Index("brin_fact_transactions_timestamp", "timestamp",
+              postgresql_using="brin", postgresql_with={"pages_per_range": 32, "autosummarize": "on"}),
+        {"postgresql_partition_by": "RANGE (timestamp)"},
+    )
     
-    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    id: Mapped[int] = mapped_column(BigInteger, autoincrement=True)
     account_id: Mapped[int] = mapped_column(ForeignKey("dim_accounts.id"))
-    amount: Mapped[float]
+    amount: Mapped[Decimal] = mapped_column(Money)
     category: Mapped[str] = mapped_column(String(100))
     merchant_name: Mapped[Optional[str]] = mapped_column(String(255))
     timestamp: Mapped[datetime] = mapped_column(default=datetime.utcnow)
+
+    __mapper_args__ = {"primary_key": [id]}
     
     account: Mapped["Account"] = relationship(back_populates="transactions")
 
 class DailyBalance(Base):
     __tablename__ = "fact_daily_balances"
+    __table_args__ = (
+        Index("ix_fact_daily_balances_account_id_balance_date", "account_id", "balance_date",
+              postgresql_include=["ending_balance"]),
+        Index("ix_fact_daily_balances_balance_date", "balance_date"),
+        Index("brin_fact_daily_balances_balance_date", "balance_date",
+              postgresql_using="brin", postgresql_with={"pages_per_range": 32, "autosummarize": "on"}),
+    )
     
     id: Mapped[int] = mapped_column(primary_key=True)
     account_id: Mapped[int] = mapped_column(ForeignKey("dim_accounts.id"))
     balance_date: Mapped[date]
-    ending_balance: Mapped[float]
+    ending_balance: Mapped[Decimal] = mapped_column(Money)
+
+class CategoryDaily(Base):
+    __tablename__ = "fact_category_daily"
+    # Maintained by a trigger on fact_transactions, see app/db/rollups.py.
+
+    day: Mapped[date] = mapped_column(primary_key=True)
+    branch_id: Mapped[int] = mapped_column(ForeignKey("dim_branches.id"), primary_key=True)
+    category: Mapped[str] = mapped_column(String(100), primary_key=True)
+    tx_count: Mapped[int] = mapped_column(BigInteger)
+    total: Mapped[Decimal] = mapped_column(Money)
 
 class DateDim(Base):
     __tablename__ = "dim_date"
@@ -74,3 +147,11 @@ class DateDim(Base):
     month: Mapped[int]
     day_of_week: Mapped[str] = mapped_column(String(10))
     is_weekend: Mapped[bool] = mapped_column(default=False)
+
+class SeedCheckpoint(Base):
+    __tablename__ = "seed_checkpoints"
+
+    run_key: Mapped[str] = mapped_column(String(200), primary_key=True)
+    shard: Mapped[int] = mapped_column(primary_key=True) # -1 holds the run's ID bases
+    state: Mapped[Dict[str, Any]] = mapped_column(JSON)
+    updated_at: Mapped[datetime] = mapped_column(default=datetime.utcnow)
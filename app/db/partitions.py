@@ -0,0 +1,113 @@
+"""
+Monthly partition maintenance for ``fact_transactions``.
+
+The table is range-partitioned on ``timestamp`` with one partition per
+calendar month, named ``fact_transactions_pYYYY_MM``, plus a DEFAULT
+partition that only catches rows outside every month created so far.
+Months have to be created before rows for them arrive: once the default
+partition holds rows of a month, that month's partition can no longer be
+created. ``ensure_partitions`` is therefore called by the seeders for
+their date range and by the maintenance job for the months ahead.
+
+All functions take a DB-API cursor and leave committing to the caller.
+"""
+
+import re
+from datetime import date
+from typing import Any, Final, List, Optional, Pattern, Tuple
+
+PARENT: Final[str] = "fact_transactions"
+DEFAULT_PARTITION: Final[str] = "fact_transactions_default"
+MONTHS_AHEAD: Final[int] = 3
+PARTITION_NAME: Final[Pattern[str]] = re.compile(r"^fact_transactions_p(\d{4})_(\d{2})$")
+
+PARTITIONS_SQL: Final[str] = """
+SELECT c.relname
+FROM pg_inherits AS i
+JOIN pg_class AS c ON c.oid = i.inhrelid
+WHERE i.inhparent = %s::regclass
+ORDER BY c.relname
+"""
+
+
+def month_start(day: date) -> date:
+    return day.replace(day=1)
+
+
+def add_months(day: date, months: int) -> date:
+    index: int = day.year * 12 + day.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"{PARENT}_p{month.year:04d}_{month.month:02d}"
+
+
+def partition_month(name: str) -> Optional[date]:
+    match = PARTITION_NAME.match(name)
+    return date(int(match.group(1)), int(match.group(2)), 1) if match else None
+
+
+def is_partitioned(cursor: Any) -> bool:
+    cursor.execute("SELECT relkind = 'p' FROM pg_class WHERE oid = %s::regclass", (PARENT,))
+    row = cursor.fetchone()
+    return bool(row and row[0])
+
+
+def list_partitions(cursor: Any) -> List[str]:
+    cursor.execute(PARTITIONS_SQL, (PARENT,))
+    return [row[0] for row in cursor.fetchall()]
+
+
+def ensure_partitions(cursor: Any, first: date, last: date) -> List[str]:
+    """
+    Create the monthly partitions covering ``first``..``last`` that do not
+    exist yet and return their names. Does nothing on an unpartitioned table.
+    """
+    if not is_partitioned(cursor):
+        return []
+    existing: List[str] = list_partitions(cursor)
+    created: List[str] = []
+    month: date = month_start(first)
+    while month <= last:
+        name: str = partition_name(month)
+        if name not in existing:
+            cursor.execute(
+                f"CREATE TABLE {name} PARTITION OF {PARENT} FOR VALUES FROM (%s) TO (%s)",
+                (month, add_months(month, 1))
+            )
+            created.append(name)
+        month = add_months(month, 1)
+    return created
+
+
+def detach_partitions(cursor: Any, before: date) -> List[str]:
+    """
+    Detach every monthly partition that ends on or before ``before``. The
+    detached tables are kept as standalone tables for archiving or dropping.
+    """
+    detached: List[str] = []
+    for name in list_partitions(cursor):
+        month: Optional[date] = partition_month(name)
+        if month is not None and add_months(month, 1) <= before:
+            cursor.execute(f"ALTER TABLE {PARENT} DETACH PARTITION {name}")
+            detached.append(name)
+    return detached
+
+
+def maintain_partitions(
+    cursor: Any,
+    today: date,
+    months_ahead: int = MONTHS_AHEAD,
+    retain_months: Optional[int] = None
+) -> Tuple[List[str], List[str]]:
+    """
+    Create partitions from the current month through ``months_ahead`` months
+    ahead and, if ``retain_months`` is given, detach partitions older than that.
+    """
+    current: date = month_start(today)
+    created: List[str] = ensure_partitions(cursor, current, add_months(current, months_ahead))
+    detached: List[str] = []
+    if retain_months is not None:
+        detached = detach_partitions(cursor, add_months(current, -retain_months))
+    return created, detached
@@ -0,0 +1,133 @@
+"""
+Connection pool telemetry.
+
+``InstrumentedQueuePool`` is the engine's ``QueuePool`` with counters on
+top: how many checkouts there were, how long callers waited for a
+connection (including the pre-ping), how many gave up after
+``pool_timeout``, how far the pool went into overflow and how old the
+open connections are. ``pool_stats(engine)`` returns a snapshot of them
+together with the pool's own gauges; the main window polls it for the
+status bar.
+
+The counters live on a ``PoolTelemetry`` that is handed on when the pool
+is recreated by ``engine.dispose()``, so they cover the whole process.
+"""
+
+import threading
+import time
+from typing import Any, Dict, NamedTuple, Optional
+
+from sqlalchemy import Engine, event, exc
+from sqlalchemy.pool import PoolProxiedConnection, QueuePool
+
+
+class PoolStats(NamedTuple):
+    size: int
+    checked_out: int
+    idle: int
+    overflow: int
+    peak_overflow: int
+    checkouts: int
+    timeouts: int
+    wait_avg_ms: float
+    wait_max_ms: float
+    connections: int
+    oldest_connection_s: float
+
+    def __str__(self) -> str:
+        return (
+            f"Pool {self.checked_out}/{self.size} +{self.overflow} "
+            f"| wait {self.wait_avg_ms:.1f} ms avg, {self.wait_max_ms:.0f} ms max "
+            f"| oldest conn {self.oldest_connection_s / 60:.0f} min"
+        )
+
+
+class PoolTelemetry:
+    def __init__(self) -> None:
+        self._lock: threading.Lock = threading.Lock()
+        self.checkouts: int = 0
+        self.timeouts: int = 0
+        self.wait_total: float = 0.0
+        self.wait_max: float = 0.0
+        self.peak_overflow: int = 0
+        # id() of each open DBAPI connection -> when it was opened
+        self.opened: Dict[int, float] = {}
+
+    def listen(self, pool: QueuePool) -> None:
+        event.listen(pool, "connect", self._on_connect)
+        event.listen(pool, "close", self._on_close)
+        event.listen(pool, "close_detached", self._on_close_detached)
+
+    def _on_connect(self, dbapi_connection: Any, connection_record: Any) -> None:
+        with self._lock:
+            self.opened[id(dbapi_connection)] = time.monotonic()
+
+    def _on_close(self, dbapi_connection: Any, connection_record: Any) -> None:
+        with self._lock:
+            self.opened.pop(id(dbapi_connection), None)
+
+    def _on_close_detached(self, dbapi_connection: Any) -> None:
+        with self._lock:
+            self.opened.pop(id(dbapi_connection), None)
+
+    def record_checkout(self, waited: float, overflow: int) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.wait_total += waited
+            self.wait_max = max(self.wait_max, waited)
+            self.peak_overflow = max(self.peak_overflow, overflow)
+
+    def record_timeout(self) -> None:
+        with self._lock:
+            self.timeouts += 1
+
+
+class InstrumentedQueuePool(QueuePool):
+    def __init__(self, creator: Any, **kw: Any) -> None:
+        super().__init__(creator, **kw)
+        self.telemetry: PoolTelemetry = PoolTelemetry()
+        # A recreated pool copies the listeners of the old one, and with them its telemetry.
+        if "_dispatch" not in kw:
+            self.telemetry.listen(self)
+
+    def recreate(self) -> "InstrumentedQueuePool":
+        pool = super().recreate()
+        pool.telemetry = self.telemetry
+        return pool
+
+    def connect(self) -> PoolProxiedConnection:
+        started: float = time.perf_counter()
+        try:
+            conn = super().connect()
+        except exc.TimeoutError:
+            self.telemetry.record_timeout()
+            raise
+        self.telemetry.record_checkout(time.perf_counter() - started, self.overflow())
+        return conn
+
+    def stats(self) -> PoolStats:
+        telemetry: PoolTelemetry = self.telemetry
+        now: float = time.monotonic()
+        with telemetry._lock:
+            opened = list(telemetry.opened.values())
+            checkouts: int = telemetry.checkouts
+            return PoolStats(
+                size=self.size(),
+                checked_out=self.checkedout(),
+                idle=self.checkedin(),
+                # QueuePool counts overflow from -pool_size
+                overflow=max(self.overflow(), 0),
+                peak_overflow=telemetry.peak_overflow,
+                checkouts=checkouts,
+                timeouts=telemetry.timeouts,
+                wait_avg_ms=telemetry.wait_total / checkouts * 1000 if checkouts else 0.0,
+                wait_max_ms=telemetry.wait_max * 1000,
+                connections=len(opened),
+                oldest_connection_s=now - min(opened) if opened else 0.0,
+            )
+
+
+def pool_stats(engine: Engine) -> Optional[PoolStats]:
+    """Current telemetry of ``engine``'s pool, or None if it is not an ``InstrumentedQueuePool``."""
+    pool = engine.pool
+    return pool.stats() if isinstance(pool, InstrumentedQueuePool) else None
@@ -0,0 +1,70 @@
+"""
+Named dataset profiles for the seeders.
+
+A profile fixes every size knob of a generated dataset. Together with a
+seed and an end date it fully determines the generated rows, so benchmark
+runs on different machines or commits see byte-identical data.
+"""
+
+from typing import Dict, Final, NamedTuple
+
+
+class SeedProfile(NamedTuple):
+    name: str
+    num_branches: int
+    num_customers: int
+    min_accounts_per_customer: int
+    max_accounts_per_customer: int
+    days_of_history: int
+    max_tx_per_day: int
+    shards: int
+
+
+DEMO: Final[SeedProfile] = SeedProfile(
+    name="demo",
+    num_branches=5,
+    num_customers=50,
+    min_accounts_per_customer=1,
+    max_accounts_per_customer=2,
+    days_of_history=30,
+    max_tx_per_day=4,
+    shards=1
+)
+
+SF1: Final[SeedProfile] = SeedProfile(
+    name="SF1",
+    num_branches=10,
+    num_customers=5_000,
+    min_accounts_per_customer=1,
+    max_accounts_per_customer=3,
+    days_of_history=365,
+    max_tx_per_day=4,
+    shards=8
+)
+
+SF10: Final[SeedProfile] = SF1._replace(
+    name="SF10",
+    num_branches=50,
+    num_customers=50_000,
+    shards=32
+)
+
+SF100: Final[SeedProfile] = SF1._replace(
+    name="SF100",
+    num_branches=200,
+    num_customers=500_000,
+    shards=128
+)
+
+PROFILES: Final[Dict[str, SeedProfile]] = {
+    p.name: p for p in (DEMO, SF1, SF10, SF100)
+}
+
+
+def get_profile(name: str) -> SeedProfile:
+    try:
+        return PROFILES[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown seed profile '{name}'. Available: {', '.join(PROFILES)}"
+        ) from None
@@ -0,0 +1,79 @@
+"""
+Daily category rollup of ``fact_transactions``.
+
+``fact_category_daily`` holds one row per (day, branch, category) with
+the transaction count and amount total. Statement-level triggers
+(revisions 0e1db4a54bf4 and 7588b04de541) fold every INSERT, UPDATE and
+DELETE on ``fact_transactions`` into it, so it stays exact for ORM writes,
+batched inserts and COPY alike.
+
+Bulk loaders run many concurrent transactions that would all update the
+same rollup rows, so they switch the trigger off for their connection
+with ``suspend_rollups`` and ``finalize_load`` rebuilds the table from
+the facts once they are done. TRUNCATE and detaching old partitions are
+not folded in and leave their days in the rollup.
+
+The trigger does not remove contention for live writers. Each statement
+aggregates its rows before the upsert, so a batch takes each rollup row
+lock once. But every transaction posted today for a branch and category
+updates the same row, so concurrent single-row writers (the service
+path, ``loadgen`` with ``--via service``) wait for each other's commit
+on those few hot rows. Their commit latency includes that wait;
+batching, as ``loadgen`` does by default, amortises it.
+"""
+
+from datetime import date, datetime, time, timedelta
+from typing import Any, Final, Optional, Tuple
+
+CATEGORY_DAILY: Final[str] = "fact_category_daily"
+SKIP_SETTING: Final[str] = "hd.skip_category_rollup"
+
+REBUILD_SQL: Final[str] = """
+INSERT INTO fact_category_daily (day, branch_id, category, tx_count, total)
+SELECT t.timestamp::date, a.branch_id, t.category, count(*), sum(t.amount)
+FROM fact_transactions AS t
+JOIN dim_accounts AS a ON a.id = t.account_id
+GROUP BY 1, 2, 3
+"""
+
+
+def suspend_rollups(conn: Any) -> None:
+    """Stop the rollup trigger for this connection until ``resume_rollups``."""
+    conn.cursor().execute(f"SET {SKIP_SETTING} = on")
+    # A SET inside a transaction that is rolled back is undone with it.
+    conn.commit()
+
+
+def resume_rollups(conn: Any) -> None:
+    conn.cursor().execute(f"RESET {SKIP_SETTING}")
+    conn.commit()
+
+
+def abandon_rollups(conn: Any) -> None:
+    """
+    Roll back a failed load and resume the trigger. Errors are swallowed so
+    the load's own exception propagates; the connection is invalidated
+    instead, so the setting cannot leak back into the pool.
+    """
+    try:
+        conn.rollback()
+        resume_rollups(conn)
+    except Exception:
+        conn.invalidate()
+
+
+def rebuild_category_daily(cursor: Any) -> int:
+    """Recompute the whole rollup from ``fact_transactions`` and return its row count."""
+    cursor.execute(f"TRUNCATE {CATEGORY_DAILY}")
+    cursor.execute(REBUILD_SQL)
+    return cursor.rowcount
+
+
+def whole_days(start: datetime, end: datetime) -> Optional[Tuple[date, date]]:
+    """
+    The first and last calendar day lying entirely inside ``start``..``end``
+    (both inclusive), or None when the range covers no whole day.
+    """
+    first: date = start.date() if start.time() == time.min else start.date() + timedelta(days=1)
+    last: date = (end + timedelta(microseconds=1)).date() - timedelta(days=1)
+    return (first, last) if first <= last else None
@@ -0,0 +1,114 @@
+"""
+Read-replica routing.
+
+``RoutingSession`` sends plain SELECTs to the read replicas configured in
+``DB_REPLICA_URLS``, round-robin, and everything else to the primary:
+flushes, INSERT/UPDATE/DELETE, ``SELECT ... FOR UPDATE`` and textual SQL,
+which may be DDL or a write.
+
+Replicas lag behind the primary, so reads go to the primary as well
+
+* for the rest of a transaction that has already written, locked or run
+  textual SQL on the primary, so it keeps seeing its own changes,
+* for ``DB_REPLICA_STICKY_SECONDS`` after any session of the process
+  committed a write, so a refresh right after posting a transaction finds
+  it, even when it reads through a different session (``ReadOnlyService``
+  opens one per call),
+* in ``Session.refresh`` and inside ``with session.primary():``.
+
+Without replicas every statement goes to the primary, as before.
+"""
+
+import itertools
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator, List, Optional, Sequence
+
+from sqlalchemy import Engine, Select, event
+from sqlalchemy.orm import Session
+
+
+class ReplicaSet:
+    """
+    Replica engines handed out round-robin, shared by all sessions of a
+    process, together with the time of the process's last committed write.
+    """
+
+    def __init__(self, engines: Sequence[Engine]) -> None:
+        self.engines: List[Engine] = list(engines)
+        self._cycle: Iterator[Engine] = itertools.cycle(self.engines)
+        self._lock: threading.Lock = threading.Lock()
+        self._last_write: float = float("-inf")
+
+    def __bool__(self) -> bool:
+        return bool(self.engines)
+
+    def next(self) -> Engine:
+        with self._lock:
+            return next(self._cycle)
+
+    def mark_write(self) -> None:
+        self._last_write = time.monotonic()
+
+    def wrote_within(self, seconds: float) -> bool:
+        """Whether a session of this process committed a write less than ``seconds`` ago."""
+        return time.monotonic() - self._last_write < seconds
+
+
+class RoutingSession(Session):
+    def __init__(
+        self,
+        *args: Any,
+        replicas: Optional[ReplicaSet] = None,
+        sticky_seconds: float = 0.0,
+        **kw: Any
+    ) -> None:
+        super().__init__(*args, **kw)
+        self.replicas: Optional[ReplicaSet] = replicas
+        self.sticky_seconds: float = sticky_seconds
+        self._wrote: bool = False
+        self._force_primary: int = 0
+
+    @contextmanager
+    def primary(self) -> Iterator["RoutingSession"]:
+        """Route every statement in the block to the primary."""
+        self._force_primary += 1
+        try:
+            yield self
+        finally:
+            self._force_primary -= 1
+
+    def refresh(self, instance: object, *args: Any, **kw: Any) -> None:
+        with self.primary():
+            super().refresh(instance, *args, **kw)
+
+    def _is_plain_read(self, clause: Any) -> bool:
+        return isinstance(clause, Select) and clause._for_update_arg is None and not self._flushing
+
+    def _reads_from_replica(self) -> bool:
+        return (
+            not self._wrote
+            and not self._force_primary
+            and not self.replicas.wrote_within(self.sticky_seconds)
+        )
+
+    def get_bind(self, mapper: Any = None, clause: Any = None, **kw: Any) -> Engine:
+        if self.replicas:
+            if not self._is_plain_read(clause):
+                self._wrote = True
+            elif self._reads_from_replica():
+                return self.replicas.next()
+        return super().get_bind(mapper, clause=clause, **kw)
+
+
+@event.listens_for(RoutingSession, "after_commit")
+def _remember_write(session: RoutingSession) -> None:
+    if session._wrote and session.replicas is not None:
+        session.replicas.mark_write()
+
+
+@event.listens_for(RoutingSession, "after_transaction_end")
+def _release_primary(session: RoutingSession, transaction: Any) -> None:
+    if transaction.parent is None:
+        session._wrote = False
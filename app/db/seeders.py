@@ -1,23 +1,27 @@
 import random
 from datetime import datetime, timedelta, date
-from typing import List, Final
+from decimal import Decimal
+from typing import List, Final, Optional
 from faker import Faker
 from sqlalchemy.orm import Session
 
 from app.db.models import (
-    Customer, Branch, Account, Transaction, 
+    Customer, Branch, Account, Transaction,
     DailyBalance, DateDim, AccountType
 )
+from app.db.profiles import SeedProfile, DEMO
+from app.db.partitions import ensure_partitions
 
-NUM_BRANCHES: Final[int] = 5
-NUM_CUSTOMERS: Final[int] = 50
-DAYS_OF_HISTORY: Final[int] = 30
+REGIONS: Final[List[str]] = ["North", "South", "East", "West", "HQ"]
+SEGMENTS: Final[List[str]] = ["Retail", "Corporate", "Wealth Management", "SME"]
+CATEGORIES: Final[List[str]] = ["Groceries", "Salary", "Rent", "Dining", "Investment", "Transfer"]
 
 fake: Faker = Faker()
 
-def seed_date_dimension(db: Session) -> None:
-    start_date: date = date.today() - timedelta(days=365)
-    for i in range(367):
+def seed_date_dimension(db: Session, end_date: Optional[date] = None, days: int = 365) -> None:
+    end_date = end_date or date.today()
+    start_date: date = end_date - timedelta(days=max(days, 365))
+    for i in range((end_date - start_date).days + 2):
         curr: date = start_date + timedelta(days=i)
         date_entry = DateDim(
             date_key=curr,
@@ -30,72 +34,93 @@ def seed_date_dimension(db: Session) -> None:
         db.add(date_entry)
     print("Date Dimension populated.")
 
-def seed_banking_system(db: Session) -> None:
-    regions: List[str] = ["North", "South", "East", "West", "HQ"]
+def seed_banking_system(
+    db: Session,
+    profile: SeedProfile = DEMO,
+    seed: Optional[int] = None,
+    end_date: Optional[date] = None
+) -> None:
+    rnd: random.Random = random.Random(seed)
+    fake.seed_instance(seed)
+    fake.unique.clear()
+    end_date = end_date or date.today()
+    created_at: datetime = datetime.combine(end_date, datetime.min.time())
+
+    # Work is committed per customer and the session cleared, so a failure keeps
+    # everything before it and memory does not grow with the dataset.
     branches: List[Branch] = []
-    for _ in range(NUM_BRANCHES):
+    for _ in range(profile.num_branches):
         branch = Branch(
             branch_name=f"{fake.city()} Center",
             branch_code=fake.unique.bothify(text='BR-####'),
-            region=random.choice(regions)
+            region=rnd.choice(REGIONS)
         )
         db.add(branch)
         branches.append(branch)
-    
+
     db.flush()
+    branch_ids: List[int] = [branch.id for branch in branches]
 
-    segments: List[str] = ["Retail", "Corporate", "Wealth Management", "SME"]
     customers: List[Customer] = []
-    for _ in range(NUM_CUSTOMERS):
+    for _ in range(profile.num_customers):
         customer = Customer(
             full_name=fake.name(),
             email=fake.unique.email(),
-            credit_score=random.randint(300, 850),
-            customer_segment=random.choice(segments)
+            credit_score=rnd.randint(300, 850),
+            customer_segment=rnd.choice(SEGMENTS),
+            created_at=created_at
         )
         db.add(customer)
         customers.append(customer)
-    
+
     db.flush()
+    customer_ids: List[int] = [customer.id for customer in customers]
+    ensure_partitions(
+        db.connection().connection.cursor(),
+        (created_at - timedelta(days=profile.days_of_history)).date(),
+        end_date
+    )
+    db.commit()
+    db.expunge_all()
 
-    categories: List[str] = ["Groceries", "Salary", "Rent", "Dining", "Investment", "Transfer"]
-    
-    for cust in customers:
-        for _ in range(random.randint(1, 2)):
+    for customer_id in customer_ids:
+        for _ in range(rnd.randint(profile.min_accounts_per_customer, profile.max_accounts_per_customer)):
             account = Account(
-                customer_id=cust.id,
-                branch_id=random.choice(branches).id,
+                customer_id=customer_id,
+                branch_id=rnd.choice(branch_ids),
                 account_number=fake.unique.iban(),
-                account_type=random.choice(list(AccountType)).value,
+                account_type=rnd.choice(list(AccountType)).value,
                 is_active=True
             )
             db.add(account)
             db.flush()
 
-            running_balance: float = random.uniform(5000.0, 20000.0)
-            
-            for d in range(DAYS_OF_HISTORY):
-                current_date: datetime = datetime.now() - timedelta(days=d)
-                
-                for _ in range(random.randint(0, 4)):
-                    amount: float = round(random.uniform(-1000.0, 1500.0), 2)
+            running_balance: Decimal = Decimal(str(round(rnd.uniform(5000.0, 20000.0), 2)))
+
+            for d in range(profile.days_of_history):
+                current_date: datetime = created_at - timedelta(days=d)
+
+                for _ in range(rnd.randint(0, profile.max_tx_per_day)):
+                    amount: Decimal = Decimal(str(round(rnd.uniform(-1000.0, 1500.0), 2)))
                     running_balance += amount
-                    
+
                     tx = Transaction(
                         account_id=account.id,
                         amount=amount,
-                        category=random.choice(categories),
+                        category=rnd.choice(CATEGORIES),
                         merchant_name=fake.company(),
-                        timestamp=current_date
+                        timestamp=current_date + timedelta(seconds=rnd.randrange(86_400))
                     )
                     db.add(tx)
-                
+
                 balance_snapshot = DailyBalance(
                     account_id=account.id,
                     balance_date=current_date.date(),
-                    ending_balance=round(running_balance, 2)
+                    ending_balance=running_balance
                 )
                 db.add(balance_snapshot)
 
-    db.commit()
-    print(f"Successfully seeded {NUM_CUSTOMERS} customers and their financial history.")
+        db.commit()
+        db.expunge_all()
+
+    print(f"Successfully seeded {profile.num_customers} customers and their financial history.")
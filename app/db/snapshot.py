@@ -0,0 +1,211 @@
+"""
+Parquet snapshots of a seeded dataset.
+
+``write_snapshot`` streams every warehouse table into one Parquet file
+through a server-side cursor, so client memory is bounded by the batch
+size. ``restore_snapshot`` loads such a directory into an empty schema
+through COPY. Constraints and indexes are dropped before the load and
+rebuilt once afterwards, which is much cheaper than maintaining them for
+every row.
+"""
+
+import io
+import json
+import time
+from pathlib import Path
+from datetime import datetime
+from typing import Any, Dict, Final, List, Optional, Tuple
+
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+
+from app.db.base import engine
+from app.db.bulk import ThroughputMeter, CHUNK_ROWS, finalize_load
+from app.db.partitions import ensure_partitions
+from app.db.rollups import suspend_rollups, resume_rollups, abandon_rollups
+
+SNAPSHOT_TABLES: Final[Tuple[str, ...]] = (
+    "dim_date", "dim_branches", "dim_customers", "dim_accounts",
+    "fact_transactions", "fact_daily_balances", "fact_category_daily"
+)
+MANIFEST: Final[str] = "manifest.json"
+
+ARROW_TYPES: Final[Dict[str, pa.DataType]] = {
+    "smallint": pa.int16(),
+    "integer": pa.int32(),
+    "bigint": pa.int64(),
+    "double precision": pa.float64(),
+    "real": pa.float32(),
+    "numeric": pa.string(),
+    "boolean": pa.bool_(),
+    "date": pa.date32(),
+    "timestamp without time zone": pa.timestamp("us"),
+    "timestamp with time zone": pa.timestamp("us", tz="UTC"),
+}
+
+# Foreign keys go first and come back last, since they depend on the primary and unique keys.
+CONSTRAINTS_SQL: Final[str] = """
+SELECT conname, pg_get_constraintdef(oid), contype = 'f' AS is_foreign
+FROM pg_constraint
+WHERE conrelid = %s::regclass AND contype IN ('p', 'u', 'f')
+ORDER BY is_foreign DESC
+"""
+
+INDEXES_SQL: Final[str] = """
+SELECT i.indexname, i.indexdef
+FROM pg_indexes AS i
+WHERE i.schemaname = current_schema() AND i.tablename = %s
+  AND NOT EXISTS (SELECT 1 FROM pg_constraint AS c WHERE c.conname = i.indexname)
+"""
+
+
+def _schema(cursor: Any, table: str) -> pa.Schema:
+    cursor.execute(
+        "SELECT column_name, data_type FROM information_schema.columns "
+        "WHERE table_schema = current_schema() AND table_name = %s ORDER BY ordinal_position",
+        (table,)
+    )
+    return pa.schema([
+        pa.field(name, ARROW_TYPES.get(data_type, pa.string())) for name, data_type in cursor.fetchall()
+    ])
+
+
+def _alembic_revision(cursor: Any) -> str:
+    cursor.execute("SELECT version_num FROM alembic_version")
+    row = cursor.fetchone()
+    return row[0] if row else ""
+
+
+def write_snapshot(directory: str, batch_rows: int = CHUNK_ROWS) -> ThroughputMeter:
+    """Write every table in ``SNAPSHOT_TABLES`` to ``<directory>/<table>.parquet``."""
+    target: Path = Path(directory)
+    target.mkdir(parents=True, exist_ok=True)
+    meter: ThroughputMeter = ThroughputMeter()
+    manifest: Dict[str, Any] = {"tables": {}}
+
+    conn = engine.raw_connection()
+    try:
+        cursor = conn.cursor()
+        manifest["alembic_revision"] = _alembic_revision(cursor)
+        for table in SNAPSHOT_TABLES:
+            schema: pa.Schema = _schema(cursor, table)
+            started: float = time.perf_counter()
+            rows: int = 0
+            stream = conn.cursor(name=f"snapshot_{table}")
+            stream.itersize = batch_rows
+            stream.execute(f"SELECT {', '.join(schema.names)} FROM {table} ORDER BY 1")
+            with pq.ParquetWriter(target / f"{table}.parquet", schema) as writer:
+                while batch := stream.fetchmany(batch_rows):
+                    columns: List[Tuple[Any, ...]] = list(zip(*batch))
+                    writer.write_table(pa.Table.from_arrays(
+                        [pa.array(values, type=field.type) for values, field in zip(columns, schema)],
+                        schema=schema
+                    ))
+                    rows += len(batch)
+            stream.close()
+            meter.record(table, rows, time.perf_counter() - started)
+            manifest["tables"][table] = rows
+        conn.commit()
+    finally:
+        conn.close()
+
+    (target / MANIFEST).write_text(json.dumps(manifest, indent=2))
+    return meter
+
+
+def _column_range(path: Path, column: str) -> Optional[Tuple[Any, Any]]:
+    """Min and max of ``column`` from the row-group statistics, without reading the data."""
+    metadata: pq.FileMetaData = pq.ParquetFile(path).metadata
+    index: int = metadata.schema.names.index(column)
+    stats: List[Any] = [
+        metadata.row_group(i).column(index).statistics for i in range(metadata.num_row_groups)
+    ]
+    stats = [s for s in stats if s is not None and s.has_min_max]
+    if not stats:
+        return None
+    return min(s.min for s in stats), max(s.max for s in stats)
+
+
+def _drop_constraints_and_indexes(cursor: Any, tables: Tuple[str, ...]) -> List[str]:
+    """Drop constraints and secondary indexes, returning the DDL that rebuilds them in order."""
+    foreign: List[Tuple[str, str]] = []
+    keys: List[Tuple[str, str]] = []
+    indexes: List[str] = []
+    for table in tables:
+        cursor.execute(CONSTRAINTS_SQL, (table,))
+        for name, definition, is_foreign in cursor.fetchall():
+            (foreign if is_foreign else keys).append(
+                (f"ALTER TABLE {table} DROP CONSTRAINT {name}",
+                 f"ALTER TABLE {table} ADD CONSTRAINT {name} {definition}")
+            )
+        cursor.execute(INDEXES_SQL, (table,))
+        for name, definition in cursor.fetchall():
+            cursor.execute(f"DROP INDEX {name}")
+            # Partitioned parents report "ON ONLY"; rebuild on every partition instead.
+            indexes.append(definition.replace(" ON ONLY ", " ON ", 1))
+    for drop, _ in foreign + keys:
+        cursor.execute(drop)
+    return [create for _, create in keys] + indexes + [create for _, create in foreign]
+
+
+def restore_snapshot(directory: str, batch_rows: int = CHUNK_ROWS) -> ThroughputMeter:
+    """
+    Load a snapshot written by ``write_snapshot`` into empty tables through
+    COPY and rebuild constraints and indexes afterwards, all in one transaction.
+    """
+    source: Path = Path(directory)
+    manifest: Dict[str, Any] = json.loads((source / MANIFEST).read_text())
+    meter: ThroughputMeter = ThroughputMeter()
+
+    conn = engine.raw_connection()
+    try:
+        suspend_rollups(conn)
+        cursor = conn.cursor()
+        revision: str = _alembic_revision(cursor)
+        if manifest["alembic_revision"] != revision:
+            raise ValueError(
+                f"Snapshot was taken at schema revision '{manifest['alembic_revision']}', "
+                f"database is at '{revision}'"
+            )
+        for table in SNAPSHOT_TABLES:
+            cursor.execute(f"SELECT EXISTS (SELECT 1 FROM {table})")
+            if cursor.fetchone()[0]:
+                raise ValueError(f"Table {table} is not empty; restore needs an empty schema")
+
+        bounds: Optional[Tuple[datetime, datetime]] = _column_range(source / "fact_transactions.parquet", "timestamp")
+        if bounds is not None:
+            ensure_partitions(cursor, bounds[0].date(), bounds[1].date())
+
+        cursor.execute("SET LOCAL maintenance_work_mem = '1GB'")
+        rebuild: List[str] = _drop_constraints_and_indexes(cursor, SNAPSHOT_TABLES)
+
+        for table in SNAPSHOT_TABLES:
+            parquet: pq.ParquetFile = pq.ParquetFile(source / f"{table}.parquet")
+            copy_sql: str = (
+                f"COPY {table} ({', '.join(parquet.schema_arrow.names)}) "
+                f"FROM STDIN WITH (FORMAT csv, HEADER true)"
+            )
+            for batch in parquet.iter_batches(batch_size=batch_rows):
+                started: float = time.perf_counter()
+                buffer: io.BytesIO = io.BytesIO()
+                pa_csv.write_csv(batch, buffer)
+                buffer.seek(0)
+                cursor.copy_expert(copy_sql, buffer)
+                meter.record(table, batch.num_rows, time.perf_counter() - started)
+
+        started = time.perf_counter()
+        for ddl in rebuild:
+            cursor.execute(ddl)
+        conn.commit()
+        print(f"   {len(rebuild)} constraints and indexes rebuilt in {time.perf_counter() - started:.1f}s")
+        resume_rollups(conn)
+    except Exception:
+        abandon_rollups(conn)
+        raise
+    finally:
+        conn.close()
+
+    # fact_category_daily is part of the snapshot, so it needs no rebuild.
+    finalize_load(rebuild_rollups=False)
+    return meter
@@ -0,0 +1,338 @@
+"""
+Server-side, set-based seeder.
+
+Generates the whole star schema inside PostgreSQL with ``generate_series``
+so no row ever crosses the wire. It takes the same profile, distribution
+parameters and identity pools as the COPY seeder. Sampling is done with
+SQL primitives, so the data has the same shape but is not row-for-row
+identical to the Python generators: Poisson day counts become stochastic
+rounding of the same rate, and lognormal amounts use Box-Muller.
+
+Runs on a single connection with parallel query disabled, so ``setseed``
+makes a run reproducible for a given seed and end date.
+"""
+
+import time
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Final, List, Optional
+
+import numpy as np
+from numpy.typing import NDArray
+from faker import Faker
+
+from app.db.base import engine
+from app.db.bulk import ThroughputMeter, CHUNK_ROWS, next_id, finalize_load
+from app.db.rollups import suspend_rollups, resume_rollups, abandon_rollups
+from app.db.distributions import (
+    DistributionParams, UNIFORM, CATEGORY_WEIGHTS, CATEGORY_AMOUNTS, zipf_weights
+)
+from app.db.identities import IdentityPools, iban_checksum_terms, BANK_CODE, IBAN_COUNTRY, IBAN_DIGITS
+from app.db.models import AccountType
+from app.db.partitions import ensure_partitions
+from app.db.profiles import SeedProfile, DEMO
+from app.db.seeders import REGIONS, SEGMENTS, CATEGORIES
+
+CUSTOMER_BATCH: Final[int] = 100_000
+
+DATE_SQL: Final[str] = """
+INSERT INTO dim_date (date_key, year, quarter, month, day_of_week, is_weekend)
+SELECT d::date, extract(year FROM d), extract(quarter FROM d), extract(month FROM d),
+       to_char(d, 'FMDay'), extract(isodow FROM d) >= 6
+FROM generate_series(%(start)s::date, %(end)s::date, interval '1 day') AS d
+ON CONFLICT (date_key) DO NOTHING
+"""
+
+BRANCH_SQL: Final[str] = """
+INSERT INTO dim_branches (id, branch_name, branch_code, region)
+SELECT id,
+       (%(cities)s::text[])[1 + floor(random() * %(n_cities)s)::int] || ' Center',
+       'BR-' || lpad(id::text, greatest(4, length(id::text)), '0'),
+       (%(regions)s::text[])[width_bucket(random(), %(region_thresholds)s::float8[])]
+FROM generate_series(%(lo)s, %(hi)s) AS id
+"""
+
+CUSTOMER_SQL: Final[str] = """
+INSERT INTO dim_customers (id, full_name, email, credit_score, customer_segment, created_at)
+SELECT id,
+       first_name || ' ' || last_name,
+       replace(replace(lower(first_name || '.' || last_name), ' ', ''), '''', '') || id || '@' || domain,
+       score, segment, %(created_at)s
+FROM (
+    SELECT id,
+           (%(first_names)s::text[])[1 + floor(random() * %(n_first)s)::int] AS first_name,
+           (%(last_names)s::text[])[1 + floor(random() * %(n_last)s)::int] AS last_name,
+           (%(domains)s::text[])[1 + floor(random() * %(n_domains)s)::int] AS domain,
+           300 + floor(random() * 551)::int AS score,
+           (%(segments)s::text[])[1 + floor(random() * %(n_segments)s)::int] AS segment
+    FROM generate_series(%(lo)s, %(hi)s) AS id
+) AS c
+"""
+
+ACCOUNT_SQL: Final[str] = """
+INSERT INTO dim_accounts (id, customer_id, branch_id, account_number, account_type, is_active)
+SELECT id, customer_id, branch_id,
+       %(country)s
+           || lpad((98 - (%(bank_term)s + (id %% 97) * %(id_factor)s + %(country_term)s) %% 97)::text, 2, '0')
+           || %(bank_code)s || lpad(id::text, %(iban_digits)s, '0'),
+       account_type, true
+FROM (
+    SELECT %(base)s - 1 + row_number() OVER (ORDER BY c.id, k) AS id,
+           c.id AS customer_id,
+           %(branch_base)s - 1 + width_bucket(random(), %(branch_thresholds)s::float8[]) AS branch_id,
+           (%(account_types)s::text[])[1 + floor(random() * %(n_types)s)::int] AS account_type
+    FROM (
+        SELECT id, %(min_accounts)s + floor(random() * (%(max_accounts)s - %(min_accounts)s + 1))::int AS n
+        FROM dim_customers
+        WHERE id BETWEEN %(lo)s AND %(hi)s
+    ) AS c
+    CROSS JOIN LATERAL generate_series(1, c.n) AS k
+) AS a
+"""
+
+ACTIVITY_SQL: Final[str] = """
+CREATE TEMP TABLE seed_activity ON COMMIT PRESERVE ROWS AS
+SELECT account_id, weight * count(*) OVER () / sum(weight) OVER () AS activity
+FROM (
+    SELECT account_id,
+           CASE WHEN rnk > total - %(dormant)s THEN 0 ELSE power(rnk, -%(zipf)s) END AS weight
+    FROM (
+        SELECT a.id AS account_id,
+               row_number() OVER (ORDER BY (c.customer_segment = 'Corporate') DESC, random()) AS rnk,
+               count(*) OVER () AS total
+        FROM dim_accounts AS a
+        JOIN dim_customers AS c ON c.id = a.customer_id
+        WHERE a.id BETWEEN %(lo)s AND %(hi)s
+    ) AS ranked
+) AS weighted
+"""
+
+UNIFORM_TRANSACTION_SQL: Final[str] = """
+INSERT INTO fact_transactions (account_id, amount, category, merchant_name, timestamp)
+SELECT c.account_id,
+       round((random() * 2500 - 1000) * 100)::bigint,
+       (%(categories)s::text[])[1 + floor(random() * %(n_categories)s)::int],
+       (%(companies)s::text[])[1 + floor(random() * %(n_companies)s)::int],
+       c.d + random() * interval '1 day'
+FROM (
+    SELECT a.id AS account_id, d, floor(random() * (%(max_tx)s + 1))::int AS n
+    FROM dim_accounts AS a
+    CROSS JOIN generate_series(%(start)s::timestamp, %(end)s::timestamp, interval '1 day') AS d
+    WHERE a.id BETWEEN %(lo)s AND %(hi)s
+) AS c
+CROSS JOIN LATERAL generate_series(1, c.n) AS k
+"""
+
+SKEWED_TRANSACTION_SQL: Final[str] = """
+WITH days AS (
+    SELECT d, month_end, factor / avg(factor) OVER () AS factor
+    FROM (
+        SELECT d, month_end,
+               CASE WHEN month_end THEN 1 + %(month_end_boost)s ELSE 1 END
+               * CASE WHEN extract(isodow FROM d) >= 6 THEN %(weekend_factor)s ELSE 1 END AS factor
+        FROM (
+            SELECT d, (date_trunc('month', d) + interval '1 month')::date - d::date <= %(month_end_days)s AS month_end
+            FROM generate_series(%(start)s::timestamp, %(end)s::timestamp, interval '1 day') AS d
+        ) AS calendar
+    ) AS weighted
+),
+counts AS (
+    SELECT s.account_id, days.d, days.month_end, rate,
+           least(floor(rate) + (random() < rate - floor(rate))::int, %(cap)s)::int AS n
+    FROM seed_activity AS s
+    CROSS JOIN days
+    CROSS JOIN LATERAL (SELECT %(mean_tx)s * s.activity * days.factor AS rate) AS r
+    WHERE s.account_id BETWEEN %(lo)s AND %(hi)s
+),
+tx AS (
+    SELECT c.account_id, c.d,
+           width_bucket(
+               random(),
+               CASE WHEN c.month_end THEN %(payroll_thresholds)s::float8[] ELSE %(ordinary_thresholds)s::float8[] END
+           ) AS cat
+    FROM counts AS c
+    CROSS JOIN LATERAL generate_series(1, c.n) AS k
+)
+INSERT INTO fact_transactions (account_id, amount, category, merchant_name, timestamp)
+SELECT account_id,
+       round(
+           (%(medians)s::float8[])[cat]
+           * exp(%(sigma)s * sqrt(-2 * ln(1 - random())) * cos(2 * pi() * random()))
+           * CASE (%(flows)s::int[])[cat] WHEN 0 THEN sign(random() - 0.5) ELSE (%(flows)s::int[])[cat] END
+           * 100
+       )::bigint,
+       (%(categories)s::text[])[cat],
+       (%(companies)s::text[])[1 + floor(random() * %(n_companies)s)::int],
+       d + random() * interval '1 day'
+FROM tx
+"""
+
+BALANCE_SQL: Final[str] = """
+INSERT INTO fact_daily_balances (account_id, balance_date, ending_balance)
+SELECT a.id, d::date,
+       (a.opening + sum(coalesce(t.net, 0)) OVER (PARTITION BY a.id ORDER BY d))::bigint
+FROM (
+    SELECT id, round((5000 + random() * 15000) * 100)::bigint AS opening
+    FROM dim_accounts
+    WHERE id BETWEEN %(lo)s AND %(hi)s
+) AS a
+CROSS JOIN generate_series(%(start)s::date, %(end)s::date, interval '1 day') AS d
+LEFT JOIN (
+    SELECT account_id, timestamp::date AS day, sum(amount) AS net
+    FROM fact_transactions
+    WHERE account_id BETWEEN %(lo)s AND %(hi)s
+    GROUP BY account_id, timestamp::date
+) AS t ON t.account_id = a.id AND t.day = d::date
+"""
+
+
+def _thresholds(n: int, s: float) -> List[float]:
+    """Lower bucket bounds for ``width_bucket(random(), ...)`` picking 1..n with Zipf(s) weights."""
+    weights: NDArray[np.float64] = zipf_weights(n, s) if s > 0.0 else np.ones(n)
+    return [0.0] + np.cumsum(weights / weights.sum())[:-1].tolist()
+
+
+def _category_thresholds(column: int) -> List[float]:
+    weights: NDArray[np.float64] = np.array([CATEGORY_WEIGHTS[c][column] for c in CATEGORIES])
+    return [0.0] + np.cumsum(weights / weights.sum())[:-1].tolist()
+
+
+def _execute(cursor: Any, meter: ThroughputMeter, table: str, sql: str, params: Dict[str, Any]) -> int:
+    started: float = time.perf_counter()
+    cursor.execute(sql, params)
+    meter.record(table, cursor.rowcount, time.perf_counter() - started)
+    return cursor.rowcount
+
+
+def seed_banking_system_sql(
+    profile: SeedProfile = DEMO,
+    distribution: DistributionParams = UNIFORM,
+    seed: int = 0,
+    end_date: Optional[date] = None,
+    chunk_rows: int = CHUNK_ROWS
+) -> ThroughputMeter:
+    end_date = end_date or date.today()
+    start_date: date = end_date - timedelta(days=profile.days_of_history - 1)
+    fake: Faker = Faker()
+    fake.seed_instance(seed)
+    pools: IdentityPools = IdentityPools(fake)
+    meter: ThroughputMeter = ThroughputMeter()
+    bank_term, id_factor, country_term = iban_checksum_terms()
+
+    conn = engine.raw_connection()
+    try:
+        suspend_rollups(conn)
+        cursor = conn.cursor()
+        cursor.execute("DROP TABLE IF EXISTS seed_activity")
+        cursor.execute("SET max_parallel_workers_per_gather = 0")
+        cursor.execute("SELECT setseed(%s)", ((seed % 2**31) / 2**31,))
+
+        _execute(cursor, meter, "dim_date", DATE_SQL, {
+            "start": end_date - timedelta(days=max(profile.days_of_history, 365)),
+            "end": end_date + timedelta(days=1)
+        })
+
+        branch_base: int = next_id(cursor, "dim_branches")
+        _execute(cursor, meter, "dim_branches", BRANCH_SQL, {
+            "lo": branch_base,
+            "hi": branch_base + profile.num_branches - 1,
+            "cities": pools.cities.tolist(),
+            "n_cities": len(pools.cities),
+            "regions": REGIONS,
+            "region_thresholds": _thresholds(len(REGIONS), distribution.region_zipf)
+        })
+        conn.commit()
+
+        customer_base: int = next_id(cursor, "dim_customers")
+        account_base: int = next_id(cursor, "dim_accounts")
+        next_account: int = account_base
+        account_types: List[str] = [t.value for t in AccountType]
+        for lo in range(customer_base, customer_base + profile.num_customers, CUSTOMER_BATCH):
+            hi: int = min(lo + CUSTOMER_BATCH, customer_base + profile.num_customers) - 1
+            _execute(cursor, meter, "dim_customers", CUSTOMER_SQL, {
+                "lo": lo,
+                "hi": hi,
+                "created_at": datetime.combine(start_date, datetime.min.time()),
+                "first_names": pools.first_names.tolist(),
+                "n_first": len(pools.first_names),
+                "last_names": pools.last_names.tolist(),
+                "n_last": len(pools.last_names),
+                "domains": pools.email_domains.tolist(),
+                "n_domains": len(pools.email_domains),
+                "segments": SEGMENTS,
+                "n_segments": len(SEGMENTS)
+            })
+            next_account += _execute(cursor, meter, "dim_accounts", ACCOUNT_SQL, {
+                "lo": lo,
+                "hi": hi,
+                "base": next_account,
+                "branch_base": branch_base,
+                "branch_thresholds": _thresholds(profile.num_branches, distribution.branch_zipf),
+                "account_types": account_types,
+                "n_types": len(account_types),
+                "min_accounts": profile.min_accounts_per_customer,
+                "max_accounts": profile.max_accounts_per_customer,
+                "country": IBAN_COUNTRY,
+                "bank_code": BANK_CODE,
+                "iban_digits": IBAN_DIGITS,
+                "bank_term": bank_term,
+                "id_factor": id_factor,
+                "country_term": country_term
+            })
+            conn.commit()
+
+        last_account: int = next_account - 1
+        ensure_partitions(cursor, start_date, end_date)
+        if distribution.is_skewed:
+            started: float = time.perf_counter()
+            cursor.execute(ACTIVITY_SQL, {
+                "lo": account_base,
+                "hi": last_account,
+                "zipf": distribution.activity_zipf,
+                "dormant": int((last_account - account_base + 1) * distribution.dormant_share)
+            })
+            meter.record("seed_activity", cursor.rowcount, time.perf_counter() - started)
+            mean_tx: float = distribution.mean_tx_per_day
+        else:
+            mean_tx = profile.max_tx_per_day / 2
+
+        fact_params: Dict[str, Any] = {
+            "start": start_date,
+            "end": end_date,
+            "categories": CATEGORIES,
+            "n_categories": len(CATEGORIES),
+            "companies": pools.companies.tolist(),
+            "n_companies": len(pools.companies),
+            "max_tx": profile.max_tx_per_day,
+            "mean_tx": distribution.mean_tx_per_day,
+            "cap": distribution.hot_account_cap,
+            "month_end_days": distribution.month_end_days,
+            "month_end_boost": distribution.month_end_boost,
+            "weekend_factor": distribution.weekend_factor,
+            "ordinary_thresholds": _category_thresholds(0),
+            "payroll_thresholds": _category_thresholds(1),
+            "medians": [CATEGORY_AMOUNTS[c][0] for c in CATEGORIES],
+            "flows": [CATEGORY_AMOUNTS[c][1] for c in CATEGORIES],
+            "sigma": distribution.amount_sigma
+        }
+        transaction_sql: str = SKEWED_TRANSACTION_SQL if distribution.is_skewed else UNIFORM_TRANSACTION_SQL
+        block: int = max(1, int(chunk_rows // max(1.0, profile.days_of_history * mean_tx)))
+        for lo in range(account_base, last_account + 1, block):
+            hi = min(lo + block - 1, last_account)
+            _execute(cursor, meter, "fact_transactions", transaction_sql, {**fact_params, "lo": lo, "hi": hi})
+            _execute(cursor, meter, "fact_daily_balances", BALANCE_SQL, {
+                "lo": lo, "hi": hi, "start": start_date, "end": end_date
+            })
+            conn.commit()
+            print(f"   ...{hi - account_base + 1:,}/{last_account - account_base + 1:,} accounts generated")
+
+        cursor.execute("DROP TABLE IF EXISTS seed_activity")
+        conn.commit()
+        resume_rollups(conn)
+    except Exception:
+        abandon_rollups(conn)
+        raise
+    finally:
+        conn.close()
+
+    finalize_load()
+    return meter
@@ -0,0 +1,37 @@
+"""
+Streaming reads over server-side cursors.
+
+``stream_chunks`` runs a statement with ``yield_per``, which makes psycopg2
+use a named (server-side) cursor and fetch ``chunk_size`` rows per round
+trip, so memory is bounded by the chunk size rather than the result size.
+The session's identity map only holds weak references to unmodified
+objects, so rows from earlier chunks are freed once the caller drops them.
+
+The cursor lives inside the session's transaction: consume or close the
+iterator before committing or rolling back the session. ``yield_per``
+cannot be combined with ``joinedload`` of collections.
+"""
+
+from typing import Any, Final, Iterator, List
+
+from sqlalchemy import Select
+
+from app.db.base import SessionLike
+
+STREAM_CHUNK: Final[int] = 1_000
+
+
+def stream_chunks(db: SessionLike, stmt: Select, chunk_size: int = STREAM_CHUNK) -> Iterator[List[Any]]:
+    """The scalar results of ``stmt`` in lists of at most ``chunk_size``."""
+    result = db.execute(stmt.execution_options(yield_per=chunk_size))
+    try:
+        for chunk in result.scalars().partitions():
+            yield list(chunk)
+    finally:
+        result.close()
+
+
+def stream(db: SessionLike, stmt: Select, chunk_size: int = STREAM_CHUNK) -> Iterator[Any]:
+    """The scalar results of ``stmt`` one at a time, fetched ``chunk_size`` at a time."""
+    for chunk in stream_chunks(db, stmt, chunk_size):
+        yield from chunk
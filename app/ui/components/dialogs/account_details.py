@@ -7,11 +7,14 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtGui import QColor, QCursor, QRegularExpressionValidator
 from PyQt6.QtCore import Qt, QRegularExpression
 
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, Final, List, Any, Optional, Tuple
 
 from app.ui.styles import StyleSheet, DarkPalette
 from app.ui.components.dialogs.transaction_edit import TransactionEditDialog
 
+# Latest transactions listed and filtered; loading account.transactions would pull in all of them.
+TX_LIMIT: Final[int] = 500
+
 class AccountDetailsDialog(QDialog):
     def __init__(
         self, 
@@ -143,7 +146,7 @@ class AccountDetailsDialog(QDialog):
             self._mark_tx_filter_invalid(False)
 
         query: str = self.search_tx.text().lower().strip()
-        tx_list: List[Any] = getattr(self.account, 'transactions', []) or []
+        tx_list: List[Any] = self.services['transaction'].get_by_account(self.account.id, pagination=TX_LIMIT)
         
         filtered: List[Any] = sorted(
             [t for t in tx_list if query in (t.category or "").lower()],
@@ -243,8 +246,6 @@ class AccountDetailsDialog(QDialog):
         if reply == QMessageBox.StandardButton.Yes:
             try:
                 self.services['transaction'].delete(tx.id)
-                if tx in self.account.transactions:
-                    self.account.transactions.remove(tx)
                 self.refresh_transactions()
             except Exception as e:
                 QMessageBox.critical(self, "Error", str(e))
\ No newline at end of file
@@ -0,0 +1,180 @@
+from PyQt6.QtWidgets import (
+    QWidget, QHBoxLayout, QVBoxLayout, QTabWidget, QTableWidget, QTableWidgetItem,
+    QPlainTextEdit, QLabel, QPushButton, QDialog, QHeaderView, QAbstractItemView
+)
+
+from PyQt6.QtGui import QFont
+from PyQt6.QtCore import Qt
+
+from typing import List, Optional
+
+from app.core.services.cached import CacheStats, ServiceCache
+from app.db.instrumentation import CallerStats, SlowQuery, SqlMonitor
+from app.ui.styles import StyleSheet, DarkPalette
+
+class SqlDiagnosticsDialog(QDialog):
+    def __init__(
+        self, 
+        monitor: SqlMonitor, 
+        cache: Optional[ServiceCache] = None, 
+        parent: Optional[QWidget] = None
+    ) -> None:
+        super().__init__(parent)
+        self.monitor: SqlMonitor = monitor
+        self.cache: Optional[ServiceCache] = cache
+        self.slow: List[SlowQuery] = []
+
+        self.tabs: QTabWidget
+        self.latency_table: QTableWidget
+        self.slow_table: QTableWidget
+        self.cache_table: QTableWidget
+        self.detail: QPlainTextEdit
+        self.summary: QLabel
+
+        self.setWindowTitle("SQL Diagnostics")
+        self.setMinimumSize(1100, 700)
+        self.setStyleSheet(
+            f"""
+            background-color: {DarkPalette.BG_MEDIUM.name()};
+            color: white;
+            """
+        )
+        self.init_ui()
+        self.refresh()
+
+    def init_ui(self) -> None:
+        layout: QVBoxLayout = QVBoxLayout(self)
+        layout.setContentsMargins(20, 20, 20, 20)
+        layout.setSpacing(15)
+
+        self.summary = QLabel()
+        self.summary.setStyleSheet(f"color: {DarkPalette.TEXT_SECONDARY.name()};")
+        layout.addWidget(self.summary)
+
+        self.tabs = QTabWidget()
+        self.tabs.setStyleSheet(StyleSheet.TAB_WIDGET)
+        self.tabs.addTab(self._create_latency_tab(), "Latency by Caller")
+        self.tabs.addTab(self._create_slow_tab(), "Slow Queries")
+        if self.cache is not None:
+            self.tabs.addTab(self._create_cache_tab(), "Service Cache")
+        layout.addWidget(self.tabs)
+
+        buttons: QHBoxLayout = QHBoxLayout()
+        btn_refresh: QPushButton = QPushButton("Refresh")
+        btn_refresh.setStyleSheet(StyleSheet.BUTTON)
+        btn_refresh.clicked.connect(self.refresh)
+        btn_reset: QPushButton = QPushButton("Reset")
+        btn_reset.setStyleSheet(StyleSheet.BUTTON)
+        btn_reset.clicked.connect(self.reset)
+        btn_close: QPushButton = QPushButton("Close")
+        btn_close.setStyleSheet(StyleSheet.BUTTON)
+        btn_close.clicked.connect(self.accept)
+        buttons.addWidget(btn_refresh)
+        buttons.addWidget(btn_reset)
+        buttons.addStretch()
+        buttons.addWidget(btn_close)
+        layout.addLayout(buttons)
+
+    def _create_table(self, headers: List[str]) -> QTableWidget:
+        table: QTableWidget = QTableWidget()
+        table.setColumnCount(len(headers))
+        table.setHorizontalHeaderLabels(headers)
+        table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        table.horizontalHeader().setStretchLastSection(True)
+        table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        table.setStyleSheet(StyleSheet.TABLE)
+        return table
+
+    def _create_latency_tab(self) -> QWidget:
+        widget: QWidget = QWidget()
+        layout: QVBoxLayout = QVBoxLayout(widget)
+        self.latency_table = self._create_table(
+            ["Caller", "Calls", "Rows", "Total ms", "p50 ms", "p95 ms", "p99 ms", "Max ms"]
+        )
+        layout.addWidget(self.latency_table)
+        return widget
+
+    def _create_slow_tab(self) -> QWidget:
+        widget: QWidget = QWidget()
+        layout: QVBoxLayout = QVBoxLayout(widget)
+        self.slow_table = self._create_table(["Time", "Caller", "ms", "Rows", "Statement"])
+        self.slow_table.itemSelectionChanged.connect(self.show_slow_query)
+        layout.addWidget(self.slow_table, 3)
+
+        self.detail = QPlainTextEdit()
+        self.detail.setReadOnly(True)
+        self.detail.setFont(QFont("Consolas", 9))
+        self.detail.setStyleSheet(StyleSheet.LINE_EDIT)
+        self.detail.setPlaceholderText("Select a query to see its parameters and plan")
+        layout.addWidget(self.detail, 2)
+        return widget
+
+    def _create_cache_tab(self) -> QWidget:
+        widget: QWidget = QWidget()
+        layout: QVBoxLayout = QVBoxLayout(widget)
+        self.cache_table = self._create_table(
+            ["Method", "Hits", "Misses", "Hit rate", "Invalidations", "Entries", "TTL s"]
+        )
+        layout.addWidget(self.cache_table)
+        return widget
+
+    def _cell(self, value: str, numeric: bool = False) -> QTableWidgetItem:
+        item: QTableWidgetItem = QTableWidgetItem(value)
+        if numeric:
+            item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+        return item
+
+    def refresh(self) -> None:
+        stats: List[CallerStats] = self.monitor.stats()
+        self.latency_table.setRowCount(len(stats))
+        for i, s in enumerate(stats):
+            self.latency_table.setItem(i, 0, self._cell(s.caller))
+            self.latency_table.setItem(i, 1, self._cell(f"{s.calls:,}", True))
+            self.latency_table.setItem(i, 2, self._cell(f"{s.rows:,}", True))
+            for col, value in enumerate((s.total_ms, s.p50_ms, s.p95_ms, s.p99_ms, s.max_ms), start=3):
+                self.latency_table.setItem(i, col, self._cell(f"{value:,.1f}", True))
+
+        self.slow = self.monitor.slow_queries()
+        self.slow_table.setRowCount(len(self.slow))
+        for i, q in enumerate(self.slow):
+            self.slow_table.setItem(i, 0, self._cell(q.at.strftime("%H:%M:%S")))
+            self.slow_table.setItem(i, 1, self._cell(q.caller))
+            self.slow_table.setItem(i, 2, self._cell(f"{q.duration_ms:,.0f}", True))
+            self.slow_table.setItem(i, 3, self._cell(f"{q.rows:,}", True))
+            self.slow_table.setItem(i, 4, self._cell(" ".join(q.statement.split())[:200]))
+        self.detail.clear()
+
+        summary: str = (
+            f"{sum(s.calls for s in stats):,} statements from {len(stats)} callers | "
+            f"{len(self.slow)} slower than {self.monitor.slow_ms:,.0f} ms"
+        )
+        if self.cache is not None:
+            cached: List[CacheStats] = self.cache.stats()
+            self.cache_table.setRowCount(len(cached))
+            for i, c in enumerate(cached):
+                self.cache_table.setItem(i, 0, self._cell(c.method))
+                self.cache_table.setItem(i, 1, self._cell(f"{c.hits:,}", True))
+                self.cache_table.setItem(i, 2, self._cell(f"{c.misses:,}", True))
+                self.cache_table.setItem(i, 3, self._cell(f"{c.hit_rate:.0%}", True))
+                self.cache_table.setItem(i, 4, self._cell(f"{c.invalidations:,}", True))
+                self.cache_table.setItem(i, 5, self._cell(f"{c.size} / {c.maxsize}", True))
+                self.cache_table.setItem(i, 6, self._cell(f"{c.ttl:,.0f}", True))
+            hits: int = sum(c.hits for c in cached)
+            lookups: int = hits + sum(c.misses for c in cached)
+            summary += f" | cache {hits:,} hits of {lookups:,} lookups"
+        self.summary.setText(summary)
+
+    def show_slow_query(self) -> None:
+        row: int = self.slow_table.currentRow()
+        if not 0 <= row < len(self.slow):
+            return
+        q: SlowQuery = self.slow[row]
+        plan: str = q.plan or "No plan captured (set DB_SLOW_QUERY_EXPLAIN=true to capture one)"
+        self.detail.setPlainText(f"{q.statement}\n\n-- parameters\n{q.parameters}\n\n-- plan\n{plan}")
+
+    def reset(self) -> None:
+        self.monitor.reset()
+        if self.cache is not None:
+            self.cache.reset_stats()
+        self.refresh()
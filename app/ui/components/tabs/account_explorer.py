@@ -9,6 +9,7 @@ from PyQt6.QtCore import Qt, pyqtSignal, QPoint, QRegularExpression
 
 from typing import Dict, List, Any, Optional
 
+from app.db.keyset import Page
 from app.ui.styles import StyleSheet, DarkPalette
 from app.ui.components.dialogs.account_details import AccountDetailsDialog
 from app.ui.components.dialogs.transaction_edit import TransactionEditDialog
@@ -26,6 +27,10 @@ class AccountExplorerTab(QWidget):
         self.results_layout: QVBoxLayout
         self.search_type: QComboBox
         self.search_query: QLineEdit
+        self.more_button: QPushButton
+        # Term and token of the name search the results came from, for "load more".
+        self.next_query: str = ""
+        self.next_token: Optional[str] = None
         
         self.init_ui()
     
@@ -50,6 +55,12 @@ class AccountExplorerTab(QWidget):
         self.results_area.setWidget(self.results_content)
         main_layout.addWidget(self.results_area)
 
+        self.more_button = QPushButton(" LOAD MORE")
+        self.more_button.setStyleSheet(StyleSheet.BUTTON)
+        self.more_button.clicked.connect(self._load_more)
+        self.more_button.hide()
+        main_layout.addWidget(self.more_button, alignment=Qt.AlignmentFlag.AlignCenter)
+
     def _create_search_panel(self) -> QFrame:
         panel: QFrame = QFrame()
         panel.setStyleSheet(f"""
@@ -126,6 +137,8 @@ class AccountExplorerTab(QWidget):
     def perform_search(self) -> None:
         try:
             self._clear_layout(self.results_layout)
+            self.next_token = None
+            self.more_button.hide()
             query: str = self.search_query.text().strip()
             if not query: 
                 return
@@ -151,10 +164,9 @@ class AccountExplorerTab(QWidget):
                     if acc: 
                         results = [acc]
             elif search_type == "Full Name":
-                customers: List[Any] = self.services['customer'].get_all()
-                target_custs: List[Any] = [c for c in customers if query.lower() in c.full_name.lower()]
-                for c in target_custs:
-                    results.extend(self.services['account'].get_accounts_by_customer(c.id))
+                page: Page = self.services['account'].search_accounts(query)
+                results = page.items
+                self.next_query, self.next_token = query, page.next_token
             elif search_type == "Customer Email":
                 customer: Optional[Any] = self.services['customer'].get_by_email(query)
                 if customer:
@@ -166,7 +178,19 @@ class AccountExplorerTab(QWidget):
             else:
                 self._show_empty_state()
 
-            self.results_layout.addStretch()
+            self.more_button.setVisible(self.next_token is not None)
+        except Exception as e:
+            QMessageBox.critical(self, "Search Error", f"Details: {str(e)}")
+
+    def _load_more(self) -> None:
+        if self.next_token is None:
+            return
+        try:
+            page: Page = self.services['account'].search_accounts(self.next_query, self.next_token)
+            for acc in page.items:
+                self.display_account_card(acc)
+            self.next_token = page.next_token
+            self.more_button.setVisible(self.next_token is not None)
         except Exception as e:
             QMessageBox.critical(self, "Search Error", f"Details: {str(e)}")
 
@@ -284,7 +308,8 @@ class AccountExplorerTab(QWidget):
         footer.addWidget(view_analytics_btn, alignment=Qt.AlignmentFlag.AlignBottom)
         layout.addLayout(footer)
 
-        self.results_layout.insertWidget(0, card)
+        # Before the trailing stretch, so results keep their order and later pages follow.
+        self.results_layout.insertWidget(self.results_layout.count() - 1, card)
 
     def _show_context_menu(self, pos: QPoint, acc: Any) -> None:
         menu: QMenu = QMenu(self)
@@ -349,7 +374,8 @@ class AccountExplorerTab(QWidget):
         table.verticalHeader().setVisible(False)
         
         try:
-            recent_tx: List[Any] = sorted(acc.transactions, key=lambda x: x.timestamp, reverse=True)[:3]
+            # Only the latest three, rather than loading every transaction into acc.transactions.
+            recent_tx: List[Any] = self.services['transaction'].get_by_account(acc.id, pagination=3)
             table.setRowCount(len(recent_tx))
             for i, tx in enumerate(recent_tx):
                 table.setItem(i, 0, QTableWidgetItem(tx.timestamp.strftime("%d %b %Y")))
@@ -238,7 +238,7 @@ class AdvancedDataExplorerTab(QWidget):
             return [
                 {
                     "timestamp": t.timestamp.strftime("%Y-%m-%d"), 
-                    "amount": t.amount, 
+                    "amount": float(t.amount), 
                     "category": t.category, 
                     "merchant": t.merchant_name
                 } 
@@ -265,7 +265,7 @@ class AdvancedDataExplorerTab(QWidget):
             return [
                 {
                     "balance_date": str(b.balance_date), 
-                    "ending_balance": b.ending_balance
+                    "ending_balance": float(b.ending_balance)
                 } 
                 for b in raw
             ]
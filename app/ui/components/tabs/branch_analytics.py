@@ -17,6 +17,7 @@ from typing import Dict, List, Any, Optional
 
 from app.ui.styles import StyleSheet, DarkPalette
 from app.ui.components.cards.metric import MetricCard
+from app.ui.workers import run_in_background
 
 class BranchAnalyticsTab(QWidget):
     def __init__(self, services: Dict[str, Any], parent: Optional[QWidget] = None) -> None:
@@ -171,9 +172,16 @@ class BranchAnalyticsTab(QWidget):
                 widget.deleteLater()
 
     def load_data(self) -> None:
+        # The GROUP BY over every account runs on a worker thread with its own session.
+        run_in_background(
+            lambda: self.services['branch'].get_branches_by_account_count(min_accounts=0),
+            self._show_data,
+            lambda error: QMessageBox.critical(self, "Branch Analytics Error", error)
+        )
+
+    def _show_data(self, branches_data: List[Dict[str, Any]]) -> None:
         try:
             self.clear_kpi()
-            branches_data: List[Dict[str, Any]] = self.services['branch'].get_branches_by_account_count(min_accounts=0)
             
             if not branches_data:
                 self.chart_view.setChart(QChart())
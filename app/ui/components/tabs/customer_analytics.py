@@ -1,4 +1,4 @@
-from typing import Dict, List, Any, Optional
+from typing import Dict, Final, List, Any, Optional
 from PyQt6.QtWidgets import (
     QWidget, QHBoxLayout, QVBoxLayout, QGridLayout,
     QStackedWidget, QTableWidget, QTableWidgetItem, QToolTip,
@@ -19,6 +19,9 @@ from numpy.typing import NDArray
 from app.ui.styles import StyleSheet, DarkPalette
 from app.ui.components.cards.metric import MetricCard
 
+# Scores of every matching customer are aggregated; only this many are listed.
+TABLE_ROWS: Final[int] = 1_000
+
 class CustomerAnalyticsTab(QWidget):
     def __init__(self, services: Dict[str, Any], parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
@@ -189,8 +192,13 @@ class CustomerAnalyticsTab(QWidget):
             
             min_v: int = self.min_score.value()
             max_v: int = self.max_score.value()
-            customers: List[Any] = self.services['customer'].get_by_credit_score_range(min_v, max_v)
-            scores: List[float] = [c.credit_score for c in customers if c.credit_score is not None]
+            customers: List[Any] = []
+            scores: List[float] = []
+            for c in self.services['customer'].iter_by_credit_score_range(min_v, max_v):
+                if c.credit_score is not None:
+                    scores.append(c.credit_score)
+                if len(customers) < TABLE_ROWS:
+                    customers.append(c)
 
             if not scores:
                 self.chart_view.setChart(QChart())
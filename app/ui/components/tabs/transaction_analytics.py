@@ -18,6 +18,7 @@ import numpy as np
 
 from app.ui.styles import StyleSheet, DarkPalette
 from app.ui.components.cards.metric import MetricCard
+from app.ui.workers import run_in_background
 
 class TransactionAnalyticsTab(QWidget):
     def __init__(self, services: Dict[str, Any], parent: Optional[QWidget] = None) -> None:
@@ -150,11 +151,19 @@ class TransactionAnalyticsTab(QWidget):
                 self.end_date_edit.date().toPyDate(), 
                 datetime.max.time()
             )
-            data: List[Dict[str, Any]] = self.services['transaction'].get_category_breakdown(
-                start_date=start_dt, 
-                end_date=end_dt
+            run_in_background(
+                lambda: self.services['transaction'].get_category_breakdown(
+                    start_date=start_dt, 
+                    end_date=end_dt
+                ),
+                self._show_analysis,
+                lambda error: print(f"Analytics Error: {error}")
             )
-            
+        except Exception as e:
+            print(f"Analytics Error: {e}")
+
+    def _show_analysis(self, data: List[Dict[str, Any]]) -> None:
+        try:
             while (item := self.metrics_area.takeAt(0)) is not None:
                 if widget := item.widget(): 
                     widget.deleteLater()
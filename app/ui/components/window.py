@@ -15,6 +15,8 @@ from app.core.services.customer import CustomerService
 from app.core.services.dailybalance import DailyBalanceService
 from app.core.services.datedim import DateDimService
 from app.core.services.transaction import TransactionService
+from app.core.services.readonly import ReadOnlyService
+from app.core.services.cached import CachedService, service_cache
 
 from app.ui.components.tabs.account_explorer import AccountExplorerTab
 from app.ui.components.tabs.advance_data_explorer import AdvancedDataExplorerTab
@@ -27,14 +29,18 @@ from app.ui.components.tabs.transaction_analytics import TransactionAnalyticsTab
 from app.ui.styles import StyleSheet, DarkPalette
 from app.ui.components.sidebar import SidebarWidget
 from app.ui.components.widgets.header import HeaderWidget
+from app.ui.components.dialogs.diagnostics import SqlDiagnosticsDialog
 
-from app.db.base import get_db
+from app.db.base import ScopedSession, engine, sql_monitor
+from app.db.identity_map import IdentityMapStats, identity_map_stats
+from app.db.pool import PoolStats, pool_stats
 
 class MainWindow(QMainWindow):
     def __init__(self) -> None:
         super().__init__()
         
         self.services: Dict[str, Any]
+        self.read_services: Dict[str, Any]
         
         self.main_layout: QHBoxLayout
         self.content_layout: QVBoxLayout
@@ -46,6 +52,9 @@ class MainWindow(QMainWindow):
         self.tab_management: DataManagementTab
         
         self.kpi_widgets: Dict[str, QLabel] = {}
+        self.pool_label: QLabel
+        self.session_label: QLabel
+        self.pool_timer: QTimer
         
         self.setWindowTitle("MORDOR | Data Intelligence System")
         self.setMinimumSize(1450, 900)
@@ -67,14 +76,28 @@ class MainWindow(QMainWindow):
             sys.exit(1)
 
     def init_services(self) -> None:
-        db = next(get_db())
+        # Each thread that calls a service gets its own session from the registry.
+        db = ScopedSession
+        # Writes go through these; they are not cached since their objects belong
+        # to the GUI session, but the write methods invalidate the read cache.
         self.services = {
-            'account': AccountService(db),
-            'branch': BranchService(db),
-            'customer': CustomerService(db),
-            'daily_balance': DailyBalanceService(db),
-            'date_dim': DateDimService(db),
-            'transaction': TransactionService(db)
+            'account': CachedService(AccountService(db), read_through=False),
+            'branch': CachedService(BranchService(db), read_through=False),
+            'customer': CachedService(CustomerService(db), read_through=False),
+            'daily_balance': CachedService(DailyBalanceService(db), read_through=False),
+            'date_dim': CachedService(DateDimService(db), read_through=False),
+            'transaction': CachedService(TransactionService(db), read_through=False)
+        }
+        # Analytics and exports only read columns, so they run each call in a
+        # session of its own and leave nothing behind in the GUI session. The
+        # repeated lookups and aggregates are served from the service cache.
+        self.read_services = {
+            'account': CachedService(ReadOnlyService(AccountService)),
+            'branch': CachedService(ReadOnlyService(BranchService)),
+            'customer': CachedService(ReadOnlyService(CustomerService)),
+            'daily_balance': CachedService(ReadOnlyService(DailyBalanceService)),
+            'date_dim': CachedService(ReadOnlyService(DateDimService)),
+            'transaction': CachedService(ReadOnlyService(TransactionService))
         }
 
     def init_ui(self) -> None:
@@ -83,7 +106,7 @@ class MainWindow(QMainWindow):
         self.main_layout.setContentsMargins(0, 0, 0, 0)
         self.main_layout.setSpacing(0)
         
-        self.sidebar = SidebarWidget(self.services)
+        self.sidebar = SidebarWidget(self.read_services)
         self.main_layout.addWidget(self.sidebar)
         
         content_wrapper: QWidget = QWidget()
@@ -110,19 +133,19 @@ class MainWindow(QMainWindow):
         self.tab_management = DataManagementTab(self.services)
         
         self.tabs.addTab(
-            TransactionAnalyticsTab(self.services), 
+            TransactionAnalyticsTab(self.read_services), 
             "📊 Transaction Analytics"
         )
         self.tabs.addTab(
-            CustomerAnalyticsTab(self.services), 
+            CustomerAnalyticsTab(self.read_services), 
             "👥 Credit Intelligence"
         )
         self.tabs.addTab(
-            BranchAnalyticsTab(self.services), 
+            BranchAnalyticsTab(self.read_services), 
             "🏢 Branch Performance"
         )
         self.tabs.addTab(
-            BalanceAnalyticsTab(self.services), 
+            BalanceAnalyticsTab(self.read_services), 
             "💰 Balance Analytics"
         )
         self.tabs.addTab(
@@ -130,7 +153,7 @@ class MainWindow(QMainWindow):
             "🔍 Account Explorer"
         )
         self.tabs.addTab(
-            AdvancedDataExplorerTab(self.services), 
+            AdvancedDataExplorerTab(self.read_services), 
             "🧠 Data Explorer"
         )
         self.tabs.addTab(
@@ -151,7 +174,9 @@ class MainWindow(QMainWindow):
             status_bar.showMessage("Synchronizing database...", 2000)
         
         try:
-            customers_count: int = self.services['customer'].count_all()
+            # An explicit refresh should not be answered from the cache.
+            service_cache.clear()
+            customers_count: int = self.read_services['customer'].count_all()
             if "CLIENT BASE" in self.kpi_widgets:
                 self.kpi_widgets["CLIENT BASE"].setText(f"{customers_count:,}")
             
@@ -191,8 +216,40 @@ class MainWindow(QMainWindow):
         version_label: QLabel = QLabel(
             f"V1.2.4-STABLE | {datetime.now().year} "
         )
+        self.session_label = QLabel()
+        sb.addPermanentWidget(self.session_label)
+        self.pool_label = QLabel()
+        sb.addPermanentWidget(self.pool_label)
         sb.addPermanentWidget(version_label)
 
+        self.pool_timer = QTimer(self)
+        self.pool_timer.timeout.connect(self.update_pool_stats)
+        self.pool_timer.timeout.connect(self.update_session_stats)
+        self.pool_timer.start(2000)
+        self.update_pool_stats()
+        self.update_session_stats()
+
+    def update_session_stats(self) -> None:
+        # The registry returns the GUI thread's session, the one that lives as long as the window.
+        stats: IdentityMapStats = identity_map_stats(ScopedSession())
+        self.session_label.setText(f"{stats} | ")
+        self.session_label.setToolTip(
+            "\n".join(f"{name}: {count:,}" for name, count in stats.by_class.items()) or "Empty"
+        )
+
+    def update_pool_stats(self) -> None:
+        stats: Optional[PoolStats] = pool_stats(engine)
+        if stats is None:
+            self.pool_label.hide()
+            return
+        self.pool_label.setText(f"{stats} | ")
+        self.pool_label.setToolTip(
+            f"Checked out: {stats.checked_out} of {stats.size} (+{stats.overflow} overflow, peak {stats.peak_overflow})\n"
+            f"Idle: {stats.idle}, open connections: {stats.connections}\n"
+            f"Checkouts: {stats.checkouts:,}, timeouts: {stats.timeouts}\n"
+            f"Wait: {stats.wait_avg_ms:.1f} ms avg, {stats.wait_max_ms:.1f} ms max"
+        )
+
     def create_menu_bar(self) -> None:
         mb: QMenuBar = self.menuBar()
         mb.setStyleSheet(
@@ -214,6 +271,14 @@ class MainWindow(QMainWindow):
         fs_act.triggered.connect(self.toggle_fullscreen)
         view_menu.addAction(fs_act)
 
+        diag_act: QAction = QAction("SQL Diagnostics", self)
+        diag_act.setShortcut("Ctrl+Shift+D")
+        diag_act.triggered.connect(self.show_sql_diagnostics)
+        view_menu.addAction(diag_act)
+
+    def show_sql_diagnostics(self) -> None:
+        SqlDiagnosticsDialog(sql_monitor, service_cache, self).exec()
+
     def toggle_fullscreen(self) -> None:
         if self.isFullScreen():
             self.showNormal()
@@ -0,0 +1,50 @@
+from typing import Any, Callable, Optional, Set
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+from app.db.base import ScopedSession
+
+class WorkerSignals(QObject):
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+class QueryWorker(QRunnable):
+    """
+    Runs ``job`` on the global thread pool. Services built on ``ScopedSession``
+    use the pool thread's own session, which is closed when the job ends, so
+    the result should not rely on lazy loading after it has been delivered.
+    """
+    def __init__(self, job: Callable[[], Any]) -> None:
+        super().__init__()
+        self.job: Callable[[], Any] = job
+        # Created on the GUI thread, so the signals are delivered there.
+        self.signals: WorkerSignals = WorkerSignals()
+
+    def run(self) -> None:
+        try:
+            result: Any = self.job()
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit(result)
+        finally:
+            ScopedSession.remove()
+
+# Workers whose result has not been delivered yet; dropping the last reference
+# would delete their signals before the queued emit reaches the GUI thread.
+_pending: Set[QueryWorker] = set()
+
+def run_in_background(
+    job: Callable[[], Any],
+    on_done: Callable[[Any], None],
+    on_error: Optional[Callable[[str], None]] = None
+) -> QueryWorker:
+    worker: QueryWorker = QueryWorker(job)
+    worker.signals.finished.connect(on_done)
+    if on_error is not None:
+        worker.signals.failed.connect(on_error)
+    worker.signals.finished.connect(lambda _: _pending.discard(worker))
+    worker.signals.failed.connect(lambda _: _pending.discard(worker))
+    _pending.add(worker)
+    QThreadPool.globalInstance().start(worker)
+    return worker
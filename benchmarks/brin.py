@@ -0,0 +1,112 @@
+"""
+Time-range scans with no index, the time B-trees and the BRIN indexes
+(revision 2a3fe62cffcb), plus the on-disk size of each index.
+
+Each variant runs inside a transaction that drops the other indexes and
+is rolled back afterwards, so the schema is left untouched. BRIN only
+prunes when rows are stored in time order, so run this once after a bulk
+seed and again after ``python cluster_facts.py`` to see both sides;
+``python cluster_facts.py --dry-run`` lists the current correlations.
+
+    python -m benchmarks.brin --repeat 20
+"""
+
+import argparse
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, Final, List, Tuple
+
+from sqlalchemy import func, select, text
+from sqlalchemy.orm import Session
+
+from app.db.base import SessionLocal
+from app.db.models import DailyBalance, Transaction
+from app.core.services.dailybalance import DailyBalanceService
+from benchmarks.common import Timing, category_scan, print_table, run_cases, REPEAT
+
+BTREE_INDEXES: Final[Tuple[str, ...]] = (
+    "ix_fact_transactions_timestamp",
+    "ix_fact_daily_balances_balance_date",
+)
+BRIN_INDEXES: Final[Tuple[str, ...]] = (
+    "brin_fact_transactions_timestamp",
+    "brin_fact_daily_balances_balance_date",
+)
+VARIANTS: Final[Dict[str, Tuple[str, ...]]] = {
+    "no index": BTREE_INDEXES + BRIN_INDEXES,
+    "B-tree": BRIN_INDEXES,
+    "BRIN": BTREE_INDEXES,
+}
+
+# pg_partition_tree sums the per-partition children of a partitioned index
+# and returns no rows for a plain one.
+INDEX_SIZE_SQL: Final[str] = """
+SELECT coalesce(
+    (SELECT sum(pg_relation_size(relid)) FROM pg_partition_tree(CAST(:name AS regclass))),
+    pg_relation_size(CAST(:name AS regclass))
+)
+"""
+
+
+def build_cases(db: Session) -> Dict[str, Callable[[int], object]]:
+    latest: datetime = db.execute(select(func.max(Transaction.timestamp))).scalar() or datetime.utcnow()
+    last_day: date = db.execute(select(func.max(DailyBalance.balance_date))).scalar() or latest.date()
+    balances: DailyBalanceService = DailyBalanceService(db)
+
+    def breakdown(days: int) -> Callable[[int], object]:
+        # Step the window back a day per call so repeated calls do not hit the same pages.
+        return lambda i: category_scan(
+            db, latest - timedelta(days=days + i % 30), latest - timedelta(days=i % 30)
+        )
+
+    # The service answers category breakdowns from the rollup now, so the
+    # time-range scans are timed on fact_transactions directly.
+    return {
+        "category scan (1d)": breakdown(1),
+        "category scan (7d)": breakdown(7),
+        "category scan (30d)": breakdown(30),
+        "balances.get_balances_by_date": lambda i: balances.get_balances_by_date(last_day - timedelta(days=i % 30)),
+    }
+
+
+def index_size(db: Session, name: str) -> int:
+    return int(db.execute(text(INDEX_SIZE_SQL), {"name": name}).scalar() or 0)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Time-range query latency with no index, B-tree and BRIN.")
+    parser.add_argument("--repeat", type=int, default=REPEAT, help="timed calls per case")
+    args: argparse.Namespace = parser.parse_args()
+
+    db: Session = SessionLocal()
+    try:
+        existing: List[str] = list(db.execute(
+            text("SELECT indexname FROM pg_indexes WHERE indexname = ANY(:names)"),
+            {"names": list(BTREE_INDEXES + BRIN_INDEXES)}
+        ).scalars())
+        missing: List[str] = sorted(set(BTREE_INDEXES + BRIN_INDEXES) - set(existing))
+        if missing:
+            raise SystemExit(f"Missing indexes {missing}; run 'alembic upgrade head' first")
+
+        sizes: Dict[str, int] = {name: index_size(db, name) for name in BTREE_INDEXES + BRIN_INDEXES}
+        db.rollback()
+
+        cases: Dict[str, Callable[[int], object]] = build_cases(db)
+        timings: Dict[str, Dict[str, Timing]] = {}
+        for variant, dropped in VARIANTS.items():
+            for name in dropped:
+                db.execute(text(f"DROP INDEX {name}"))
+            timings[variant] = run_cases(db, cases, args.repeat)
+            db.rollback()
+    finally:
+        db.close()
+
+    print_table("query", list(VARIANTS), [
+        (name, *(timings[variant][name] for variant in VARIANTS)) for name in cases
+    ])
+    print()
+    for name, size in sizes.items():
+        print(f"{name:<40} {size / 1024 ** 2:10.2f} MB")
+
+
+if __name__ == "__main__":
+    main()
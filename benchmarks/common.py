@@ -0,0 +1,92 @@
+"""
+Shared helpers for the benchmark scripts.
+
+Benchmarks run against whatever database ``settings.db_url`` points at,
+so seed it with a large profile first, for example
+``python seed_db.py --mode copy --profile SF1 --seed 1 --workers 8``.
+"""
+
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Final, List, NamedTuple, Sequence
+
+import numpy as np
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.db.models import Transaction
+
+REPEAT: Final[int] = 20
+WARMUP: Final[int] = 2
+
+
+class Timing(NamedTuple):
+    p50: float
+    p95: float
+    mean: float
+
+    def __str__(self) -> str:
+        return f"{self.p50:9.2f} ms"
+
+
+def measure(call: Callable[[int], object], repeat: int = REPEAT, warmup: int = WARMUP) -> Timing:
+    """Time ``call(i)`` for ``repeat`` iterations after ``warmup`` untimed ones, in milliseconds."""
+    for i in range(warmup):
+        call(i)
+    samples: List[float] = []
+    for i in range(repeat):
+        started: float = time.perf_counter()
+        call(i)
+        samples.append((time.perf_counter() - started) * 1000)
+    return Timing(
+        p50=float(np.percentile(samples, 50)),
+        p95=float(np.percentile(samples, 95)),
+        mean=float(np.mean(samples))
+    )
+
+
+def category_scan(db: Session, start: datetime, end: datetime) -> List[Any]:
+    """
+    Category totals aggregated from ``fact_transactions`` over a time range:
+    the time-range scan ``get_category_breakdown`` ran before it was served
+    from the ``fact_category_daily`` rollup (revision 0e1db4a54bf4).
+    """
+    stmt = (
+        select(
+            Transaction.category,
+            func.count(Transaction.id),
+            func.sum(Transaction.amount),
+            func.avg(Transaction.amount)
+        )
+        .where(Transaction.timestamp >= start, Transaction.timestamp <= end)
+        .group_by(Transaction.category)
+    )
+    return list(db.execute(stmt).all())
+
+
+def run_cases(db: Session, cases: Dict[str, Callable[[int], object]], repeat: int = REPEAT) -> Dict[str, Timing]:
+    """Measure every case, expunging the session after each call so no run is served from the identity map."""
+    timings: Dict[str, Timing] = {}
+    for name, call in cases.items():
+        def timed(i: int, call: Callable[[int], object] = call) -> None:
+            call(i)
+            db.expunge_all()
+        timings[name] = measure(timed, repeat)
+    return timings
+
+
+def print_comparison(title: str, before: str, after: str, rows: Sequence[tuple]) -> None:
+    """Print ``(case, before_timing, after_timing)`` rows as a p50/p95 table with speedups."""
+    width: int = max([len(row[0]) for row in rows] + [len(title)])
+    print(f"\n{title:<{width}}  {before + ' p50':>14}  {after + ' p50':>14}  {after + ' p95':>14}  speedup")
+    for case, old, new in rows:
+        speedup: float = old.p50 / new.p50 if new.p50 else 0.0
+        print(f"{case:<{width}}  {old!s:>14}  {new!s:>14}  {new.p95:11.2f} ms  {speedup:6.1f}x")
+
+
+def print_table(title: str, columns: Sequence[str], rows: Sequence[tuple]) -> None:
+    """Print ``(case, timing, timing, ...)`` rows as a p50 table, one column per entry of ``columns``."""
+    width: int = max([len(row[0]) for row in rows] + [len(title)])
+    print(f"\n{title:<{width}}" + "".join(f"  {column + ' p50':>14}" for column in columns))
+    for case, *timings in rows:
+        print(f"{case:<{width}}" + "".join(f"  {timing!s:>14}" for timing in timings))
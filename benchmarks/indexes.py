@@ -0,0 +1,114 @@
+"""
+Before/after latency report for the access-path indexes (revision 87bab208fdb2).
+
+Every case calls the real service method, except the time-range category
+scan: the service answers it from the rollup table since revision
+0e1db4a54bf4, so it is timed on fact_transactions directly. "after" runs
+with the indexes in place; "before" runs inside a transaction that drops
+them and is rolled back afterwards, so the schema is left untouched. The drops hold
+exclusive locks until the rollback, so run this on a benchmark database.
+
+    python -m benchmarks.indexes --repeat 20
+"""
+
+import argparse
+from datetime import datetime, timedelta, date
+from typing import Callable, Dict, Final, List, Tuple
+
+import numpy as np
+from sqlalchemy import text, func, select
+from sqlalchemy.orm import Session
+
+from app.db.base import SessionLocal
+from app.db.models import Account, Customer, DailyBalance, Transaction
+from app.core.services.account import AccountService
+from app.core.services.customer import CustomerService
+from app.core.services.dailybalance import DailyBalanceService
+from app.core.services.transaction import TransactionService
+from benchmarks.common import Timing, category_scan, print_comparison, run_cases, REPEAT
+
+ACCESS_PATH_INDEXES: Final[Tuple[str, ...]] = (
+    "ix_dim_accounts_branch_id",
+    "ix_dim_accounts_customer_id",
+    "ix_dim_customers_credit_score",
+    "ix_fact_daily_balances_account_id_balance_date",
+    "ix_fact_daily_balances_balance_date",
+    "ix_fact_transactions_account_id_timestamp",
+    "ix_fact_transactions_timestamp",
+)
+
+
+def build_cases(db: Session, seed: int) -> Dict[str, Callable[[int], object]]:
+    rng: np.random.Generator = np.random.default_rng(seed)
+    max_account: int = db.execute(select(func.max(Account.id))).scalar() or 1
+    max_customer: int = db.execute(select(func.max(Customer.id))).scalar() or 1
+    latest: datetime = db.execute(select(func.max(Transaction.timestamp))).scalar() or datetime.utcnow()
+    last_day: date = db.execute(select(func.max(DailyBalance.balance_date))).scalar() or latest.date()
+    accounts: List[int] = rng.integers(1, max_account + 1, 64).tolist()
+    customers: List[int] = rng.integers(1, max_customer + 1, 64).tolist()
+
+    transactions: TransactionService = TransactionService(db)
+    balances: DailyBalanceService = DailyBalanceService(db)
+    customer_service: CustomerService = CustomerService(db)
+    account_service: AccountService = AccountService(db)
+
+    def pick(values: List[int], i: int) -> int:
+        return values[i % len(values)]
+
+    return {
+        "transactions.get_by_account": lambda i: transactions.get_by_account(pick(accounts, i)),
+        "transactions.get_total_by_account (90d)": lambda i: transactions.get_total_by_account(
+            pick(accounts, i), latest - timedelta(days=90), latest
+        ),
+        "transactions.count_by_account": lambda i: transactions.count_by_account(pick(accounts, i)),
+        "category scan (7d)": lambda i: category_scan(db, latest - timedelta(days=7), latest),
+        "transactions.get_category_breakdown (account, 1y)": lambda i: transactions.get_category_breakdown(
+            pick(accounts, i), latest - timedelta(days=365), latest
+        ),
+        "balances.get_latest_balance": lambda i: balances.get_latest_balance(pick(accounts, i)),
+        "balances.get_by_date_range (30d)": lambda i: balances.get_by_date_range(
+            pick(accounts, i), last_day - timedelta(days=30), last_day
+        ),
+        "balances.get_balances_by_date": lambda i: balances.get_balances_by_date(last_day - timedelta(days=i % 30)),
+        "customers.get_by_credit_score_range": lambda i: customer_service.get_by_credit_score_range(
+            800 + i % 40, 801 + i % 40
+        ),
+        "accounts.get_accounts_by_customer": lambda i: account_service.get_accounts_by_customer(pick(customers, i)),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Service query latency with and without the access-path indexes.")
+    parser.add_argument("--repeat", type=int, default=REPEAT, help="timed calls per case")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the sampled accounts and customers")
+    args: argparse.Namespace = parser.parse_args()
+
+    db: Session = SessionLocal()
+    try:
+        existing: List[str] = list(db.execute(
+            text("SELECT indexname FROM pg_indexes WHERE indexname = ANY(:names)"),
+            {"names": list(ACCESS_PATH_INDEXES)}
+        ).scalars())
+        missing: List[str] = sorted(set(ACCESS_PATH_INDEXES) - set(existing))
+        if missing:
+            raise SystemExit(f"Missing indexes {missing}; run 'alembic upgrade head' first")
+
+        cases: Dict[str, Callable[[int], object]] = build_cases(db, args.seed)
+        after: Dict[str, Timing] = run_cases(db, cases, args.repeat)
+        db.rollback()
+
+        for name in ACCESS_PATH_INDEXES:
+            db.execute(text(f"DROP INDEX {name}"))
+        before: Dict[str, Timing] = run_cases(db, cases, args.repeat)
+        db.rollback()
+    finally:
+        db.close()
+
+    print_comparison(
+        "service call", "no index", "indexed",
+        [(name, before[name], after[name]) for name in cases]
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+SUM/GROUP BY latency and table size for the money columns, for comparing
+double precision with BIGINT cents (revision 270d8aacf633).
+
+The column type cannot be switched inside a rolled-back transaction
+without rewriting every table, so run this once before and once after
+``alembic upgrade`` and compare the two reports.
+
+    python -m benchmarks.money --repeat 10
+"""
+
+import argparse
+from datetime import date, timedelta
+from typing import Callable, Dict, Final, Tuple
+
+import numpy as np
+from sqlalchemy import func, select, text
+from sqlalchemy.orm import Session
+
+from app.db.base import SessionLocal
+from app.db.models import DailyBalance
+from benchmarks.common import Timing, measure, REPEAT
+
+TABLES: Final[Tuple[str, ...]] = ("fact_transactions", "fact_daily_balances", "fact_category_daily")
+
+CASES: Final[Dict[str, str]] = {
+    "SUM(amount)": "SELECT sum(amount) FROM fact_transactions",
+    "SUM/AVG(amount) GROUP BY category": (
+        "SELECT category, sum(amount), avg(amount) FROM fact_transactions GROUP BY category"
+    ),
+    "SUM(amount) GROUP BY account_id, month": (
+        "SELECT account_id, date_trunc('month', timestamp), sum(amount) "
+        "FROM fact_transactions GROUP BY 1, 2"
+    ),
+    "SUM(ending_balance) GROUP BY balance_date": (
+        "SELECT balance_date, sum(ending_balance) FROM fact_daily_balances GROUP BY balance_date"
+    ),
+}
+
+# pg_partition_tree returns no rows for a table that is not partitioned.
+TABLE_SIZE_SQL: Final[str] = """
+SELECT coalesce(
+    (SELECT sum(pg_total_relation_size(relid)) FROM pg_partition_tree(CAST(:name AS regclass))),
+    pg_total_relation_size(CAST(:name AS regclass))
+)
+"""
+
+
+def numpy_case(db: Session, last_day: date) -> Callable[[int], object]:
+    """Fetch one month of balances into an array and total it per day on the client."""
+    start: date = last_day - timedelta(days=30)
+
+    def run(i: int) -> object:
+        rows = db.execute(text(
+            "SELECT balance_date - CAST(:start AS date), ending_balance "
+            "FROM fact_daily_balances WHERE balance_date > :start"
+        ), {"start": start}).all()
+        days: np.ndarray = np.array([row[0] for row in rows], dtype=np.int64)
+        # float64 for double precision, int64 for cents, where the totals stay exact.
+        values: np.ndarray = np.array([row[1] for row in rows])
+        totals: np.ndarray = np.zeros(31, dtype=values.dtype)
+        np.add.at(totals, days - 1, values)
+        return totals
+    return run
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Aggregate latency and table size of the money columns.")
+    parser.add_argument("--repeat", type=int, default=REPEAT, help="timed runs per query")
+    args: argparse.Namespace = parser.parse_args()
+
+    db: Session = SessionLocal()
+    try:
+        column_type: str = db.execute(text(
+            "SELECT data_type FROM information_schema.columns "
+            "WHERE table_name = 'fact_transactions' AND column_name = 'amount'"
+        )).scalar()
+        last_day: date = db.execute(select(func.max(DailyBalance.balance_date))).scalar() or date.today()
+        timings: Dict[str, Timing] = {
+            name: measure(lambda i, sql=sql: db.execute(text(sql)).all(), args.repeat)
+            for name, sql in CASES.items()
+        }
+        timings["NumPy daily totals (30d of balances)"] = measure(numpy_case(db, last_day), args.repeat)
+        sizes: Dict[str, int] = {
+            table: int(db.execute(text(TABLE_SIZE_SQL), {"name": table}).scalar() or 0) for table in TABLES
+        }
+    finally:
+        db.close()
+
+    width: int = max(len(name) for name in timings)
+    print(f"\nmoney columns stored as {column_type}")
+    print(f"{'query':<{width}}  {'p50':>12}  {'p95':>12}")
+    for name, timing in timings.items():
+        print(f"{name:<{width}}  {timing!s:>12}  {timing.p95:9.2f} ms")
+    print()
+    for table, size in sizes.items():
+        print(f"{table:<{width}}  {size / 1024 ** 2:9.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
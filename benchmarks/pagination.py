@@ -0,0 +1,105 @@
+"""
+Deep pages of the transaction listings: ``LIMIT/OFFSET`` against keyset
+pagination, at growing page depths.
+
+The keyset case gets the token of the page before the requested one from
+an untimed offset query, which is what a client that scrolled there would
+be holding, so both sides read the same page.
+
+    python -m benchmarks.pagination --repeat 10
+"""
+
+import argparse
+from typing import Callable, Final, List, Optional, Sequence, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.db.base import SessionLocal
+from app.db.keyset import PAGE_SIZE, encode_token
+from app.db.models import Transaction
+from app.core.services.transaction import TransactionService
+from benchmarks.common import print_comparison, run_cases
+
+REPEAT: Final[int] = 10
+DEPTHS: Final[Tuple[int, ...]] = (1, 100, 1_000, 10_000)
+
+
+def token_before(db: Session, listing: str, stmt, page: int) -> Optional[str]:
+    """The token a client holds after reading ``page - 1`` pages of ``stmt``."""
+    if page <= 1:
+        return None
+    last = db.execute(
+        stmt.order_by(Transaction.timestamp.desc(), Transaction.id.desc())
+        .offset((page - 1) * PAGE_SIZE - 1)
+        .limit(1)
+    ).scalar_one_or_none()
+    if last is None:
+        return None
+    return encode_token(listing, [last.timestamp, last.id])
+
+
+def depth_cases(
+    db: Session,
+    name: str,
+    depths: Sequence[int],
+    by_offset: Callable[[int], object],
+    by_keyset: Callable[[Optional[str]], object],
+    listing: str,
+    stmt,
+    repeat: int = REPEAT
+) -> List[tuple]:
+    rows: List[tuple] = []
+    for page in depths:
+        token: Optional[str] = token_before(db, listing, stmt, page)
+        if page > 1 and token is None:
+            print(f"{name}: page {page:,} is past the end, skipped")
+            continue
+        offset: int = (page - 1) * PAGE_SIZE
+        timings = run_cases(db, {
+            "offset": lambda i, offset=offset: by_offset(offset),
+            "keyset": lambda i, token=token: by_keyset(token),
+        }, repeat)
+        rows.append((f"{name} page {page:,}", timings["offset"], timings["keyset"]))
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Offset against keyset pagination at growing page depths.")
+    parser.add_argument("--repeat", type=int, default=REPEAT, help="timed runs per case")
+    parser.add_argument(
+        "--depths", type=int, nargs="+", default=list(DEPTHS), help="page numbers to read"
+    )
+    args: argparse.Namespace = parser.parse_args()
+
+    db: Session = SessionLocal()
+    try:
+        transactions: TransactionService = TransactionService(db)
+        busiest: int = db.execute(
+            select(Transaction.account_id)
+            .group_by(Transaction.account_id)
+            .order_by(func.count().desc())
+            .limit(1)
+        ).scalar_one()
+
+        rows: List[tuple] = depth_cases(
+            db, "get_all", args.depths,
+            lambda offset: transactions.get_all(PAGE_SIZE, offset),
+            lambda token: transactions.get_all_page(token),
+            "transactions", select(Transaction), args.repeat
+        )
+        rows += depth_cases(
+            db, "get_by_account", args.depths,
+            lambda offset: transactions.get_by_account(busiest, PAGE_SIZE, offset),
+            lambda token: transactions.get_by_account_page(busiest, token),
+            f"transactions/account/{busiest}",
+            select(Transaction).where(Transaction.account_id == busiest), args.repeat
+        )
+    finally:
+        db.close()
+
+    print_comparison("page", "offset", "keyset", rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+"""
+Customer search latency: the former unranked ILIKE scan against the ranked
+trigram search (revision 5313e26196c9).
+
+``--customers`` tops ``dim_customers`` up to that many rows first, with
+names and emails drawn like the seeders' (the extra customers have no
+accounts), and commits them, so run it on a benchmark database. "ILIKE
+scan" runs with the trigram indexes dropped inside a transaction that is
+rolled back afterwards.
+
+Before timing, the ranked search is checked against ranking every match
+exhaustively, for terms common enough that an arbitrary sample of the
+matches would miss the best one.
+
+    python -m benchmarks.search --customers 1000000
+    python -m benchmarks.search --customers 10000000
+"""
+
+import argparse
+import time
+from datetime import datetime
+from typing import Callable, Dict, Final, List, Tuple
+
+import numpy as np
+from faker import Faker
+from sqlalchemy import func, or_, select, text
+from sqlalchemy.orm import Session
+
+from app.db.base import SessionLocal, engine
+from app.db.identities import IdentityPools
+from app.db.models import Customer
+from app.db.seeders import SEGMENTS
+from app.db.sqlgen import CUSTOMER_SQL, CUSTOMER_BATCH
+from app.core.services.customer import CustomerService, contains_pattern
+from benchmarks.common import Timing, print_comparison, run_cases, REPEAT
+
+TRIGRAM_INDEXES: Final[Tuple[str, ...]] = (
+    "ix_dim_customers_full_name_trgm",
+    "ix_dim_customers_email_trgm",
+    "ix_dim_customers_full_name_trgm_gist",
+    "ix_dim_customers_email_trgm_gist",
+)
+# Terms are checked when they match more rows than the search once sampled
+# before ranking.
+CHECK_MIN_MATCHES: Final[int] = 1_000
+
+
+def top_up_customers(db: Session, target: int, seed: int) -> int:
+    """Insert generated customers until ``dim_customers`` holds ``target`` rows; returns the count added."""
+    have: int = db.execute(select(func.count(Customer.id))).scalar() or 0
+    if have >= target:
+        return 0
+    fake: Faker = Faker()
+    fake.seed_instance(seed)
+    pools: IdentityPools = IdentityPools(fake)
+    first: int = (db.execute(select(func.max(Customer.id))).scalar() or 0) + 1
+    last: int = first + target - have - 1
+    db.rollback()
+
+    started: float = time.perf_counter()
+    conn = engine.raw_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute("SELECT setseed(%s)", ((seed % 2**31) / 2**31,))
+        for lo in range(first, last + 1, CUSTOMER_BATCH):
+            hi: int = min(lo + CUSTOMER_BATCH - 1, last)
+            cursor.execute(CUSTOMER_SQL, {
+                "lo": lo,
+                "hi": hi,
+                "created_at": datetime.utcnow(),
+                "first_names": pools.first_names.tolist(),
+                "n_first": len(pools.first_names),
+                "last_names": pools.last_names.tolist(),
+                "n_last": len(pools.last_names),
+                "domains": pools.email_domains.tolist(),
+                "n_domains": len(pools.email_domains),
+                "segments": SEGMENTS,
+                "n_segments": len(SEGMENTS)
+            })
+            conn.commit()
+            print(f"   ...{hi - first + 1:,}/{last - first + 1:,} customers added")
+        cursor.execute("SELECT setval('dim_customers_id_seq', %s)", (last,))
+        cursor.execute("ANALYZE dim_customers")
+        conn.commit()
+    finally:
+        conn.close()
+    print(f"   {last - first + 1:,} customers added in {time.perf_counter() - started:.0f}s")
+    return last - first + 1
+
+
+def build_queries(db: Session, seed: int) -> Dict[str, List[str]]:
+    """Search terms taken from random existing customers, grouped by the kind of input."""
+    rng: np.random.Generator = np.random.default_rng(seed)
+    max_id: int = db.execute(select(func.max(Customer.id))).scalar() or 1
+    ids: List[int] = rng.integers(1, max_id + 1, 64).tolist()
+    rows = db.execute(select(Customer.full_name, Customer.email).where(Customer.id.in_(ids))).all()
+    names: List[str] = [row[0] for row in rows]
+    return {
+        "first 3 letters": [name[:3] for name in names],
+        "last name": [name.split()[-1] for name in names],
+        "full name": names,
+        "email local part": [row[1].split("@")[0] for row in rows],
+        "no match": ["qxzvw"],
+    }
+
+
+def check_best_match(db: Session, service: CustomerService, terms: List[str]) -> int:
+    """
+    Compare the first result of ``search_customers`` with the best match
+    found by ranking every match, for the terms with more than
+    ``CHECK_MIN_MATCHES`` matches. Ties are compared by rank. Returns the
+    number of terms checked.
+    """
+    checked: int = 0
+    for term in dict.fromkeys(terms):
+        pattern: str = contains_pattern(term)
+        matches = or_(
+            Customer.full_name.ilike(pattern, escape="\\"),
+            Customer.email.ilike(pattern, escape="\\")
+        )
+        count: int = db.execute(select(func.count()).where(matches)).scalar() or 0
+        if count <= CHECK_MIN_MATCHES:
+            continue
+        rank = func.greatest(
+            func.word_similarity(term, Customer.full_name),
+            func.word_similarity(term, Customer.email)
+        )
+        best: float = db.execute(select(func.max(rank)).where(matches)).scalar()
+        found: List[Customer] = service.search_customers(term)
+        top: float = db.execute(select(rank).where(Customer.id == found[0].id)).scalar() if found else -1.0
+        if top < best:
+            raise SystemExit(
+                f"search_customers({term!r}) ranked {top:.3f} first, but a match ranks {best:.3f} "
+                f"({count:,} matches)"
+            )
+        checked += 1
+    return checked
+
+
+def legacy_search(db: Session, query: str) -> List[Customer]:
+    """The search as it was before ranking: every row containing ``query``, unordered."""
+    pattern: str = f"%{query}%"
+    stmt = select(Customer).where(or_(Customer.full_name.ilike(pattern), Customer.email.ilike(pattern)))
+    return list(db.execute(stmt).scalars().all())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Customer search latency with and without the trigram indexes.")
+    parser.add_argument("--customers", type=int, default=0, help="top dim_customers up to this many rows first")
+    parser.add_argument("--repeat", type=int, default=REPEAT, help="timed searches per case")
+    parser.add_argument("--seed", type=int, default=0, help="seed for generated customers and sampled terms")
+    args: argparse.Namespace = parser.parse_args()
+
+    db: Session = SessionLocal()
+    try:
+        existing: List[str] = list(db.execute(
+            text("SELECT indexname FROM pg_indexes WHERE indexname = ANY(:names)"),
+            {"names": list(TRIGRAM_INDEXES)}
+        ).scalars())
+        missing: List[str] = sorted(set(TRIGRAM_INDEXES) - set(existing))
+        if missing:
+            raise SystemExit(f"Missing indexes {missing}; run 'alembic upgrade head' first")
+
+        top_up_customers(db, args.customers, args.seed)
+        total: int = db.execute(select(func.count(Customer.id))).scalar() or 0
+        queries: Dict[str, List[str]] = build_queries(db, args.seed)
+        service: CustomerService = CustomerService(db)
+        checked: int = check_best_match(db, service, [term for terms in queries.values() for term in terms])
+        print(f"   best match returned for {checked} terms with over {CHECK_MIN_MATCHES:,} matches")
+
+        def pick(kind: str, i: int) -> str:
+            return queries[kind][i % len(queries[kind])]
+
+        ranked: Dict[str, Callable[[int], object]] = {
+            kind: lambda i, kind=kind: service.search_customers(pick(kind, i)) for kind in queries
+        }
+        legacy: Dict[str, Callable[[int], object]] = {
+            kind: lambda i, kind=kind: legacy_search(db, pick(kind, i)) for kind in queries
+        }
+        after: Dict[str, Timing] = run_cases(db, ranked, args.repeat)
+        db.rollback()
+
+        for name in TRIGRAM_INDEXES:
+            db.execute(text(f"DROP INDEX {name}"))
+        before: Dict[str, Timing] = run_cases(db, legacy, args.repeat)
+        db.rollback()
+    finally:
+        db.close()
+
+    print_comparison(
+        f"search term ({total:,} customers)", "ILIKE scan", "ranked trgm",
+        [(kind, before[kind], after[kind]) for kind in queries]
+    )
+
+
+if __name__ == "__main__":
+    main()
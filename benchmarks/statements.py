@@ -0,0 +1,127 @@
+"""
+Per-call Python overhead of the hot service lookups: building the
+``select()`` on every call, as the services used to, against the
+statements prebuilt once with bind parameters.
+
+"prepare" times only building the statement and its cache key, which is
+what SQLAlchemy does before it can look up the compiled SQL; "call" times
+the whole round trip through the service method. Nothing is written.
+
+    python -m benchmarks.statements --repeat 2000
+"""
+
+import argparse
+from typing import Callable, Dict, Final, List, Tuple
+
+import numpy as np
+from sqlalchemy import Select, func, select
+from sqlalchemy.orm import Session, joinedload
+
+from app.db.base import SessionLocal
+from app.db.models import Account, DailyBalance, Transaction
+from app.core.services.account import ACCOUNT_BY_ID, AccountService
+from app.core.services.dailybalance import LATEST_BALANCE, DailyBalanceService
+from app.core.services.transaction import TRANSACTIONS_BY_ACCOUNT, TransactionService
+from benchmarks.common import Timing, measure
+
+REPEAT: Final[int] = 2_000
+
+
+def inline_acc_by_id(idx: int) -> Select:
+    return (
+        select(Account)
+        .options(
+            joinedload(Account.customer),
+            joinedload(Account.branch)
+        )
+        .where(Account.id == idx)
+    )
+
+
+def inline_by_account(account_id: int, pagination: int = 25, offset: int = 0) -> Select:
+    return (
+        select(Transaction)
+        .where(Transaction.account_id == account_id)
+        .order_by(Transaction.timestamp.desc())
+        .limit(pagination)
+        .offset(offset)
+    )
+
+
+def inline_latest_balance(account_id: int) -> Select:
+    return (
+        select(DailyBalance)
+        .where(DailyBalance.account_id == account_id)
+        .order_by(DailyBalance.balance_date.desc())
+        .limit(1)
+    )
+
+
+def build_cases(db: Session, seed: int) -> Dict[str, Tuple[Callable[[int], object], Callable[[int], object]]]:
+    """``(inline, prebuilt)`` call pairs per case, prepare-only cases first."""
+    rng: np.random.Generator = np.random.default_rng(seed)
+    max_account: int = db.execute(select(func.max(Account.id))).scalar() or 1
+    accounts: List[int] = rng.integers(1, max_account + 1, 64).tolist()
+
+    def pick(i: int) -> int:
+        return accounts[i % len(accounts)]
+
+    accounts_service: AccountService = AccountService(db)
+    transactions: TransactionService = TransactionService(db)
+    balances: DailyBalanceService = DailyBalanceService(db)
+
+    return {
+        "prepare get_acc_by_id": (
+            lambda i: inline_acc_by_id(pick(i))._generate_cache_key(),
+            lambda i: ACCOUNT_BY_ID._generate_cache_key(),
+        ),
+        "prepare get_by_account": (
+            lambda i: inline_by_account(pick(i))._generate_cache_key(),
+            lambda i: TRANSACTIONS_BY_ACCOUNT._generate_cache_key(),
+        ),
+        "prepare get_latest_balance": (
+            lambda i: inline_latest_balance(pick(i))._generate_cache_key(),
+            lambda i: LATEST_BALANCE._generate_cache_key(),
+        ),
+        "call accounts.get_acc_by_id": (
+            lambda i: db.execute(inline_acc_by_id(pick(i))).scalar_one_or_none(),
+            lambda i: accounts_service.get_acc_by_id(pick(i)),
+        ),
+        "call transactions.get_by_account": (
+            lambda i: db.execute(inline_by_account(pick(i))).scalars().all(),
+            lambda i: transactions.get_by_account(pick(i)),
+        ),
+        "call balances.get_latest_balance": (
+            lambda i: db.execute(inline_latest_balance(pick(i))).scalar_one_or_none(),
+            lambda i: balances.get_latest_balance(pick(i)),
+        ),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Per-call overhead of inline against prebuilt statements.")
+    parser.add_argument("--repeat", type=int, default=REPEAT, help="timed calls per case")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the sampled account ids")
+    args: argparse.Namespace = parser.parse_args()
+
+    db: Session = SessionLocal()
+    try:
+        cases = build_cases(db, args.seed)
+        timings: Dict[str, Tuple[Timing, Timing]] = {
+            name: (measure(inline, args.repeat, warmup=50), measure(prebuilt, args.repeat, warmup=50))
+            for name, (inline, prebuilt) in cases.items()
+        }
+    finally:
+        db.close()
+
+    width: int = max(len(name) for name in timings)
+    print(f"\n{'case':<{width}}  {'inline mean':>14}  {'prebuilt mean':>14}  {'saved':>12}")
+    for name, (inline, prebuilt) in timings.items():
+        print(
+            f"{name:<{width}}  {inline.mean * 1000:11.1f} us  {prebuilt.mean * 1000:11.1f} us  "
+            f"{(inline.mean - prebuilt.mean) * 1000:9.1f} us"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,28 @@
+import argparse
+from app.db.base import engine
+from app.db.clustering import CORRELATION_THRESHOLD, cluster_by_time
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="CLUSTER fact tables and partitions whose rows drifted out of time order.")
+    parser.add_argument("--threshold", type=float, default=CORRELATION_THRESHOLD,
+                        help="cluster tables whose time-column correlation is below this")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="only list the tables that would be clustered")
+    return parser.parse_args()
+
+def run(args: argparse.Namespace):
+    conn = engine.raw_connection()
+    try:
+        clustered = cluster_by_time(conn, args.threshold, args.dry_run)
+        verb = "Would cluster" if args.dry_run else "Clustered"
+        print(f"🧹 {verb} {len(clustered)} tables (correlation < {args.threshold})")
+        for table, before in clustered:
+            print(f"   {table}: correlation {before:.3f}")
+    except Exception as e:
+        conn.rollback()
+        print(f"Error during clustering: {e}")
+    finally:
+        conn.close()
+
+if __name__ == "__main__":
+    run(parse_args())
@@ -0,0 +1,52 @@
+import argparse
+import secrets
+from app.db.distributions import DISTRIBUTIONS, DistributionParams, get_distribution
+from app.db.loadgen import run_load, VIA_BATCH, VIA_SERVICE
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Post a continuous stream of transactions for live-load testing.")
+    parser.add_argument("--rate", type=float, default=1_000,
+                        help="target transactions per second across all writers")
+    parser.add_argument("--writers", type=int, default=4,
+                        help="writer processes, one database connection each")
+    parser.add_argument("--duration", type=float, default=60,
+                        help="seconds to keep posting")
+    parser.add_argument("--via", choices=[VIA_BATCH, VIA_SERVICE], default=VIA_BATCH,
+                        help="batch: multi-row INSERT per commit; service: TransactionService.create_transaction")
+    parser.add_argument("--batch-size", type=int, default=100,
+                        help="transactions per commit in batch mode")
+    parser.add_argument("--distribution", choices=list(DISTRIBUTIONS), default="skewed",
+                        help="account activity and amount distribution, as in the seeder")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="random seed for the generated transactions")
+    parser.add_argument("--report-every", type=float, default=5,
+                        help="seconds between progress lines")
+    args: argparse.Namespace = parser.parse_args()
+    if args.rate <= 0 or args.writers < 1 or args.batch_size < 1:
+        parser.error("--rate, --writers and --batch-size must be positive")
+    return args
+
+def run(args: argparse.Namespace):
+    distribution: DistributionParams = get_distribution(args.distribution)
+    seed: int = args.seed if args.seed is not None else secrets.randbelow(2**31)
+
+    print(
+        f"🔥 Posting {args.rate:,.0f} tx/sec via {args.via} across {args.writers} writers "
+        f"for {args.duration:.0f}s ({distribution.name}, seed {seed})..."
+    )
+    try:
+        run_load(
+            rate=args.rate,
+            writers=args.writers,
+            duration=args.duration,
+            batch_size=args.batch_size,
+            via=args.via,
+            distribution=distribution,
+            seed=seed,
+            report_every=args.report_every
+        )
+    except Exception as e:
+        print(f"Error during load generation: {e}")
+
+if __name__ == "__main__":
+    run(parse_args())
@@ -0,0 +1,36 @@
+import argparse
+from datetime import date
+from app.db.base import engine
+from app.db.partitions import MONTHS_AHEAD, is_partitioned, maintain_partitions
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Create upcoming fact_transactions partitions and detach old ones.")
+    parser.add_argument("--months-ahead", type=int, default=MONTHS_AHEAD,
+                        help="create partitions through this many months after the current one")
+    parser.add_argument("--retain-months", type=int, default=None,
+                        help="detach partitions that ended more than this many months before the current one")
+    parser.add_argument("--today", type=date.fromisoformat, default=None,
+                        help="reference date, YYYY-MM-DD (default: today)")
+    return parser.parse_args()
+
+def run(args: argparse.Namespace):
+    conn = engine.raw_connection()
+    try:
+        cursor = conn.cursor()
+        if not is_partitioned(cursor):
+            print("fact_transactions is not partitioned; run 'alembic upgrade head' first.")
+            return
+        created, detached = maintain_partitions(
+            cursor, args.today or date.today(), args.months_ahead, args.retain_months
+        )
+        conn.commit()
+        print(f"🗓 Created {len(created)} partitions: {', '.join(created) or '-'}")
+        print(f"📤 Detached {len(detached)} partitions: {', '.join(detached) or '-'}")
+    except Exception as e:
+        conn.rollback()
+        print(f"Error during partition maintenance: {e}")
+    finally:
+        conn.close()
+
+if __name__ == "__main__":
+    run(parse_args())
@@ -4,9 +4,10 @@ from alembic import context
 
 from app.db.base import Base
 from app.core.config import settings
+from app.db.partitions import PARTITION_NAME, DEFAULT_PARTITION
 
 from app.db.models import (
-    Customer, Branch, Account, Transaction, DailyBalance, DateDim 
+    Customer, Branch, Account, Transaction, DailyBalance, DateDim, SeedCheckpoint
 )
 
 config = context.config
@@ -21,12 +22,19 @@ if config.config_file_name is not None:
 # This allows 'autogenerate' to compare your models to the database
 target_metadata = Base.metadata
 
+# Monthly partitions are managed by app/db/partitions.py, not by the models
+def include_name(name, type_, parent_names) -> bool:
+    if type_ == "table":
+        return not (PARTITION_NAME.match(name) or name == DEFAULT_PARTITION)
+    return True
+
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode."""
     url = config.get_main_option("sqlalchemy.url")
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_name=include_name,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -49,6 +57,7 @@ def run_migrations_online() -> None:
         context.configure(
             connection=connection, 
             target_metadata=target_metadata,
+            include_name=include_name,
             # This ensures that schema changes are detected correctly
             compare_type=True 
         )
@@ -0,0 +1,49 @@
+"""Store money as integer cents
+
+Revision ID: 270d8aacf633
+Revises: 0e1db4a54bf4
+Create Date: 2026-10-17 01:05:36.740043
+
+Converts fact_transactions.amount, fact_daily_balances.ending_balance and
+fact_category_daily.total from double precision to BIGINT cents. Every
+table and the indexes that include these columns are rewritten, so run
+this in a maintenance window on a large database.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '270d8aacf633'
+down_revision: Union[str, Sequence[str], None] = '0e1db4a54bf4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+MONEY_COLUMNS = (
+    ('fact_transactions', 'amount'),
+    ('fact_daily_balances', 'ending_balance'),
+    ('fact_category_daily', 'total'),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, column in MONEY_COLUMNS:
+        op.alter_column(table, column,
+                   existing_type=sa.DOUBLE_PRECISION(precision=53),
+                   type_=sa.BigInteger(),
+                   existing_nullable=False,
+                   postgresql_using=f'round({column} * 100)::bigint')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, column in MONEY_COLUMNS:
+        op.alter_column(table, column,
+                   existing_type=sa.BigInteger(),
+                   type_=sa.DOUBLE_PRECISION(precision=53),
+                   existing_nullable=False,
+                   postgresql_using=f'{column} / 100.0')
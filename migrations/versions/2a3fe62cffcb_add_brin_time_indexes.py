@@ -0,0 +1,55 @@
+"""Add BRIN time indexes
+
+Revision ID: 2a3fe62cffcb
+Revises: 9a85995ba7e0
+Create Date: 2026-10-17 00:52:28.884096
+
+"""
+from typing import List, Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2a3fe62cffcb'
+down_revision: Union[str, Sequence[str], None] = '9a85995ba7e0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# autosummarize lets autovacuum summarize ranges appended after the last VACUUM.
+BRIN_OPTIONS = "pages_per_range = 32, autosummarize = on"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    bind = op.get_bind()
+    partitions: List[str] = list(bind.execute(sa.text(
+        "SELECT inhrelid::regclass::text FROM pg_inherits WHERE inhparent = 'fact_transactions'::regclass"
+    )).scalars())
+
+    # A partitioned index cannot be built concurrently: create it on the parent only,
+    # build each partition's index concurrently and attach it, so writers never block.
+    op.execute(
+        "CREATE INDEX brin_fact_transactions_timestamp ON ONLY fact_transactions "
+        f"USING brin (timestamp) WITH ({BRIN_OPTIONS})"
+    )
+    with op.get_context().autocommit_block():
+        for partition in partitions:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {partition}_brin_timestamp ON {partition} "
+                f"USING brin (timestamp) WITH ({BRIN_OPTIONS})"
+            )
+            op.execute(f"ALTER INDEX brin_fact_transactions_timestamp ATTACH PARTITION {partition}_brin_timestamp")
+        op.execute(
+            "CREATE INDEX CONCURRENTLY brin_fact_daily_balances_balance_date ON fact_daily_balances "
+            f"USING brin (balance_date) WITH ({BRIN_OPTIONS})"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('brin_fact_transactions_timestamp', table_name='fact_transactions')
+    with op.get_context().autocommit_block():
+        op.drop_index('brin_fact_daily_balances_balance_date', table_name='fact_daily_balances', postgresql_concurrently=True)
@@ -0,0 +1,37 @@
+"""Add trigram indexes for customer search
+
+Revision ID: 5313e26196c9
+Revises: 7588b04de541
+Create Date: 2026-10-17 01:22:03.151802
+
+Needs the pg_trgm extension, which ships with the PostgreSQL contrib
+package; creating it requires CREATE privilege on the database.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5313e26196c9'
+down_revision: Union[str, Sequence[str], None] = '7588b04de541'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    with op.get_context().autocommit_block():
+        op.create_index('ix_dim_customers_email_trgm', 'dim_customers', ['email'], unique=False, postgresql_using='gin', postgresql_ops={'email': 'gin_trgm_ops'}, postgresql_concurrently=True)
+        op.create_index('ix_dim_customers_full_name_trgm', 'dim_customers', ['full_name'], unique=False, postgresql_using='gin', postgresql_ops={'full_name': 'gin_trgm_ops'}, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # The extension is left installed; other objects may have come to depend on it.
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_dim_customers_full_name_trgm', table_name='dim_customers', postgresql_concurrently=True)
+        op.drop_index('ix_dim_customers_email_trgm', table_name='dim_customers', postgresql_concurrently=True)
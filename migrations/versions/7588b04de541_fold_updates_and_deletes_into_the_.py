@@ -0,0 +1,105 @@
+"""Fold updates and deletes into the category rollup
+
+Revision ID: 7588b04de541
+Revises: 270d8aacf633
+Create Date: 2026-10-17 01:20:10.636599
+
+The rollup trigger from 0e1db4a54bf4 only handled INSERT. It now also
+subtracts deleted rows and applies the old and new side of updates, and
+removes rollup rows whose count drops to zero.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7588b04de541'
+down_revision: Union[str, Sequence[str], None] = '270d8aacf633'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Each event gets its own trigger, since a transition table belongs to one
+# event; the shared function picks its rows with dynamic SQL on TG_OP.
+# Deltas are aggregated and sorted before the upsert, so concurrent writers
+# lock rollup rows in the same order.
+APPLY_FUNCTION = """
+CREATE OR REPLACE FUNCTION fact_category_daily_apply() RETURNS trigger
+LANGUAGE plpgsql AS $$
+DECLARE
+    changes text := CASE TG_OP
+        WHEN 'INSERT' THEN 'SELECT timestamp, account_id, category, amount, 1 AS sign FROM new_rows'
+        WHEN 'DELETE' THEN 'SELECT timestamp, account_id, category, amount, -1 AS sign FROM old_rows'
+        ELSE 'SELECT timestamp, account_id, category, amount, 1 AS sign FROM new_rows '
+             'UNION ALL SELECT timestamp, account_id, category, amount, -1 FROM old_rows'
+    END;
+BEGIN
+    IF current_setting('hd.skip_category_rollup', true) = 'on' THEN
+        RETURN NULL;
+    END IF;
+    EXECUTE format($sql$
+        INSERT INTO fact_category_daily AS r (day, branch_id, category, tx_count, total)
+        SELECT c.timestamp::date, a.branch_id, c.category, sum(c.sign), sum(c.sign * c.amount)
+        FROM (%s) AS c
+        JOIN dim_accounts AS a ON a.id = c.account_id
+        GROUP BY 1, 2, 3
+        ORDER BY 1, 2, 3
+        ON CONFLICT (day, branch_id, category) DO UPDATE
+        SET tx_count = r.tx_count + EXCLUDED.tx_count,
+            total = r.total + EXCLUDED.total
+    $sql$, changes);
+    IF TG_OP <> 'INSERT' THEN
+        DELETE FROM fact_category_daily WHERE tx_count = 0;
+    END IF;
+    RETURN NULL;
+END
+$$
+"""
+
+INSERT_ONLY_FUNCTION = """
+CREATE OR REPLACE FUNCTION fact_category_daily_apply() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF current_setting('hd.skip_category_rollup', true) = 'on' THEN
+        RETURN NULL;
+    END IF;
+    INSERT INTO fact_category_daily AS r (day, branch_id, category, tx_count, total)
+    SELECT n.timestamp::date, a.branch_id, n.category, count(*), sum(n.amount)
+    FROM new_rows AS n
+    JOIN dim_accounts AS a ON a.id = n.account_id
+    GROUP BY 1, 2, 3
+    ORDER BY 1, 2, 3
+    ON CONFLICT (day, branch_id, category) DO UPDATE
+    SET tx_count = r.tx_count + EXCLUDED.tx_count,
+        total = r.total + EXCLUDED.total;
+    RETURN NULL;
+END
+$$
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(APPLY_FUNCTION)
+    op.execute("""
+        CREATE TRIGGER fact_category_daily_apply_update
+        AFTER UPDATE ON fact_transactions
+        REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION fact_category_daily_apply()
+    """)
+    op.execute("""
+        CREATE TRIGGER fact_category_daily_apply_delete
+        AFTER DELETE ON fact_transactions
+        REFERENCING OLD TABLE AS old_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION fact_category_daily_apply()
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER fact_category_daily_apply_delete ON fact_transactions")
+    op.execute("DROP TRIGGER fact_category_daily_apply_update ON fact_transactions")
+    op.execute(INSERT_ONLY_FUNCTION)
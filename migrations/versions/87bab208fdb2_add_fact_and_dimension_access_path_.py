@@ -0,0 +1,43 @@
+"""Add fact and dimension access path indexes
+
+Revision ID: 87bab208fdb2
+Revises: f45618abadee
+Create Date: 2026-10-17 00:43:41.625340
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '87bab208fdb2'
+down_revision: Union[str, Sequence[str], None] = 'f45618abadee'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction and does not block writers.
+    with op.get_context().autocommit_block():
+        op.create_index('ix_dim_accounts_branch_id', 'dim_accounts', ['branch_id'], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_dim_accounts_customer_id', 'dim_accounts', ['customer_id'], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_dim_customers_credit_score', 'dim_customers', ['credit_score'], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_fact_daily_balances_account_id_balance_date', 'fact_daily_balances', ['account_id', 'balance_date'], unique=False, postgresql_include=['ending_balance'], postgresql_concurrently=True)
+        op.create_index('ix_fact_daily_balances_balance_date', 'fact_daily_balances', ['balance_date'], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_fact_transactions_account_id_timestamp', 'fact_transactions', ['account_id', 'timestamp'], unique=False, postgresql_include=['amount', 'category'], postgresql_concurrently=True)
+        op.create_index('ix_fact_transactions_timestamp', 'fact_transactions', ['timestamp'], unique=False, postgresql_include=['category', 'amount'], postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_fact_transactions_timestamp', table_name='fact_transactions', postgresql_concurrently=True)
+        op.drop_index('ix_fact_transactions_account_id_timestamp', table_name='fact_transactions', postgresql_concurrently=True)
+        op.drop_index('ix_fact_daily_balances_balance_date', table_name='fact_daily_balances', postgresql_concurrently=True)
+        op.drop_index('ix_fact_daily_balances_account_id_balance_date', table_name='fact_daily_balances', postgresql_concurrently=True)
+        op.drop_index('ix_dim_customers_credit_score', table_name='dim_customers', postgresql_concurrently=True)
+        op.drop_index('ix_dim_accounts_customer_id', table_name='dim_accounts', postgresql_concurrently=True)
+        op.drop_index('ix_dim_accounts_branch_id', table_name='dim_accounts', postgresql_concurrently=True)
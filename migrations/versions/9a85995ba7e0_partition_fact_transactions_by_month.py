@@ -0,0 +1,105 @@
+"""Partition fact_transactions by month
+
+Revision ID: 9a85995ba7e0
+Revises: 87bab208fdb2
+Create Date: 2026-10-17 00:52:07.318874
+
+Rebuilds fact_transactions as a table range-partitioned on timestamp, with
+one partition per month of existing data through three months ahead and a
+DEFAULT partition. Existing rows are copied across, so on a large table run
+this in a maintenance window. The primary key becomes (id, timestamp), as
+PostgreSQL requires the partition key in every unique constraint.
+
+"""
+from datetime import date, datetime
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9a85995ba7e0'
+down_revision: Union[str, Sequence[str], None] = '87bab208fdb2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLUMNS = "id, account_id, amount, category, merchant_name, timestamp"
+MONTHS_AHEAD = 3
+
+
+def _add_months(day: date, months: int) -> date:
+    index: int = day.year * 12 + day.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _create_indexes() -> None:
+    op.create_index('ix_fact_transactions_account_id_timestamp', 'fact_transactions', ['account_id', 'timestamp'], unique=False, postgresql_include=['amount', 'category'])
+    op.create_index('ix_fact_transactions_timestamp', 'fact_transactions', ['timestamp'], unique=False, postgresql_include=['category', 'amount'])
+
+
+def _detach_legacy_table() -> None:
+    op.execute("ALTER TABLE fact_transactions RENAME TO fact_transactions_legacy")
+    op.execute("ALTER INDEX fact_transactions_pkey RENAME TO fact_transactions_legacy_pkey")
+    op.execute("ALTER SEQUENCE fact_transactions_id_seq OWNED BY NONE")
+    op.drop_index('ix_fact_transactions_account_id_timestamp', table_name='fact_transactions_legacy')
+    op.drop_index('ix_fact_transactions_timestamp', table_name='fact_transactions_legacy')
+
+
+def _adopt_sequence_and_drop_legacy() -> None:
+    op.execute("ALTER SEQUENCE fact_transactions_id_seq OWNED BY fact_transactions.id")
+    op.drop_table('fact_transactions_legacy')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _detach_legacy_table()
+    op.execute("""
+        CREATE TABLE fact_transactions (
+            id BIGINT NOT NULL DEFAULT nextval('fact_transactions_id_seq'),
+            account_id INTEGER NOT NULL,
+            amount DOUBLE PRECISION NOT NULL,
+            category VARCHAR(100) NOT NULL,
+            merchant_name VARCHAR(255),
+            timestamp TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+            CONSTRAINT fact_transactions_pkey PRIMARY KEY (id, timestamp),
+            CONSTRAINT fact_transactions_account_id_fkey FOREIGN KEY (account_id) REFERENCES dim_accounts (id)
+        ) PARTITION BY RANGE (timestamp)
+    """)
+
+    bind = op.get_bind()
+    oldest: datetime = bind.execute(sa.text("SELECT min(timestamp) FROM fact_transactions_legacy")).scalar()
+    newest: datetime = bind.execute(sa.text("SELECT max(timestamp) FROM fact_transactions_legacy")).scalar()
+    today: date = date.today()
+    month: date = (oldest.date() if oldest else today).replace(day=1)
+    last: date = _add_months(max(newest.date() if newest else today, today).replace(day=1), MONTHS_AHEAD)
+    while month <= last:
+        op.execute(
+            f"CREATE TABLE fact_transactions_p{month.year:04d}_{month.month:02d} PARTITION OF fact_transactions "
+            f"FOR VALUES FROM ('{month.isoformat()}') TO ('{_add_months(month, 1).isoformat()}')"
+        )
+        month = _add_months(month, 1)
+    op.execute("CREATE TABLE fact_transactions_default PARTITION OF fact_transactions DEFAULT")
+
+    op.execute(f"INSERT INTO fact_transactions ({COLUMNS}) SELECT {COLUMNS} FROM fact_transactions_legacy")
+    _adopt_sequence_and_drop_legacy()
+    _create_indexes()
+    op.execute("ANALYZE fact_transactions")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _detach_legacy_table()
+    op.create_table('fact_transactions',
+    sa.Column('id', sa.BigInteger(), server_default=sa.text("nextval('fact_transactions_id_seq')"), nullable=False),
+    sa.Column('account_id', sa.Integer(), nullable=False),
+    sa.Column('amount', sa.Float(), nullable=False),
+    sa.Column('category', sa.String(length=100), nullable=False),
+    sa.Column('merchant_name', sa.String(length=255), nullable=True),
+    sa.Column('timestamp', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['account_id'], ['dim_accounts.id'], name='fact_transactions_account_id_fkey'),
+    sa.PrimaryKeyConstraint('id', name='fact_transactions_pkey')
+    )
+    op.execute(f"INSERT INTO fact_transactions ({COLUMNS}) SELECT {COLUMNS} FROM fact_transactions_legacy")
+    _adopt_sequence_and_drop_legacy()
+    _create_indexes()
@@ -0,0 +1,119 @@
+"""Scope rollup cleanup to touched keys
+
+Revision ID: a04d7340b6fb
+Revises: 5313e26196c9
+Create Date: 2026-10-17 02:10:41.118204
+
+After an UPDATE or DELETE on fact_transactions, the rollup trigger from
+7588b04de541 deleted every fact_category_daily row with a zero count,
+scanning the whole rollup table for each statement. Only the keys of the
+old rows can have dropped to zero, so the cleanup is now restricted to
+those (day, branch_id, category) keys.
+
+Single-row writers still serialize on the rollup rows of the current
+day: every transaction posted for a branch and category updates the same
+row, and a concurrent writer posting to that row waits for the first to
+commit. See app/db/rollups.py.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a04d7340b6fb'
+down_revision: Union[str, Sequence[str], None] = '5313e26196c9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Deltas are aggregated per statement and sorted before the upsert, so a
+# batch takes each rollup row lock once and concurrent writers take them in
+# the same order; rows of the same key still wait for each other's commit.
+APPLY_FUNCTION = """
+CREATE OR REPLACE FUNCTION fact_category_daily_apply() RETURNS trigger
+LANGUAGE plpgsql AS $$
+DECLARE
+    changes text := CASE TG_OP
+        WHEN 'INSERT' THEN 'SELECT timestamp, account_id, category, amount, 1 AS sign FROM new_rows'
+        WHEN 'DELETE' THEN 'SELECT timestamp, account_id, category, amount, -1 AS sign FROM old_rows'
+        ELSE 'SELECT timestamp, account_id, category, amount, 1 AS sign FROM new_rows '
+             'UNION ALL SELECT timestamp, account_id, category, amount, -1 FROM old_rows'
+    END;
+BEGIN
+    IF current_setting('hd.skip_category_rollup', true) = 'on' THEN
+        RETURN NULL;
+    END IF;
+    EXECUTE format($sql$
+        INSERT INTO fact_category_daily AS r (day, branch_id, category, tx_count, total)
+        SELECT c.timestamp::date, a.branch_id, c.category, sum(c.sign), sum(c.sign * c.amount)
+        FROM (%s) AS c
+        JOIN dim_accounts AS a ON a.id = c.account_id
+        GROUP BY 1, 2, 3
+        ORDER BY 1, 2, 3
+        ON CONFLICT (day, branch_id, category) DO UPDATE
+        SET tx_count = r.tx_count + EXCLUDED.tx_count,
+            total = r.total + EXCLUDED.total
+    $sql$, changes);
+    IF TG_OP <> 'INSERT' THEN
+        -- Only keys that lost rows can have dropped to zero.
+        DELETE FROM fact_category_daily AS r
+        USING (
+            SELECT DISTINCT o.timestamp::date AS day, a.branch_id, o.category
+            FROM old_rows AS o
+            JOIN dim_accounts AS a ON a.id = o.account_id
+        ) AS k
+        WHERE r.day = k.day
+          AND r.branch_id = k.branch_id
+          AND r.category = k.category
+          AND r.tx_count = 0;
+    END IF;
+    RETURN NULL;
+END
+$$
+"""
+
+UNSCOPED_FUNCTION = """
+CREATE OR REPLACE FUNCTION fact_category_daily_apply() RETURNS trigger
+LANGUAGE plpgsql AS $$
+DECLARE
+    changes text := CASE TG_OP
+        WHEN 'INSERT' THEN 'SELECT timestamp, account_id, category, amount, 1 AS sign FROM new_rows'
+        WHEN 'DELETE' THEN 'SELECT timestamp, account_id, category, amount, -1 AS sign FROM old_rows'
+        ELSE 'SELECT timestamp, account_id, category, amount, 1 AS sign FROM new_rows '
+             'UNION ALL SELECT timestamp, account_id, category, amount, -1 FROM old_rows'
+    END;
+BEGIN
+    IF current_setting('hd.skip_category_rollup', true) = 'on' THEN
+        RETURN NULL;
+    END IF;
+    EXECUTE format($sql$
+        INSERT INTO fact_category_daily AS r (day, branch_id, category, tx_count, total)
+        SELECT c.timestamp::date, a.branch_id, c.category, sum(c.sign), sum(c.sign * c.amount)
+        FROM (%s) AS c
+        JOIN dim_accounts AS a ON a.id = c.account_id
+        GROUP BY 1, 2, 3
+        ORDER BY 1, 2, 3
+        ON CONFLICT (day, branch_id, category) DO UPDATE
+        SET tx_count = r.tx_count + EXCLUDED.tx_count,
+            total = r.total + EXCLUDED.total
+    $sql$, changes);
+    IF TG_OP <> 'INSERT' THEN
+        DELETE FROM fact_category_daily WHERE tx_count = 0;
+    END IF;
+    RETURN NULL;
+END
+$$
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(APPLY_FUNCTION)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(UNSCOPED_FUNCTION)
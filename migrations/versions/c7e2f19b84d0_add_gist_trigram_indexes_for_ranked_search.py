@@ -0,0 +1,37 @@
+"""Add GiST trigram indexes for ranked customer search
+
+Revision ID: c7e2f19b84d0
+Revises: a04d7340b6fb
+Create Date: 2026-10-17 02:31:07.402916
+
+The GIN trigram indexes from 5313e26196c9 find the customers matching a
+search term but return them in no particular order. GiST trigram indexes
+return rows by word-similarity distance (``<->>``), so the best matches
+can be read first without ranking every match.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7e2f19b84d0'
+down_revision: Union[str, Sequence[str], None] = 'a04d7340b6fb'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index('ix_dim_customers_full_name_trgm_gist', 'dim_customers', ['full_name'], unique=False, postgresql_using='gist', postgresql_ops={'full_name': 'gist_trgm_ops'}, postgresql_concurrently=True)
+        op.create_index('ix_dim_customers_email_trgm_gist', 'dim_customers', ['email'], unique=False, postgresql_using='gist', postgresql_ops={'email': 'gist_trgm_ops'}, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_dim_customers_email_trgm_gist', table_name='dim_customers', postgresql_concurrently=True)
+        op.drop_index('ix_dim_customers_full_name_trgm_gist', table_name='dim_customers', postgresql_concurrently=True)
@@ -1,25 +1,112 @@
 import sys
+import argparse
+import secrets
+from datetime import date
 from sqlalchemy.orm import Session
 from app.db.base import SessionLocal
+from app.db.profiles import PROFILES, SeedProfile, get_profile
+from app.db.distributions import DISTRIBUTIONS, DistributionParams, get_distribution
 from app.db.seeders import seed_date_dimension, seed_banking_system
+from app.db.bulk import seed_banking_system_copy, CHUNK_ROWS
+from app.db.sqlgen import seed_banking_system_sql
+from app.db.snapshot import write_snapshot, restore_snapshot
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Populate the banking warehouse with synthetic data.")
+    parser.add_argument("--mode", choices=["orm", "copy", "sql"], default="orm",
+                        help="orm: row-by-row ORM inserts; copy: vectorized COPY streaming; "
+                             "sql: set-based generation inside PostgreSQL")
+    parser.add_argument("--profile", choices=list(PROFILES), default="demo",
+                        help="dataset scale-factor profile")
+    parser.add_argument("--distribution", choices=list(DISTRIBUTIONS), default="uniform",
+                        help="copy/sql mode: uniform noise or skewed, production-like activity")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="random seed; the same profile, seed and end date give identical data")
+    parser.add_argument("--end-date", type=date.fromisoformat, default=None,
+                        help="last day of generated history, YYYY-MM-DD (default: today)")
+    parser.add_argument("--chunk-rows", type=int, default=CHUNK_ROWS,
+                        help="rows per COPY chunk (copy mode) or per INSERT batch (sql mode)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="worker processes for copy mode, one connection each")
+    parser.add_argument("--resume", action="store_true",
+                        help="copy mode: continue an interrupted run from its last checkpoint; "
+                             "pass the same profile, distribution, seed and end date")
+    parser.add_argument("--snapshot", metavar="DIR", default=None,
+                        help="after seeding, write every table to DIR as Parquet files")
+    parser.add_argument("--restore", metavar="DIR", default=None,
+                        help="instead of generating data, bulk-load a Parquet snapshot from DIR into an empty schema")
+    args: argparse.Namespace = parser.parse_args()
+    if args.resume and args.mode != "copy":
+        parser.error("--resume is only supported with --mode copy")
+    if args.resume and (args.seed is None or args.end_date is None):
+        parser.error("--resume needs the --seed and --end-date of the interrupted run")
+    return args
+
+def run_seed(args: argparse.Namespace):
+    profile: SeedProfile = get_profile(args.profile)
+    distribution: DistributionParams = get_distribution(args.distribution)
+    seed: int = args.seed if args.seed is not None else secrets.randbelow(2**31)
+    end_date: date = args.end_date or date.today()
+    reproduce: str = (
+        f"--mode {args.mode} --profile {profile.name} "
+        f"--distribution {distribution.name} --seed {seed} --end-date {end_date}"
+    )
 
-def run_seed():
     print("🚀 Connecting to Database...")
     db: Session = SessionLocal()
     try:
-        print("📅 Seeding Date Dimension...")
-        seed_date_dimension(db)
-        
-        print("🏦 Seeding Banking System (Customers, Accounts, Transactions)...")
-        seed_banking_system(db)
-        
+        if args.restore:
+            print(f"📦 Restoring snapshot from {args.restore}...")
+            restore_snapshot(args.restore, args.chunk_rows).report()
+            print("Snapshot restored!")
+            return
+
+        if args.mode == "sql":
+            print(f"🛢 Generating Star Schema inside PostgreSQL (profile {profile.name}, {distribution.name})...")
+            meter = seed_banking_system_sql(
+                profile=profile,
+                distribution=distribution,
+                seed=seed,
+                end_date=end_date,
+                chunk_rows=args.chunk_rows
+            )
+            meter.report()
+        elif not args.resume:
+            print("📅 Seeding Date Dimension...")
+            seed_date_dimension(db, end_date, profile.days_of_history)
+
+        if args.mode == "copy":
+            db.commit()
+            print(f"⚡ Streaming Banking System via COPY (profile {profile.name}, {distribution.name})...")
+            meter = seed_banking_system_copy(
+                profile=profile,
+                distribution=distribution,
+                seed=seed,
+                end_date=end_date,
+                chunk_rows=args.chunk_rows,
+                workers=args.workers,
+                resume=args.resume
+            )
+            meter.report()
+        elif args.mode == "orm":
+            print(f"🏦 Seeding Banking System (profile {profile.name})...")
+            seed_banking_system(db, profile=profile, seed=seed, end_date=end_date)
+
         print("Data generation complete!")
+        print(f"Reproduce with: {reproduce}")
+
+        if args.snapshot:
+            db.commit()
+            print(f"📦 Writing Parquet snapshot to {args.snapshot}...")
+            write_snapshot(args.snapshot, args.chunk_rows).report()
     except Exception as e:
         db.rollback()
         print(f"Error during seeding: {e}")
+        if args.mode == "copy":
+            print(f"Resume with: {reproduce} --resume")
     finally:
         db.close()
         print("Database connection closed.")
 
 if __name__ == "__main__":
-    run_seed()
+    run_seed(parse_args())
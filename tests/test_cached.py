@@ -0,0 +1,89 @@
+import os
+import time
+import unittest
+from typing import Any
+
+# The application settings need a database URL at import time; no
+# connection is made to it.
+for name, value in {
+    "POSTGRES_HOST": "localhost",
+    "POSTGRES_PORT": "5432",
+    "POSTGRES_DB": "test",
+    "POSTGRES_USER": "test",
+    "POSTGRES_PASSWORD": "test",
+}.items():
+    os.environ.setdefault(name, value)
+
+from sqlalchemy import create_engine
+
+from app.core.services.cached import CachedService, CachePolicy, ServiceCache
+from app.db.routing import ReplicaSet
+
+STICKY_SECONDS: float = 0.5
+
+
+class CustomerService:
+    """Stands in for the real service: counts calls, and writes by bumping the count."""
+
+    def __init__(self) -> None:
+        self.customers: int = 10
+        self.loads: int = 0
+
+    def count_all(self) -> int:
+        self.loads += 1
+        return self.customers
+
+    def create_customer(self, *args: Any) -> None:
+        self.customers += 1
+
+
+class ServiceCacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.engine = create_engine("sqlite://")
+        self.replicas = ReplicaSet([self.engine])
+        self.cache = ServiceCache(
+            {"CustomerService.count_all": CachePolicy(60, 1, frozenset({"dim_customers"}))},
+            replicas=self.replicas,
+            sticky_seconds=STICKY_SECONDS
+        )
+        self.service = CustomerService()
+        self.cached = CachedService(self.service, self.cache)
+
+    def tearDown(self) -> None:
+        self.engine.dispose()
+
+    def test_repeated_reads_are_served_from_cache(self) -> None:
+        self.assertEqual(self.cached.count_all(), 10)
+        self.assertEqual(self.cached.count_all(), 10)
+        self.assertEqual(self.service.loads, 1)
+
+    def test_write_invalidates(self) -> None:
+        self.cached.count_all()
+        self.cached.create_customer("Ada", "ada@example.com", 700)
+        self.assertEqual(self.cached.count_all(), 11)
+
+    def test_loads_in_sticky_window_are_not_stored(self) -> None:
+        self.cached.count_all()
+        # A committed write marks the replica set, then the wrapper invalidates.
+        self.replicas.mark_write()
+        self.cached.create_customer("Ada", "ada@example.com", 700)
+        self.cached.count_all()
+        self.cached.count_all()
+        self.assertEqual(self.service.loads, 3)
+
+        time.sleep(STICKY_SECONDS + 0.1)
+        self.cached.count_all()
+        self.cached.count_all()
+        self.assertEqual(self.service.loads, 4)
+
+    def test_sticky_window_ignored_without_replicas(self) -> None:
+        cache = ServiceCache(self.cache.policies, replicas=ReplicaSet([]), sticky_seconds=STICKY_SECONDS)
+        cached = CachedService(self.service, cache)
+        cache.replicas.mark_write()
+        cached.count_all()
+        cached.count_all()
+        self.assertEqual(self.service.loads, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
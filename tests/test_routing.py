@@ -0,0 +1,104 @@
+import os
+import tempfile
+import time
+import unittest
+from typing import Any
+
+# The application settings need a database URL at import time; no
+# connection is made to it, every session here is bound to SQLite files.
+for name, value in {
+    "POSTGRES_HOST": "localhost",
+    "POSTGRES_PORT": "5432",
+    "POSTGRES_DB": "test",
+    "POSTGRES_USER": "test",
+    "POSTGRES_PASSWORD": "test",
+}.items():
+    os.environ.setdefault(name, value)
+
+from sqlalchemy import create_engine, select, text, column, table
+from sqlalchemy.orm import sessionmaker
+
+from app.core.services import readonly
+from app.core.services.readonly import ReadOnlyService
+from app.db.routing import ReplicaSet, RoutingSession
+
+STICKY_SECONDS: float = 0.5
+
+
+class ProbeService:
+    """Reads the name of the database it is routed to, writes a row."""
+
+    def __init__(self, db: Any) -> None:
+        self.db = db
+
+    def origin(self) -> str:
+        return self.db.execute(select(column("name")).select_from(table("origin"))).scalar_one()
+
+    def post(self) -> None:
+        self.db.execute(text("INSERT INTO probe VALUES (1)"))
+        self.db.commit()
+
+
+class ReadYourWritesTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        engines = {}
+        for name in ("primary", "replica"):
+            engine = create_engine(f"sqlite:///{self.tmp.name}/{name}.db")
+            with engine.begin() as conn:
+                conn.execute(text("CREATE TABLE origin (name TEXT)"))
+                conn.execute(text("INSERT INTO origin VALUES (:name)"), {"name": name})
+                conn.execute(text("CREATE TABLE probe (x INTEGER)"))
+            engines[name] = engine
+        self.engines = engines
+        self.replicas = ReplicaSet([engines["replica"]])
+        self.session_factory = sessionmaker(
+            class_=RoutingSession,
+            bind=engines["primary"],
+            replicas=self.replicas,
+            sticky_seconds=STICKY_SECONDS
+        )
+        # ReadOnlyService opens its sessions from the module's SessionLocal.
+        self.saved_session_local = readonly.SessionLocal
+        readonly.SessionLocal = self.session_factory
+        self.reads = ReadOnlyService(ProbeService)
+
+    def tearDown(self) -> None:
+        readonly.SessionLocal = self.saved_session_local
+        for engine in self.engines.values():
+            engine.dispose()
+        self.tmp.cleanup()
+
+    def test_reads_go_to_replica_without_writes(self) -> None:
+        self.assertEqual(self.reads.origin(), "replica")
+
+    def test_read_only_service_reads_primary_after_write(self) -> None:
+        db = self.session_factory()
+        try:
+            ProbeService(db).post()
+        finally:
+            db.close()
+        self.assertEqual(self.reads.origin(), "primary")
+
+    def test_replica_again_after_sticky_window(self) -> None:
+        db = self.session_factory()
+        try:
+            ProbeService(db).post()
+        finally:
+            db.close()
+        time.sleep(STICKY_SECONDS + 0.1)
+        self.assertEqual(self.reads.origin(), "replica")
+
+    def test_uncommitted_write_does_not_pin_other_sessions(self) -> None:
+        db = self.session_factory()
+        try:
+            db.execute(text("INSERT INTO probe VALUES (1)"))
+            self.assertEqual(self.reads.origin(), "replica")
+            db.rollback()
+        finally:
+            db.close()
+        self.assertEqual(self.reads.origin(), "replica")
+
+
+if __name__ == "__main__":
+    unittest.main()